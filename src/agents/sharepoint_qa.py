@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
 import logging
+import re
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
 
 from autogen_agentchat.agents import AssistantAgent
-from autogen_agentchat.messages import TextMessage
+from autogen_agentchat.base import Response
+from autogen_agentchat.messages import ModelClientStreamingChunkEvent, TextMessage
+from autogen_core import CancellationToken
 from autogen_ext.models.openai import AzureOpenAIChatCompletionClient
 
 from src.models.document import SearchResult, SourceReference
+from src.services.cache import (
+    AnswerCache,
+    HistoryMessageCache,
+    SearchResultCache,
+    SemanticAnswerCache,
+    make_cache_key,
+    normalize_question,
+)
 from src.services.search import SearchBackend
 
 logger = logging.getLogger(__name__)
@@ -32,22 +46,80 @@ stored in SharePoint. Please ask a question related to your organization's docum
 cite all relevant sources.
 """
 
+# Refusal returned without calling the model when search finds nothing
+NO_RESULTS_MESSAGE = (
+    "I couldn't find relevant information in the available SharePoint documents "
+    "to answer your question."
+)
+
+# Limits on the document context sent to the model: distinct documents, total
+# content characters, and content characters per document
+MAX_CONTEXT_DOCUMENTS = 10
+MAX_CONTEXT_CHARS = 24000
+MAX_CONTEXT_CHARS_PER_DOCUMENT = 4000
+
+# Phrases that mark a refusal, matched case-insensitively in a single pass
+_REFUSAL_RE = re.compile(
+    r"i can only answer questions about documents stored in sharepoint"
+    r"|i couldn't find relevant information"
+    r"|not able to answer"
+    r"|cannot answer"
+    r"|outside my scope",
+    re.IGNORECASE,
+)
+# Exact refusal sentences the system prompt instructs the model to open with
+_REFUSAL_PREFIXES = (
+    "I can only answer questions about documents stored in SharePoint",
+    "I couldn't find relevant information",
+)
+
+# In-flight answer computations shared by every agent instance, keyed like the
+# answer cache so only identical questions from the same caller coalesce
+_inflight: dict[str, asyncio.Future[dict[str, Any]]] = {}
+
 
 class SharePointQAAgent:
     """Agent that answers questions grounded in SharePoint document content.
 
     Uses Azure AI Search for document retrieval and Azure OpenAI for response
     generation via the Microsoft Agent Framework (autogen-agentchat).
+
+    An optional shared ``AnswerCache`` short-circuits repeated questions and
+    an optional ``SemanticAnswerCache`` (with an ``embed`` callable) serves
+    paraphrases of them. An optional ``SearchResultCache`` reuses retrieval
+    results for repeated queries, and an optional ``HistoryMessageCache``
+    reuses converted conversation history. ``cache_scope`` namespaces every cache
+    (e.g. by search approach) so that results from different backends are
+    never mixed. ``max_context_chars`` bounds the document content sent to
+    the model per question.
+
+    Concurrent identical questions (same caller, question and history) share
+    one computation, whether asked through ``answer_question`` or
+    ``stream_answer``; a joining stream receives the answer as one delta.
     """
 
     def __init__(
         self,
         search_service: SearchBackend,
         model_client: AzureOpenAIChatCompletionClient,
+        *,
+        answer_cache: AnswerCache | None = None,
+        semantic_cache: SemanticAnswerCache | None = None,
+        embed: Callable[[str], Awaitable[list[float]]] | None = None,
+        search_cache: SearchResultCache | None = None,
+        history_cache: HistoryMessageCache | None = None,
+        cache_scope: str = "",
+        max_context_chars: int = MAX_CONTEXT_CHARS,
     ) -> None:
         self._search_service = search_service
         self._model_client = model_client
-        self._agent: AssistantAgent | None = None
+        self._answer_cache = answer_cache
+        self._semantic_cache = semantic_cache if embed is not None else None
+        self._embed = embed
+        self._search_cache = search_cache
+        self._history_cache = history_cache
+        self._cache_scope = cache_scope
+        self._max_context_chars = max_context_chars
 
     def _create_agent(self, search_context: str) -> AssistantAgent:
         """Create an AssistantAgent with search context in the system prompt."""
@@ -61,6 +133,7 @@ class SharePointQAAgent:
             name="sharepoint_qa_agent",
             model_client=self._model_client,
             system_message=system_message,
+            model_client_stream=True,
         )
 
     async def answer_question(
@@ -69,6 +142,7 @@ class SharePointQAAgent:
         user_id: str,
         group_ids: list[str],
         conversation_history: list[dict[str, str]] | None = None,
+        conversation_id: str | None = None,
     ) -> dict[str, Any]:
         """Answer a user question using SharePoint documents.
 
@@ -77,74 +151,308 @@ class SharePointQAAgent:
             user_id: Authenticated user's Entra object ID.
             group_ids: User's Entra group IDs for security trimming.
             conversation_history: Previous messages for context continuity.
+            conversation_id: Conversation the history belongs to, used to reuse
+                previously converted history messages.
 
         Returns:
             Dict with 'content' (answer text), 'source_references' (citations),
             and 'was_refused' (whether the agent refused to answer).
         """
-        # Step 1: Search for relevant documents
-        search_results = await self._search_service.search_documents(
-            query=question,
-            user_id=user_id,
-            group_ids=group_ids,
-        )
+        result: dict[str, Any] = {}
+        async for event in self.stream_answer(
+            question, user_id, group_ids, conversation_history, conversation_id
+        ):
+            if event["type"] == "answer":
+                result = event["answer"]
+        return dict(result)
+
+    async def stream_answer(
+        self,
+        question: str,
+        user_id: str,
+        group_ids: list[str],
+        conversation_history: list[dict[str, str]] | None = None,
+        conversation_id: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Answer a user question, yielding the response as it is generated.
+
+        Takes the same arguments as ``answer_question``.
+
+        Yields:
+            ``{"type": "delta", "content": str}`` for each chunk of answer text,
+            then a single ``{"type": "answer", "answer": dict}`` whose payload
+            matches the return value of ``answer_question``. Cached answers, and
+            answers shared from an identical in-flight question, are delivered
+            as one delta.
+        """
+        # Coalesce identical concurrent questions onto one in-flight computation
+        key = self._answer_key(question, user_id, group_ids, conversation_history)
+        pending = _inflight.get(key)
+        if pending is not None:
+            try:
+                answer = dict(await asyncio.shield(pending))
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The leading request was cancelled; compute the answer here
+            else:
+                yield {"type": "delta", "content": answer["content"]}
+                yield {"type": "answer", "answer": answer}
+                return
+
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        _inflight[key] = future
+        try:
+            async for event in self._generate(
+                question, user_id, group_ids, conversation_history, conversation_id
+            ):
+                if event["type"] == "answer":
+                    future.set_result(event["answer"])
+                yield event
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+                future.exception()  # Mark retrieved when nobody is waiting
+            raise
+        finally:
+            if _inflight.get(key) is future:
+                del _inflight[key]
+            if not future.done():
+                future.cancel()
+
+    async def _generate(
+        self,
+        question: str,
+        user_id: str,
+        group_ids: list[str],
+        conversation_history: list[dict[str, str]] | None = None,
+        conversation_id: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Compute an answer for ``stream_answer`` (no coalescing)."""
+        # Step 0: Serve repeated questions from the answer cache
+        cache_key = ""
+        if self._answer_cache is not None:
+            cache_key = self._answer_key(question, user_id, group_ids, conversation_history)
+            cached = self._answer_cache.get(cache_key)
+            logger.info(
+                "Answer cache %s",
+                "hit" if cached is not None else "miss",
+                extra={
+                    "user_id": user_id,
+                    "cache_hits": self._answer_cache.hits,
+                    "cache_misses": self._answer_cache.misses,
+                },
+            )
+            if cached is not None:
+                yield {"type": "delta", "content": cached["content"]}
+                yield {"type": "answer", "answer": dict(cached)}
+                return
+
+        # Step 0b: Serve paraphrased questions from the semantic cache. The
+        # search is started speculatively so it overlaps the embedding call,
+        # and cancelled if the cache answers or the request goes away first.
+        question_embedding: list[float] | None = None
+        scope_key = context_key = ""
+        search_task: asyncio.Task[list[SearchResult]] | None = None
+        try:
+            if self._semantic_cache is not None and self._embed is not None:
+                search_task = asyncio.create_task(self._search(question, user_id, group_ids))
+                scope_key = make_cache_key(self._cache_scope, user_id, sorted(group_ids))
+                # The whole history goes to the model, so it all scopes the answer
+                context_key = make_cache_key(conversation_history or [])
+                try:
+                    question_embedding = await self._embed(question)
+                except Exception:
+                    logger.warning(
+                        "Question embedding failed, skipping semantic cache", exc_info=True
+                    )
+                if question_embedding is not None:
+                    similar = self._semantic_cache.lookup(
+                        question_embedding, scope_key, context_key
+                    )
+                    if similar is not None:
+                        search_task.cancel()
+                        logger.info("Semantic cache hit", extra={"user_id": user_id})
+                        yield {"type": "delta", "content": similar["content"]}
+                        yield {"type": "answer", "answer": dict(similar)}
+                        return
+
+            # Step 1: Search for relevant documents
+            if search_task is not None:
+                search_results = await search_task
+            else:
+                search_results = await self._search(question, user_id, group_ids)
+        finally:
+            if search_task is not None and not search_task.done():
+                search_task.cancel()
+
+        # Nothing to ground an answer in: refuse without calling the model
+        if not search_results:
+            logger.info("Empty search results, skipping LLM call", extra={"user_id": user_id})
+            yield {"type": "delta", "content": NO_RESULTS_MESSAGE}
+            yield {
+                "type": "answer",
+                "answer": {
+                    "content": NO_RESULTS_MESSAGE,
+                    "source_references": [],
+                    "was_refused": True,
+                },
+            }
+            return
 
         # Step 2: Build context from search results
-        search_context = self._format_search_context(search_results)
+        search_context, context_documents = self._format_search_context(search_results)
 
         # Step 3: Create agent with context
         agent = self._create_agent(search_context)
 
-        # Step 4: Build message with optional conversation history
+        # Step 4: Build messages with optional conversation history
         messages: list[TextMessage] = []
         if conversation_history:
-            for msg in conversation_history:
-                messages.append(
-                    TextMessage(
-                        content=msg["content"],
-                        source=msg.get("role", "user"),
-                    )
-                )
+            messages.extend(self._history_messages(conversation_history, user_id, conversation_id))
 
         # Add current question
         messages.append(TextMessage(content=question, source="user"))
 
-        # Step 5: Get agent response
+        # Step 5: Cite only the documents the model was shown
+        source_references = self._build_source_references(context_documents)
+
+        # Step 6: Stream the agent response
+        content = ""
         try:
-            response = await agent.on_messages(messages, cancellation_token=None)
-            content = response.chat_message.content if response.chat_message else ""
-            if not isinstance(content, str):
-                content = str(content)
+            async for event in agent.on_messages_stream(
+                messages, cancellation_token=CancellationToken()
+            ):
+                if isinstance(event, ModelClientStreamingChunkEvent):
+                    yield {"type": "delta", "content": event.content}
+                elif isinstance(event, Response):
+                    message = event.chat_message
+                    content = message.content if message else ""
+                    if not isinstance(content, str):
+                        content = str(content)
         except Exception:
             logger.exception("Agent failed to generate response")
             raise
 
-        # Step 6: Build source references from search results
-        source_references = self._build_source_references(search_results)
-
         # Step 7: Detect if agent refused
         was_refused = self._is_refusal(content)
 
-        return {
+        result: dict[str, Any] = {
             "content": content,
             "source_references": source_references,
             "was_refused": was_refused,
         }
+        if self._answer_cache is not None:
+            self._answer_cache.set(cache_key, result)
+        if self._semantic_cache is not None and question_embedding is not None:
+            self._semantic_cache.insert(question_embedding, scope_key, context_key, result)
+        yield {"type": "answer", "answer": dict(result)}
 
-    def _format_search_context(self, results: list[SearchResult]) -> str:
-        """Format search results as context text for the agent."""
-        if not results:
-            return "No documents found matching the query."
-
-        parts: list[str] = []
-        for i, r in enumerate(results, 1):
-            parts.append(
-                f"[Document {i}]\n"
-                f"Title: {r.document_title}\n"
-                f"Source: {r.source_url}\n"
-                f"Content:\n{r.content}\n"
+    def _answer_key(
+        self,
+        question: str,
+        user_id: str,
+        group_ids: list[str],
+        conversation_history: list[dict[str, str]] | None,
+    ) -> str:
+        """Key identifying an answer: scope, normalised question, caller and history."""
+        return make_cache_key(
+            self._cache_scope,
+            normalize_question(question),
+            user_id,
+            sorted(group_ids),
+            conversation_history or [],
+        )
+
+    def _history_messages(
+        self,
+        conversation_history: list[dict[str, str]],
+        user_id: str,
+        conversation_id: str | None,
+    ) -> list[TextMessage]:
+        """Convert history to agent messages, converting only turns not seen before.
+
+        History comes from already-validated stored messages, so messages are
+        built with ``model_construct`` to skip re-validation.
+        """
+        cache = self._history_cache if conversation_id is not None else None
+        key = make_cache_key(user_id, conversation_id) if cache is not None else ""
+        cached = (cache.get(key) or []) if cache is not None else []
+        # Fall back to a full rebuild if the history no longer extends the cache
+        if len(cached) > len(conversation_history) or (
+            cached and cached[-1].content != conversation_history[len(cached) - 1]["content"]
+        ):
+            cached = []
+
+        built = cached + [
+            TextMessage.model_construct(content=msg["content"], source=msg.get("role", "user"))
+            for msg in conversation_history[len(cached) :]
+        ]
+        if cache is not None:
+            cache.set(key, built)
+        return built
+
+    async def _search(
+        self,
+        question: str,
+        user_id: str,
+        group_ids: list[str],
+    ) -> list[SearchResult]:
+        """Run the search backend, reusing cached results for repeated queries."""
+        if self._search_cache is None:
+            return await self._search_service.search_documents(
+                query=question,
+                user_id=user_id,
+                group_ids=group_ids,
             )
-        return "\n---\n".join(parts)
+
+        key = make_cache_key(
+            self._cache_scope, normalize_question(question), user_id, sorted(group_ids)
+        )
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        results = await self._search_service.search_documents(
+            query=question,
+            user_id=user_id,
+            group_ids=group_ids,
+        )
+        self._search_cache.set(key, results)
+        return list(results)
+
+    def _format_search_context(self, results: list[SearchResult]) -> tuple[str, list[SearchResult]]:
+        """Format search results as context text for the agent.
+
+        Chunks are deduplicated by source URL (keeping the highest-scoring
+        one), the best ``MAX_CONTEXT_DOCUMENTS`` are kept, and their content
+        is split evenly across the context character budget.
+
+        Returns:
+            The context text and the documents it includes, best first.
+        """
+        if not results:
+            return "No documents found matching the query.", []
+
+        best: dict[str, SearchResult] = {}
+        for r in results:
+            current = best.get(r.source_url)
+            if current is None or r.relevance_score > current.relevance_score:
+                best[r.source_url] = r
+        selected = sorted(best.values(), key=lambda r: r.relevance_score, reverse=True)[
+            :MAX_CONTEXT_DOCUMENTS
+        ]
+        per_document = min(MAX_CONTEXT_CHARS_PER_DOCUMENT, self._max_context_chars // len(selected))
+
+        buf = io.StringIO()
+        for i, r in enumerate(selected, 1):
+            if i > 1:
+                buf.write("\n---\n")
+            buf.write(f"[Document {i}]\nTitle: {r.document_title}\nSource: {r.source_url}\n")
+            buf.write("Content:\n")
+            buf.write(r.content[:per_document])
+            buf.write("\n")
+        return buf.getvalue(), selected
 
     def _build_source_references(self, results: list[SearchResult]) -> list[SourceReference]:
         """Convert search results to source reference citations."""
@@ -152,7 +460,7 @@ class SharePointQAAgent:
             SourceReference(
                 document_title=r.document_title,
                 document_url=r.source_url,
-                excerpt=r.content[:500] if r.content else None,
+                excerpt=r.excerpt,
                 relevance_score=r.relevance_score,
             )
             for r in results
@@ -160,12 +468,6 @@ class SharePointQAAgent:
 
     def _is_refusal(self, content: str) -> bool:
         """Check if the agent's response is a refusal to answer."""
-        refusal_phrases = [
-            "I can only answer questions about documents stored in SharePoint",
-            "I couldn't find relevant information",
-            "not able to answer",
-            "cannot answer",
-            "outside my scope",
-        ]
-        content_lower = content.lower()
-        return any(phrase.lower() in content_lower for phrase in refusal_phrases)
+        if content.lstrip().startswith(_REFUSAL_PREFIXES):
+            return True
+        return _REFUSAL_RE.search(content) is not None
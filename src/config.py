@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Literal
 
 from pydantic_settings import BaseSettings
@@ -20,6 +21,7 @@ class Settings(BaseSettings):
     azure_openai_embedding_deployment: str = "text-embedding-3-small"
     azure_openai_api_version: str = "2024-06-01"
     azure_openai_api_key: str = ""  # Optional — uses DefaultAzureCredential when empty
+    openai_max_connections: int = 100  # Shared connection pool size for Azure OpenAI calls
 
     # Azure AI Search
     azure_search_endpoint: str
@@ -47,14 +49,30 @@ class Settings(BaseSettings):
     entra_client_id: str
     entra_client_secret: str = ""  # Optional — not needed when using managed identity
 
+    # Validated-token cache — entries never outlive the token's own exp claim
+    token_cache_ttl: int = 60
+    token_cache_maxsize: int = 10000
+    # Optional file sharing MSAL's OBO token cache across workers (empty = per process)
+    msal_token_cache_path: str = ""
+
     # Application
     log_level: str = "INFO"
     max_input_length: int = 4000
     rate_limit_per_minute: int = 20
+    max_context_chars: int = 24000  # Document content budget per question sent to the LLM
+
+    # Semantic answer cache — embeds each question to reuse answers to paraphrases
+    semantic_cache_enabled: bool = False
+    semantic_cache_threshold: float = 0.92
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Create and return a validated Settings instance."""
+    """Create and return a validated Settings instance.
+
+    The instance is built once per process; call ``get_settings.cache_clear()``
+    to reload it (e.g. in tests that change the environment).
+    """
     return Settings()  # type: ignore[call-arg]
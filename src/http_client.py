@@ -0,0 +1,72 @@
+"""Shared async HTTP connection pools for outbound Azure calls.
+
+Reusing one ``httpx.AsyncClient`` keeps TCP/TLS connections alive across
+requests instead of opening a new pool for every per-request model client
+or knowledge-base search service. Azure SDK clients (Azure AI Search) use
+the Azure Core pipeline instead of httpx, so they share a separate aiohttp
+session through ``get_search_transport``.
+Azure OpenAI enforces its own per-deployment rate limits, so raising the pool
+size beyond what the deployment's TPM/RPM quota allows only moves the
+bottleneck to 429 responses.
+"""
+
+from __future__ import annotations
+
+import aiohttp
+import httpx
+from azure.core.pipeline.transport import AioHttpTransport
+
+_client: httpx.AsyncClient | None = None
+_search_session: aiohttp.ClientSession | None = None
+
+
+def get_http_client(max_connections: int = 100) -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use.
+
+    Args:
+        max_connections: Pool size, only applied when the client is created.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=min(50, max_connections),
+            ),
+            timeout=30.0,
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client if it was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_search_transport() -> AioHttpTransport:
+    """Return an Azure Core transport over the process-wide aiohttp session.
+
+    The transport does not own the session, so closing a per-request
+    Azure SDK client leaves the pooled connections open. Must be called
+    from a running event loop.
+    """
+    global _search_session
+    if _search_session is None or _search_session.closed:
+        # Same session options Azure Core uses for sessions it creates itself
+        _search_session = aiohttp.ClientSession(
+            trust_env=True,
+            cookie_jar=aiohttp.DummyCookieJar(),
+            auto_decompress=False,
+        )
+    return AioHttpTransport(session=_search_session, session_owner=False)
+
+
+async def close_search_transport() -> None:
+    """Close the shared Azure SDK session if it was created."""
+    global _search_session
+    if _search_session is not None:
+        await _search_session.close()
+        _search_session = None
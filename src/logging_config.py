@@ -2,19 +2,33 @@
 
 from __future__ import annotations
 
+import atexit
+import copy
 import json
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import UTC, datetime
 from typing import Any
 
+# Extra record attributes copied into each JSON line, in output order
+_EXTRA_KEYS = (
+    "user_id",
+    "conversation_id",
+    "latency_ms",
+    "request_id",
+    "cache_hits",
+    "cache_misses",
+)
+
 
 class JSONFormatter(logging.Formatter):
     """Format log records as JSON lines for structured logging."""
 
     def format(self, record: logging.LogRecord) -> str:
         log_entry: dict[str, Any] = {
-            "timestamp": datetime.now(tz=UTC).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -24,29 +38,81 @@ class JSONFormatter(logging.Formatter):
             log_entry["exception"] = self.formatException(record.exc_info)
 
         # Include extra fields attached to the record
-        for key in ("user_id", "conversation_id", "latency_ms", "request_id"):
-            value = getattr(record, key, None)
+        attrs = record.__dict__
+        for key in _EXTRA_KEYS:
+            value = attrs.get(key)
             if value is not None:
-                log_entry[key] = value
+                log_entry[key] = _coerce(value)
+
+        return json.dumps(log_entry, separators=(",", ":"))
+
+
+def _coerce(value: Any) -> Any:
+    """Return ``value`` if it is a JSON scalar, otherwise its ``str()``."""
+    if isinstance(value, str | int | float | bool):
+        return value
+    return str(value)
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that defers JSON formatting to the listener thread.
+
+    The stock ``prepare`` formats the record on the calling thread and folds
+    the traceback into the message. Here only the message arguments are
+    resolved (so later mutation cannot change the log line) and ``exc_info``
+    is kept for ``JSONFormatter``'s ``exception`` field.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
-        return json.dumps(log_entry, default=str)
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_listener() -> None:
+    """Drain the log queue and stop the listener thread, if running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.flush()
+        _listener = None
 
 
 def setup_logging(log_level: str = "INFO") -> None:
     """Configure root logger with JSON formatter and given log level.
 
+    Log calls only enqueue the record; a ``QueueListener`` thread formats and
+    writes them, so JSON serialisation and stdout I/O stay off the event loop.
+
     Args:
         log_level: Logging level string (DEBUG, INFO, WARNING, ERROR, CRITICAL).
     """
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(JSONFormatter())
+    global _listener
+    _stop_listener()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JSONFormatter())
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    _listener.start()
 
     root = logging.getLogger()
     root.handlers.clear()
-    root.addHandler(handler)
+    root.addHandler(_RecordQueueHandler(log_queue))
     root.setLevel(log_level.upper())
 
     # Quiet noisy third-party loggers
     logging.getLogger("azure").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
     logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+atexit.register(_stop_listener)
@@ -3,34 +3,115 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import json
 import logging
 import time
-import uuid
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
-from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Literal
 
-from fastapi import Depends, FastAPI, HTTPException, Request
+from autogen_ext.models.openai import AzureOpenAIChatCompletionClient
+from azure.core.credentials import AccessToken, AzureKeyCredential
+from azure.cosmos.aio import CosmosClient as AsyncCosmosClient
+from azure.identity.aio import DefaultAzureCredential as AsyncCredential
+from azure.identity.aio import get_bearer_token_provider
+from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from openai import AsyncAzureOpenAI
 from pydantic import BaseModel, Field
+from starlette.background import BackgroundTask
 
+from src.agents.sharepoint_qa import SharePointQAAgent
 from src.config import Settings, get_settings
+from src.http_client import (
+    close_http_client,
+    close_search_transport,
+    get_http_client,
+    get_search_transport,
+)
 from src.logging_config import setup_logging
+from src.models.conversation import Message as ConvMessage
 from src.models.document import SourceReference
-from src.models.errors import ErrorCode, ErrorResponse
+from src.models.errors import ErrorCode
 from src.models.user import User
 from src.services.audit import AuditEntry, log_query
+from src.services.auth import AuthService
+from src.services.cache import (
+    AnswerCache,
+    HistoryMessageCache,
+    SearchResultCache,
+    SemanticAnswerCache,
+)
+from src.services.conversation import ConversationService
+from src.services.embeddings import EmbeddingBatcher, EmbeddingService
+from src.services.kb_search import KnowledgeBaseSearchService
 from src.services.rate_limiter import RateLimiter, RateLimitExceededError
+from src.services.search import IndexerSearchService, SearchBackend
+from src.services.title_generator import generate_title
+from src.utils import new_uuid, now_iso
 
 logger = logging.getLogger(__name__)
 
 # Background tasks set — prevents GC of fire-and-forget coroutines
 _background_tasks: set[asyncio.Task[None]] = set()
 
+# Token scope for Entra ID auth against Azure OpenAI
+_COGNITIVE_SERVICES_SCOPE = "https://cognitiveservices.azure.com/.default"
+
+
+# Constant error payloads (ErrorResponse shape), built once at import time.
+# Shared across requests, so they must never be mutated.
+_ERR_MISSING_BEARER: dict[str, str] = {
+    "error": ErrorCode.UNAUTHORIZED.value,
+    "message": "Missing or invalid Authorization header. Bearer token required.",
+}
+_ERR_EMPTY_BEARER: dict[str, str] = {
+    "error": ErrorCode.UNAUTHORIZED.value,
+    "message": "Empty bearer token.",
+}
+_ERR_EMPTY_MESSAGE: dict[str, str] = {
+    "error": ErrorCode.INVALID_REQUEST.value,
+    "message": "Message cannot be empty.",
+}
+_ERR_SERVICE_UNAVAILABLE: dict[str, str] = {
+    "error": ErrorCode.SERVICE_UNAVAILABLE.value,
+    "message": "The service is temporarily unavailable. Please try again later.",
+}
+_ERR_CONVERSATIONS_UNAVAILABLE: dict[str, str] = {
+    "error": ErrorCode.SERVICE_UNAVAILABLE.value,
+    "message": "Unable to retrieve conversations.",
+}
+_ERR_CONVERSATION_UNAVAILABLE: dict[str, str] = {
+    "error": ErrorCode.SERVICE_UNAVAILABLE.value,
+    "message": "Unable to retrieve conversation.",
+}
+_ERR_CONVERSATION_NOT_FOUND: dict[str, str] = {
+    "error": ErrorCode.NOT_FOUND.value,
+    "message": "Conversation not found.",
+}
+
+
+def _error_payload(error: ErrorCode, message: str) -> dict[str, str]:
+    """Build an ErrorResponse-shaped dict for a dynamic message without validation."""
+    return {"error": error.value, "message": message}
+
+
+class _OBOTokenCredential:
+    """Wraps an OBO access token as an Azure AsyncTokenCredential."""
+
+    def __init__(self, token: str) -> None:
+        self._token = token
+
+    async def get_token(self, *scopes: str, **kwargs: Any) -> AccessToken:
+        return AccessToken(self._token, 0)
+
+    async def close(self) -> None:
+        pass
+
 
 class HealthResponse(BaseModel):
     """Health check response model."""
@@ -40,6 +121,9 @@ class HealthResponse(BaseModel):
     timestamp: str
 
 
+_HEALTH_BODY = {"status": "healthy", "version": "0.1.0"}
+
+
 class ChatRequest(BaseModel):
     """Request body for POST /chat matching openapi.yaml ChatRequest."""
 
@@ -67,6 +151,61 @@ class ChatResponse(BaseModel):
     message: AgentMessage
 
 
+class ConversationSummary(BaseModel):
+    """Summary of a conversation for listing."""
+
+    id: str
+    title: str
+    last_active_at: str
+    status: str
+    preview: str = ""
+
+
+class ConversationListResponse(BaseModel):
+    """Response for GET /conversations."""
+
+    conversations: list[ConversationSummary]
+    total: int
+    limit: int
+    offset: int
+
+
+class MessageItem(BaseModel):
+    """Message in a conversation detail."""
+
+    id: str
+    role: str
+    content: str
+    source_references: list[SourceReference] = Field(default_factory=list)
+    timestamp: str
+
+
+class ConversationDetail(BaseModel):
+    """Full conversation detail for GET /conversations/{id}."""
+
+    id: str
+    user_id: str
+    title: str
+    messages: list[MessageItem]
+    status: str
+    created_at: str
+    last_active_at: str
+
+
+def _sse_event(payload: dict[str, Any]) -> str:
+    """Encode one Server-Sent Events ``data:`` frame."""
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Return True if an ``If-None-Match`` header matches ``etag`` (weak comparison)."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(",")
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     """Application lifespan handler for startup/shutdown."""
@@ -77,14 +216,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     # Store settings on app state for access in endpoints
     app.state.settings = settings
 
-    # ── Cosmos DB client (singleton for app lifetime) ────────────────────
-    from azure.cosmos.aio import CosmosClient as AsyncCosmosClient
-    from azure.identity.aio import DefaultAzureCredential as AsyncCredential
-
-    from src.services.conversation import ConversationService
+    # ── Azure credential (singleton for app lifetime) ────────────────────
+    # Serves Cosmos DB, Azure OpenAI and the key-less Azure AI Search fallback.
+    credential = AsyncCredential()
+    app.state.credential = credential
 
-    cosmos_credential = AsyncCredential()
-    cosmos_client = AsyncCosmosClient(settings.cosmos_endpoint, credential=cosmos_credential)
+    # ── Cosmos DB client ─────────────────────────────────────────────────
+    cosmos_client = AsyncCosmosClient(settings.cosmos_endpoint, credential=credential)
     app.state.cosmos_client = cosmos_client
     app.state.conversation_service = ConversationService(
         client=cosmos_client,
@@ -93,11 +231,62 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     )
     logger.info("Cosmos DB client initialised")
 
+    # ── Azure OpenAI clients over a shared connection pool ───────────────
+    http_client = get_http_client(settings.openai_max_connections)
+    openai_auth: dict[str, Any] = (
+        {"api_key": settings.azure_openai_api_key}
+        if settings.azure_openai_api_key
+        else {
+            "azure_ad_token_provider": get_bearer_token_provider(
+                credential, _COGNITIVE_SERVICES_SCOPE
+            )
+        }
+    )
+    app.state.model_client = AzureOpenAIChatCompletionClient(
+        azure_deployment=settings.azure_openai_deployment,
+        azure_endpoint=settings.azure_openai_endpoint,
+        api_version=settings.azure_openai_api_version,
+        model=settings.azure_openai_deployment,
+        http_client=http_client,
+        **openai_auth,
+    )
+
+    # Plain OpenAI client for title generation and embeddings
+    app.state.openai_client = AsyncAzureOpenAI(
+        azure_endpoint=settings.azure_openai_endpoint,
+        api_version=settings.azure_openai_api_version,
+        http_client=http_client,
+        **openai_auth,
+    )
+
+    # ── Semantic answer cache (optional) ─────────────────────────────────
+    app.state.semantic_cache = None
+    app.state.embedding_service = None
+    app.state.embedding_batcher = None
+    if settings.semantic_cache_enabled:
+        app.state.embedding_service = EmbeddingService(
+            client=app.state.openai_client,
+            deployment=settings.azure_openai_embedding_deployment,
+        )
+        # Concurrent question embeddings share one request
+        app.state.embedding_batcher = EmbeddingBatcher(app.state.embedding_service.embed_many)
+        app.state.embedding_batcher.start()
+        app.state.semantic_cache = SemanticAnswerCache(
+            threshold=settings.semantic_cache_threshold,
+        )
+        logger.info("Semantic answer cache enabled")
+
     yield
 
     logger.info("SharePoint Q&A Agent shutting down")
+    if app.state.embedding_batcher is not None:
+        await app.state.embedding_batcher.stop()
+    await app.state.model_client.close()
+    await app.state.openai_client.close()
+    await close_http_client()
+    await close_search_transport()
     await cosmos_client.close()
-    await cosmos_credential.close()
+    await credential.close()
 
 
 async def get_current_user(request: Request) -> User:
@@ -109,10 +298,7 @@ async def get_current_user(request: Request) -> User:
     if not auth_header.startswith("Bearer "):
         raise HTTPException(
             status_code=401,
-            detail=ErrorResponse(
-                error=ErrorCode.UNAUTHORIZED,
-                message="Missing or invalid Authorization header. Bearer token required.",
-            ).model_dump(),
+            detail=_ERR_MISSING_BEARER,
         )
 
     # Token validation will be fully implemented in US2 (T027-T028).
@@ -121,45 +307,46 @@ async def get_current_user(request: Request) -> User:
     if not token:
         raise HTTPException(
             status_code=401,
-            detail=ErrorResponse(
-                error=ErrorCode.UNAUTHORIZED,
-                message="Empty bearer token.",
-            ).model_dump(),
+            detail=_ERR_EMPTY_BEARER,
         )
+    # Downstream OBO exchanges reuse the parsed token instead of re-reading the header
+    request.state.bearer_token = token
 
-    # Placeholder: in US2, this will validate JWT and extract real claims
+    # AuthService caches successful validations until shortly before expiry
     try:
-        from src.services.auth import AuthService
-
-        settings: Settings = request.app.state.settings
-        auth_service = AuthService(settings)
-        user = await auth_service.validate_token(auth_header)
-        return user
-    except ImportError:
-        # Auth service not yet implemented — stub for US1
-        raise HTTPException(
-            status_code=401,
-            detail=ErrorResponse(
-                error=ErrorCode.UNAUTHORIZED,
-                message="Authentication service not available.",
-            ).model_dump(),
-        ) from None
+        user = await _get_auth_service(request).validate_token(auth_header)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(
             status_code=401,
-            detail=ErrorResponse(
-                error=ErrorCode.UNAUTHORIZED,
-                message=str(e),
-            ).model_dump(),
+            detail=_error_payload(ErrorCode.UNAUTHORIZED, str(e)),
         ) from None
+    return user
 
 
-def _get_conversation_service(request: Request):
-    """FastAPI dependency: return the singleton ConversationService."""
-    from src.services.conversation import ConversationService
+def _get_auth_service(request: Request) -> AuthService:
+    """Return the app-wide AuthService, creating it on first use.
+
+    Created lazily because building the MSAL application performs Entra ID
+    authority discovery over the network; it is then reused for every
+    validation and OBO exchange.
+    """
+    svc: AuthService | None = getattr(request.app.state, "auth_service", None)
+    if svc is None:
+        settings: Settings = request.app.state.settings
+        svc = AuthService(
+            settings,
+            max_entries=settings.token_cache_maxsize,
+            cache_ttl=settings.token_cache_ttl,
+            msal_cache_path=settings.msal_token_cache_path,
+        )
+        request.app.state.auth_service = svc
+    return svc
 
+
+def _get_conversation_service(request: Request) -> ConversationService:
+    """FastAPI dependency: return the singleton ConversationService."""
     svc: ConversationService = request.app.state.conversation_service
     return svc
 
@@ -173,13 +360,14 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
-    # CORS middleware
+    # CORS middleware (answers preflights itself; browsers may cache them for a day)
     application.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        max_age=86_400,
     )
 
     # Per-user rate limiter (US4)
@@ -189,6 +377,11 @@ def create_app() -> FastAPI:
     )
     application.state.rate_limiter = rate_limiter
 
+    # Answer, search-result and history-message caches shared by every request
+    application.state.answer_cache = AnswerCache(maxsize=1024, ttl=300)
+    application.state.search_cache = SearchResultCache(maxsize=1024, ttl=300)
+    application.state.history_cache = HistoryMessageCache(maxsize=10_000, ttl=3600)
+
     # ── Static frontend ─────────────────────────────────────────────────────
     static_dir = Path(__file__).resolve().parent.parent / "static"
     if static_dir.is_dir():
@@ -228,17 +421,20 @@ def create_app() -> FastAPI:
 
     @application.get("/health", response_model=HealthResponse)
     async def health_check() -> HealthResponse:
-        """Health check endpoint used by Container Apps probes."""
-        return HealthResponse(
-            status="healthy",
-            version="0.1.0",
-            timestamp=datetime.now(tz=UTC).isoformat(),
+        """Health check endpoint used by Container Apps probes.
+
+        The highest-traffic endpoint, so it skips model construction and
+        response validation; the schema is kept for the OpenAPI docs.
+        """
+        return JSONResponse(  # type: ignore[return-value]
+            content={**_HEALTH_BODY, "timestamp": now_iso()},
         )
 
     @application.post("/chat", response_model=ChatResponse)
     async def send_message(
         body: ChatRequest,
         request: Request,
+        background_tasks: BackgroundTasks,
         current_user: User = Depends(get_current_user),
     ) -> ChatResponse:
         """Send a message to the SharePoint Q&A agent.
@@ -256,45 +452,44 @@ def create_app() -> FastAPI:
         except RateLimitExceededError as exc:
             raise HTTPException(
                 status_code=429,
-                detail=ErrorResponse(
-                    error=ErrorCode.RATE_LIMIT_EXCEEDED,
-                    message=f"Rate limit exceeded. Try again in {exc.retry_after:.0f} seconds.",
-                ).model_dump(),
+                detail=_error_payload(
+                    ErrorCode.RATE_LIMIT_EXCEEDED,
+                    f"Rate limit exceeded. Try again in {exc.retry_after:.0f} seconds.",
+                ),
             ) from exc
 
         # T023: Input validation — reject if message exceeds max length
         if len(body.message) > settings.max_input_length:
             return JSONResponse(  # type: ignore[return-value]
                 status_code=400,
-                content=ErrorResponse(
-                    error=ErrorCode.INPUT_TOO_LONG,
-                    message=f"Message exceeds maximum length of {settings.max_input_length} characters.",
-                ).model_dump(),
+                content=_error_payload(
+                    ErrorCode.INPUT_TOO_LONG,
+                    f"Message exceeds maximum length of {settings.max_input_length} characters.",
+                ),
             )
 
-        if not body.message.strip():
+        # isspace() stops at the first non-blank character and copies nothing
+        if not body.message or body.message.isspace():
             return JSONResponse(  # type: ignore[return-value]
                 status_code=400,
-                content=ErrorResponse(
-                    error=ErrorCode.INVALID_REQUEST,
-                    message="Message cannot be empty.",
-                ).model_dump(),
+                content=_ERR_EMPTY_MESSAGE,
             )
 
         # ── Conversation persistence ─────────────────────────────────────
-        from src.models.conversation import Message as ConvMessage
-
-        conversation_service = _get_conversation_service(request)
         is_new_conversation = body.conversation_id is None
         conversation_history: list[dict[str, str]] | None = None
         conversation_id: str
+        conversation_service: ConversationService | None = None
 
         try:
+            conversation_service = _get_conversation_service(request)
+            user_msg = ConvMessage(role="user", content=body.message)
             if is_new_conversation:
-                # Create a new conversation — use the model's auto UUID
+                # Create the conversation with the user message in one write
                 conv = await conversation_service.create_conversation(
                     user_id=current_user.user_id,
                     title="New conversation",
+                    messages=[user_msg],
                 )
                 conversation_id = conv.id
             else:
@@ -310,87 +505,56 @@ def create_app() -> FastAPI:
                         for m in existing.messages
                     ]
 
-            # Save user message
-            user_msg = ConvMessage(role="user", content=body.message)
-            await conversation_service.add_message(
-                conversation_id=conversation_id,
-                user_id=current_user.user_id,
-                message=user_msg,
-            )
+                # Save user message
+                await conversation_service.add_message(
+                    conversation_id=conversation_id,
+                    user_id=current_user.user_id,
+                    message=user_msg,
+                )
         except Exception:
             # Graceful degradation — proceed without persistence
             logger.warning("Conversation persistence failed — continuing without it", exc_info=True)
             if is_new_conversation:
-                conversation_id = str(uuid.uuid4())
+                conversation_id = new_uuid()
 
         try:
-            # Import agent and search service
-            from autogen_ext.models.openai import AzureOpenAIChatCompletionClient
-            from azure.identity import DefaultAzureCredential
-
-            from src.agents.sharepoint_qa import SharePointQAAgent
-            from src.services.search import IndexerSearchService, SearchBackend
-
-            credential = DefaultAzureCredential()
+            model_client: AzureOpenAIChatCompletionClient = request.app.state.model_client
 
             # ── Search backend factory ──────────────────────────────────
+            # Per request: the backend carries the caller's delegated identity.
             search_service: SearchBackend
+            # Set for backends that own a client needing an explicit close
+            close_search: Callable[[], Awaitable[None]] | None = None
             effective_approach = body.search_approach or settings.search_approach
+            auth_service = _get_auth_service(request)
+            user_token: str = getattr(request.state, "bearer_token", "")
 
             if effective_approach == "indexer":
                 # Approach 1: direct Azure AI Search index query
                 # Use OBO token when user is authenticated, fall back to API key / DefaultAzureCredential
-                from src.services.auth import AuthService
-
-                auth_service = AuthService(settings)
-                auth_header_val = request.headers.get("Authorization", "")
-                user_token = auth_header_val.removeprefix("Bearer ").strip()
-
                 try:
                     obo_token = await auth_service.get_search_token(user_token)
-                    from azure.core.credentials import AccessToken, AzureKeyCredential
-
-                    class _OBOTokenCredential:
-                        """Wraps an OBO access token as an Azure TokenCredential."""
-
-                        def __init__(self, token: str) -> None:
-                            self._token = token
-
-                        def get_token(self, *scopes: str, **kwargs: Any) -> AccessToken:
-                            return AccessToken(self._token, 0)
-
                     search_cred: Any = _OBOTokenCredential(obo_token)
                 except Exception:
                     logger.warning("OBO token exchange failed for indexer, falling back to API key")
                     if settings.azure_search_api_key:
-                        from azure.core.credentials import AzureKeyCredential
-
                         search_cred = AzureKeyCredential(settings.azure_search_api_key)
                     else:
-                        search_cred = credential
+                        search_cred = request.app.state.credential
 
                 search_service = IndexerSearchService(
                     endpoint=settings.azure_search_endpoint,
                     index_name=settings.azure_search_index_name,
                     credential=search_cred,
+                    transport=get_search_transport(),
                 )
+                close_search = search_service.aclose
             else:
                 # Approaches 2 & 3: Knowledge Base retrieve API
-                from src.services.kb_search import KnowledgeBaseSearchService
-
                 token_provider = None
                 if effective_approach in ("foundryiq", "indexed_sharepoint"):
                     # OBO token provider for delegated user identity
-                    from src.services.auth import AuthService
-
-                    auth_service = AuthService(settings)
-                    auth_header = request.headers.get("Authorization", "")
-                    user_token = auth_header.removeprefix("Bearer ").strip()
-
-                    async def _search_token_provider() -> str:
-                        return await auth_service.get_search_token(user_token)
-
-                    token_provider = _search_token_provider
+                    token_provider = functools.partial(auth_service.get_search_token, user_token)
 
                 search_service = KnowledgeBaseSearchService(
                     endpoint=settings.azure_search_endpoint,
@@ -402,114 +566,168 @@ def create_app() -> FastAPI:
                     token_provider=token_provider,
                 )
 
-            model_client = AzureOpenAIChatCompletionClient(
-                azure_deployment=settings.azure_openai_deployment,
-                azure_endpoint=settings.azure_openai_endpoint,
-                api_version=settings.azure_openai_api_version,
-                **(
-                    {"api_key": settings.azure_openai_api_key}
-                    if settings.azure_openai_api_key
-                    else {
-                        "azure_ad_token_provider": lambda: (
-                            credential.get_token(
-                                "https://cognitiveservices.azure.com/.default"
-                            ).token
-                        )
-                    }
-                ),
-                model=settings.azure_openai_deployment,
-            )
-
+            embedding_batcher = request.app.state.embedding_batcher
             agent = SharePointQAAgent(
                 search_service=search_service,
                 model_client=model_client,
+                answer_cache=request.app.state.answer_cache,
+                semantic_cache=request.app.state.semantic_cache,
+                embed=embedding_batcher.submit if embedding_batcher is not None else None,
+                search_cache=request.app.state.search_cache,
+                history_cache=request.app.state.history_cache,
+                cache_scope=effective_approach,
+                max_context_chars=settings.max_context_chars,
             )
 
-            # Pass conversation history to the agent for multi-turn context
-            result = await agent.answer_question(
-                question=body.message,
-                user_id=current_user.user_id,
-                group_ids=[],  # TODO: In US2, extract from Graph token
-                conversation_history=conversation_history,
-            )
+            async def _complete(result: dict[str, Any]) -> tuple[AgentMessage, int]:
+                """Log latency, persist the answer and build the response message."""
+                latency_ms = int((time.monotonic() - start_time) * 1000)
+
+                # Log performance warning
+                if latency_ms > 5000:
+                    logger.warning(
+                        "Response exceeded 5s target",
+                        extra={"latency_ms": latency_ms, "user_id": current_user.user_id},
+                    )
+                else:
+                    logger.info(
+                        "Chat response completed",
+                        extra={"latency_ms": latency_ms, "user_id": current_user.user_id},
+                    )
+
+                # SourceReference instances are reused as-is; they are dumped
+                # once, when the response is encoded.
+                refs = result.get("source_references", [])
+                agent_msg = AgentMessage(
+                    id=new_uuid(),
+                    role="assistant",
+                    content=result["content"],
+                    source_references=refs,
+                    timestamp=now_iso(),
+                )
 
-            latency_ms = int((time.monotonic() - start_time) * 1000)
+                # ── Save assistant message & generate title ─────────────
+                if conversation_service is None:
+                    return agent_msg, latency_ms
+                try:
+                    assistant_conv_msg = ConvMessage(
+                        role="assistant",
+                        content=result["content"],
+                        source_references=refs,
+                    )
+                    await conversation_service.add_message(
+                        conversation_id=conversation_id,
+                        user_id=current_user.user_id,
+                        message=assistant_conv_msg,
+                    )
+
+                    # Generate a title for new conversations (fire-and-forget)
+                    if is_new_conversation:
+
+                        async def _update_title() -> None:
+                            try:
+                                title = await generate_title(
+                                    user_message=body.message,
+                                    assistant_message=result["content"],
+                                    settings=settings,
+                                    client=getattr(request.app.state, "openai_client", None),
+                                )
+                                await conversation_service.update_title(
+                                    conversation_id=conversation_id,
+                                    user_id=current_user.user_id,
+                                    title=title,
+                                )
+                                logger.info(
+                                    "Generated conversation title",
+                                    extra={"conversation_id": conversation_id, "title": title},
+                                )
+                            except Exception:
+                                logger.warning("Title generation failed", exc_info=True)
+
+                        # Store reference to prevent GC before completion
+                        task = asyncio.create_task(_update_title())
+                        _background_tasks.add(task)
+                        task.add_done_callback(_background_tasks.discard)
+                except Exception:
+                    logger.warning("Failed to save assistant message", exc_info=True)
 
-            # T024: Audit logging
-            source_urls = [sr.document_url for sr in result.get("source_references", [])]
-            audit_entry = AuditEntry(
-                user_id=current_user.user_id,
-                conversation_id=conversation_id,
-                query=body.message,
-                documents_accessed=source_urls,
-                response_summary=result["content"][:500],
-                latency_ms=latency_ms,
-                was_refused=result.get("was_refused", False),
-            )
-            await log_query(audit_entry)
+                return agent_msg, latency_ms
 
-            # Log performance warning
-            if latency_ms > 5000:
-                logger.warning(
-                    "Response exceeded 5s target",
-                    extra={"latency_ms": latency_ms, "user_id": current_user.user_id},
-                )
-            else:
-                logger.info(
-                    "Chat response completed",
-                    extra={"latency_ms": latency_ms, "user_id": current_user.user_id},
+            def _audit_entry(result: dict[str, Any], latency_ms: int) -> AuditEntry:
+                """T024: Audit record, logged after the response is sent."""
+                source_urls = [sr.document_url for sr in result.get("source_references", [])]
+                return AuditEntry(
+                    user_id=current_user.user_id,
+                    conversation_id=conversation_id,
+                    query=body.message,
+                    documents_accessed=source_urls,
+                    response_summary=result["content"][:500],
+                    latency_ms=latency_ms,
+                    was_refused=result.get("was_refused", False),
                 )
 
-            agent_msg = AgentMessage(
-                id=str(uuid.uuid4()),
-                role="assistant",
-                content=result["content"],
-                source_references=[sr.model_dump() for sr in result.get("source_references", [])],
-                timestamp=datetime.now(tz=UTC).isoformat(),
-            )
+            # ── Streaming (SSE) variant, selected by the Accept header ──
+            if "text/event-stream" in request.headers.get("accept", ""):
+                completed: list[tuple[dict[str, Any], int]] = []
+
+                async def _events() -> AsyncIterator[str]:
+                    try:
+                        async for event in agent.stream_answer(
+                            question=body.message,
+                            user_id=current_user.user_id,
+                            group_ids=[],  # TODO: In US2, extract from Graph token
+                            conversation_history=conversation_history,
+                            conversation_id=conversation_id,
+                        ):
+                            if event["type"] == "delta":
+                                yield _sse_event({"delta": event["content"]})
+                                continue
+                            result = event["answer"]
+                            agent_msg, latency_ms = await _complete(result)
+                            completed.append((result, latency_ms))
+                            yield _sse_event(
+                                ChatResponse(
+                                    conversation_id=conversation_id,
+                                    message=agent_msg,
+                                ).model_dump(mode="json")
+                            )
+                    except Exception:
+                        logger.exception("Chat stream error")
+                        yield _sse_event(_ERR_SERVICE_UNAVAILABLE)
+                    finally:
+                        if close_search is not None:
+                            await close_search()
+
+                async def _after_stream() -> None:
+                    try:
+                        for result, latency_ms in completed:
+                            await log_query(_audit_entry(result, latency_ms))
+                    finally:
+                        # _events() never runs if the client left before the body
+                        if close_search is not None:
+                            await close_search()
+
+                # Audit logging runs after the last byte has been sent
+                return StreamingResponse(  # type: ignore[return-value]
+                    _events(),
+                    media_type="text/event-stream",
+                    background=BackgroundTask(_after_stream),
+                )
 
-            # ── Save assistant message & generate title ─────────────────
+            # Pass conversation history to the agent for multi-turn context
             try:
-                assistant_conv_msg = ConvMessage(
-                    role="assistant",
-                    content=result["content"],
-                    source_references=result.get("source_references", []),
-                )
-                await conversation_service.add_message(
-                    conversation_id=conversation_id,
+                result = await agent.answer_question(
+                    question=body.message,
                     user_id=current_user.user_id,
-                    message=assistant_conv_msg,
+                    group_ids=[],  # TODO: In US2, extract from Graph token
+                    conversation_history=conversation_history,
+                    conversation_id=conversation_id,
                 )
-
-                # Generate a title for new conversations (fire-and-forget)
-                if is_new_conversation:
-                    from src.services.title_generator import generate_title
-
-                    async def _update_title() -> None:
-                        try:
-                            title = await generate_title(
-                                user_message=body.message,
-                                assistant_message=result["content"],
-                                settings=settings,
-                            )
-                            await conversation_service.update_title(
-                                conversation_id=conversation_id,
-                                user_id=current_user.user_id,
-                                title=title,
-                            )
-                            logger.info(
-                                "Generated conversation title",
-                                extra={"conversation_id": conversation_id, "title": title},
-                            )
-                        except Exception:
-                            logger.warning("Title generation failed", exc_info=True)
-
-                    # Store reference to prevent GC before completion
-                    task = asyncio.create_task(_update_title())
-                    _background_tasks.add(task)
-                    task.add_done_callback(_background_tasks.discard)
-            except Exception:
-                logger.warning("Failed to save assistant message", exc_info=True)
+            finally:
+                if close_search is not None:
+                    await close_search()
+            agent_msg, latency_ms = await _complete(result)
+            background_tasks.add_task(log_query, _audit_entry(result, latency_ms))
 
             return ChatResponse(
                 conversation_id=conversation_id,
@@ -522,51 +740,11 @@ def create_app() -> FastAPI:
             logger.exception("Chat endpoint error")
             return JSONResponse(  # type: ignore[return-value]
                 status_code=503,
-                content=ErrorResponse(
-                    error=ErrorCode.SERVICE_UNAVAILABLE,
-                    message="The service is temporarily unavailable. Please try again later.",
-                ).model_dump(),
+                content=_ERR_SERVICE_UNAVAILABLE,
             )
 
     # --- Conversation Endpoints (US3) ---
 
-    class ConversationSummary(BaseModel):
-        """Summary of a conversation for listing."""
-
-        id: str
-        title: str
-        last_active_at: str
-        status: str
-        preview: str = ""
-
-    class ConversationListResponse(BaseModel):
-        """Response for GET /conversations."""
-
-        conversations: list[ConversationSummary]
-        total: int
-        limit: int
-        offset: int
-
-    class MessageItem(BaseModel):
-        """Message in a conversation detail."""
-
-        id: str
-        role: str
-        content: str
-        source_references: list[dict] = Field(default_factory=list)
-        timestamp: str
-
-    class ConversationDetail(BaseModel):
-        """Full conversation detail for GET /conversations/{id}."""
-
-        id: str
-        user_id: str
-        title: str
-        messages: list[MessageItem]
-        status: str
-        created_at: str
-        last_active_at: str
-
     @application.get("/conversations", response_model=ConversationListResponse)
     async def list_conversations(
         request: Request,
@@ -590,11 +768,9 @@ def create_app() -> FastAPI:
                 ConversationSummary(
                     id=c.id,
                     title=c.title,
-                    last_active_at=c.last_active_at.isoformat()
-                    if hasattr(c.last_active_at, "isoformat")
-                    else str(c.last_active_at),
+                    last_active_at=c.last_active_at.isoformat(),
                     status=c.status,
-                    preview=c.messages[-1].content[:200] if c.messages else "",
+                    preview=c.preview,
                 )
                 for c in convs
             ]
@@ -611,10 +787,7 @@ def create_app() -> FastAPI:
             logger.exception("Error listing conversations")
             return JSONResponse(  # type: ignore[return-value]
                 status_code=503,
-                content=ErrorResponse(
-                    error=ErrorCode.SERVICE_UNAVAILABLE,
-                    message="Unable to retrieve conversations.",
-                ).model_dump(),
+                content=_ERR_CONVERSATIONS_UNAVAILABLE,
             )
 
     @application.get("/conversations/{conversation_id}", response_model=ConversationDetail)
@@ -623,10 +796,26 @@ def create_app() -> FastAPI:
         request: Request,
         current_user: User = Depends(get_current_user),
     ) -> ConversationDetail:
-        """Get a conversation with full message history."""
+        """Get a conversation with full message history.
+
+        Responses carry the document's ETag; a matching ``If-None-Match``
+        gets a bodiless 304 without reading the message history.
+        """
         try:
             service = _get_conversation_service(request)
 
+            if_none_match = request.headers.get("if-none-match")
+            if if_none_match:
+                etag = await service.get_conversation_etag(
+                    conversation_id=conversation_id,
+                    user_id=current_user.user_id,
+                )
+                if etag is not None and _etag_matches(if_none_match, etag):
+                    return Response(  # type: ignore[return-value]
+                        status_code=304,
+                        headers={"ETag": etag},
+                    )
+
             conv = await service.get_conversation(
                 conversation_id=conversation_id,
                 user_id=current_user.user_id,
@@ -635,37 +824,14 @@ def create_app() -> FastAPI:
             if conv is None:
                 return JSONResponse(  # type: ignore[return-value]
                     status_code=404,
-                    content=ErrorResponse(
-                        error=ErrorCode.NOT_FOUND,
-                        message="Conversation not found.",
-                    ).model_dump(),
+                    content=_ERR_CONVERSATION_NOT_FOUND,
                 )
 
-            messages = [
-                MessageItem(
-                    id=m.id,
-                    role=m.role,
-                    content=m.content,
-                    source_references=[sr.model_dump() for sr in m.source_references],
-                    timestamp=m.timestamp.isoformat()
-                    if hasattr(m.timestamp, "isoformat")
-                    else str(m.timestamp),
-                )
-                for m in conv.messages
-            ]
-
-            return ConversationDetail(
-                id=conv.id,
-                user_id=conv.user_id,
-                title=conv.title,
-                messages=messages,
-                status=conv.status,
-                created_at=conv.created_at.isoformat()
-                if hasattr(conv.created_at, "isoformat")
-                else str(conv.created_at),
-                last_active_at=conv.last_active_at.isoformat()
-                if hasattr(conv.last_active_at, "isoformat")
-                else str(conv.last_active_at),
+            # One pydantic-core pass over the conversation, its messages and
+            # their references; the keys match ConversationDetail/MessageItem.
+            return JSONResponse(  # type: ignore[return-value]
+                content=conv.model_dump(mode="json", exclude={"ttl"}),
+                headers={"ETag": conv.etag} if conv.etag else None,
             )
         except HTTPException:
             raise
@@ -673,10 +839,7 @@ def create_app() -> FastAPI:
             logger.exception("Error getting conversation")
             return JSONResponse(  # type: ignore[return-value]
                 status_code=503,
-                content=ErrorResponse(
-                    error=ErrorCode.SERVICE_UNAVAILABLE,
-                    message="Unable to retrieve conversation.",
-                ).model_dump(),
+                content=_ERR_CONVERSATION_UNAVAILABLE,
             )
 
     return application
@@ -1,12 +1,13 @@
 """Pydantic data models for the SharePoint Q&A Agent."""
 
-from src.models.conversation import Conversation, Message
+from src.models.conversation import Conversation, ConversationListItem, Message
 from src.models.document import SearchResult, SourceReference
 from src.models.errors import ErrorCode, ErrorResponse
 from src.models.user import User
 
 __all__ = [
     "Conversation",
+    "ConversationListItem",
     "ErrorCode",
     "ErrorResponse",
     "Message",
@@ -2,25 +2,34 @@
 
 from __future__ import annotations
 
-import uuid
 from datetime import UTC, datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 
 from src.models.document import SourceReference
+from src.utils import new_uuid
 
 # 90 days in seconds
 TTL_90_DAYS = 7_776_000
 
 
+def _parse_datetime(value: Any) -> datetime:
+    """Return ``value`` as a datetime, parsing ISO-8601 strings from Cosmos DB."""
+    if isinstance(value, datetime):
+        return value
+    if value is None:
+        return datetime.now(tz=UTC)
+    return datetime.fromisoformat(value)
+
+
 class Message(BaseModel):
     """A single turn in a conversation.
 
     Embedded within Conversation.messages — not a separate Cosmos DB document.
     """
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_uuid)
     role: str = Field(..., description="'user' or 'assistant'")
     content: str = Field(..., description="Message text content")
     source_references: list[SourceReference] = Field(
@@ -31,17 +40,42 @@ class Message(BaseModel):
         description="UTC timestamp",
     )
 
+    @field_serializer("timestamp", when_used="json")
+    def _serialize_timestamp(self, value: datetime) -> str:
+        # isoformat() ("+00:00"), as in every other API response
+        return value.isoformat()
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize for Cosmos DB storage."""
-        data = self.model_dump()
+        # model_dump() already converts nested source references to dicts;
+        # only the timestamp needs a string form for Cosmos DB.
+        data = self.model_dump(exclude={"timestamp"})
         data["timestamp"] = self.timestamp.isoformat()
-        data["source_references"] = [sr.model_dump() for sr in self.source_references]
         return data
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Message:
-        """Deserialize from Cosmos DB document."""
-        return cls(**data)
+        """Deserialize from Cosmos DB document.
+
+        Stored documents were validated on the way in, so the models are
+        built with ``model_construct`` and skip re-validation.
+        """
+        refs = [
+            SourceReference.model_construct(
+                document_title=sr["document_title"],
+                document_url=sr["document_url"],
+                excerpt=sr.get("excerpt"),
+                relevance_score=sr.get("relevance_score"),
+            )
+            for sr in data.get("source_references", [])
+        ]
+        return cls.model_construct(
+            id=data["id"],
+            role=data["role"],
+            content=data["content"],
+            source_references=refs,
+            timestamp=_parse_datetime(data.get("timestamp")),
+        )
 
 
 class Conversation(BaseModel):
@@ -51,7 +85,7 @@ class Conversation(BaseModel):
     partition key = user_id.
     """
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_uuid)
     user_id: str = Field(..., description="Owner's Entra object ID (partition key)")
     title: str = Field(..., max_length=200, description="Auto-generated title")
     messages: list[Message] = Field(default_factory=list)
@@ -63,6 +97,14 @@ class Conversation(BaseModel):
         default_factory=lambda: datetime.now(tz=UTC),
     )
     ttl: int = Field(default=TTL_90_DAYS, description="Time-to-live in seconds")
+    etag: str | None = Field(
+        default=None, exclude=True, description="Cosmos DB _etag (read-only, not persisted)"
+    )
+
+    @field_serializer("created_at", "last_active_at", when_used="json")
+    def _serialize_datetime(self, value: datetime) -> str:
+        # isoformat() ("+00:00"), as in every other API response
+        return value.isoformat()
 
     def to_cosmos_dict(self) -> dict[str, Any]:
         """Serialize for Cosmos DB upsert."""
@@ -80,15 +122,52 @@ class Conversation(BaseModel):
 
     @classmethod
     def from_cosmos_dict(cls, data: dict[str, Any]) -> Conversation:
-        """Deserialize from Cosmos DB document."""
+        """Deserialize from Cosmos DB document (without re-validation)."""
         messages = [Message.from_dict(m) for m in data.get("messages", [])]
-        return cls(
+        return cls.model_construct(
             id=data["id"],
             user_id=data["user_id"],
             title=data.get("title", ""),
             messages=messages,
             status=data.get("status", "active"),
-            created_at=data.get("created_at", datetime.now(tz=UTC)),
-            last_active_at=data.get("last_active_at", datetime.now(tz=UTC)),
+            created_at=_parse_datetime(data.get("created_at")),
+            last_active_at=_parse_datetime(data.get("last_active_at")),
             ttl=data.get("ttl", TTL_90_DAYS),
+            etag=data.get("_etag"),
+        )
+
+
+class ConversationListItem(BaseModel):
+    """List-view projection of a conversation, without message bodies.
+
+    Built from a Cosmos DB projection query so listing conversations does
+    not transfer every message of every conversation.
+    """
+
+    id: str
+    user_id: str
+    title: str = ""
+    status: str = "active"
+    created_at: datetime
+    last_active_at: datetime
+    message_count: int = 0
+    preview: str = Field(default="", description="Start of the most recent message")
+
+    @classmethod
+    def from_cosmos_dict(cls, data: dict[str, Any]) -> ConversationListItem:
+        """Deserialize a list projection row (without re-validation).
+
+        ``last_message`` is the projected one-element slice holding the
+        latest message, if any.
+        """
+        last_message = data.get("last_message") or [{}]
+        return cls.model_construct(
+            id=data["id"],
+            user_id=data["user_id"],
+            title=data.get("title", ""),
+            status=data.get("status", "active"),
+            created_at=_parse_datetime(data.get("created_at")),
+            last_active_at=_parse_datetime(data.get("last_active_at")),
+            message_count=data.get("message_count", 0),
+            preview=last_message[-1].get("content", "")[:200],
         )
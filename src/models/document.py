@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import cached_property
 
 from pydantic import BaseModel, Field
 
@@ -36,3 +37,8 @@ class SearchResult(BaseModel):
     file_type: str = Field(..., description="File format (docx, pdf, etc.)")
     last_modified: datetime = Field(..., description="Document last-modified date")
     relevance_score: float = Field(..., description="Hybrid search score")
+
+    @cached_property
+    def excerpt(self) -> str | None:
+        """Citation snippet (first 500 chars of content), computed once per result."""
+        return self.content[:500] if self.content else None
@@ -2,20 +2,35 @@
 
 from src.services.audit import AuditEntry, log_query
 from src.services.auth import AuthService
+from src.services.cache import (
+    AnswerCache,
+    HistoryMessageCache,
+    SearchResultCache,
+    SemanticAnswerCache,
+    TTLCache,
+)
 from src.services.conversation import ConversationService
+from src.services.embeddings import EmbeddingBatcher, EmbeddingService
 from src.services.kb_search import KnowledgeBaseSearchService
 from src.services.rate_limiter import RateLimiter, RateLimitExceededError
 from src.services.search import IndexerSearchService, SearchBackend, SearchService
 
 __all__ = [
+    "AnswerCache",
     "AuditEntry",
     "AuthService",
     "ConversationService",
+    "EmbeddingBatcher",
+    "EmbeddingService",
+    "HistoryMessageCache",
     "IndexerSearchService",
     "KnowledgeBaseSearchService",
     "RateLimitExceededError",
     "RateLimiter",
     "SearchBackend",
+    "SearchResultCache",
     "SearchService",
+    "SemanticAnswerCache",
+    "TTLCache",
     "log_query",
 ]
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import logging
-import uuid
 from datetime import UTC, datetime
 
 from pydantic import BaseModel, Field
 
+from src.utils import new_uuid
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,7 +18,7 @@ class AuditEntry(BaseModel):
     Written to structured logs (JSON). One entry per user query.
     """
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_uuid)
     user_id: str = Field(..., description="User's Entra object ID")
     conversation_id: str = Field(..., description="Conversation context")
     query: str = Field(..., description="User's question text")
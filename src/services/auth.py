@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import time
 from typing import Any
 
 import jwt
 import msal
+from msal_extensions import FilePersistence, PersistedTokenCache
 
 from src.models.user import User
+from src.services.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -29,21 +33,68 @@ class AuthService:
     """Microsoft Entra ID authentication service.
 
     Handles:
-    1. JWT token validation (audience, issuer, expiration)
+    1. JWT token validation (JWKS signature, audience, issuer, expiration)
     2. OBO token exchange for Graph API access
     3. User extraction from JWT claims
+
+    Successful validations are cached by token hash, so repeat requests with
+    the same bearer token skip signature verification. Entries live at most
+    ``cache_ttl`` seconds and never beyond the token's ``exp``; failed
+    validations are never cached.
+
+    OBO tokens live in MSAL's token cache. By default that cache is
+    per-process; with ``msal_cache_path`` it is persisted to a file shared
+    by every worker (reloaded when another process changes it, written
+    under a file lock), so one worker's exchange serves the others.
+
+    Args:
+        settings: Application settings (Entra tenant and client credentials).
+        max_entries: Maximum number of cached validated tokens.
+        cache_ttl: Upper bound in seconds on how long a validation is reused.
+        msal_cache_path: Optional file backing MSAL's token cache across
+            processes. Tokens are stored unencrypted, so the file must be on
+            a volume only the app can read.
     """
 
-    def __init__(self, settings: Any) -> None:
+    def __init__(
+        self,
+        settings: Any,
+        *,
+        max_entries: int = 10_000,
+        cache_ttl: float = 60.0,
+        msal_cache_path: str = "",
+    ) -> None:
         self._tenant_id = settings.entra_tenant_id
         self._client_id = settings.entra_client_id
         self._client_secret = settings.entra_client_secret
         self._authority = f"https://login.microsoftonline.com/{self._tenant_id}"
+        self._audiences = [self._client_id, f"api://{self._client_id}"]
+        # Entra ID issues v1 (sts.windows.net) or v2 tokens depending on the app manifest
+        self._issuers = [
+            f"https://login.microsoftonline.com/{self._tenant_id}/v2.0",
+            f"https://sts.windows.net/{self._tenant_id}/",
+        ]
+
+        # Tenant signing keys, fetched once and cached per key ID; an unknown
+        # kid (key rollover) triggers a single refetch of the key set.
+        self._jwks_client = jwt.PyJWKClient(
+            f"{self._authority}/discovery/v2.0/keys",
+            cache_keys=True,
+            lifespan=3600,
+        )
+        self._token_cache: TTLCache[User] = TTLCache(maxsize=max_entries, ttl=cache_ttl)
+
+        # OBO exchanges in flight, keyed by (assertion hash, scopes)
+        self._obo_inflight: dict[tuple[bytes, tuple[str, ...]], asyncio.Future[dict[str, Any]]] = {}
 
+        msal_kwargs: dict[str, Any] = {}
+        if msal_cache_path:
+            msal_kwargs["token_cache"] = PersistedTokenCache(FilePersistence(msal_cache_path))
         self._msal_app = msal.ConfidentialClientApplication(
             client_id=self._client_id,
             client_credential=self._client_secret,
             authority=self._authority,
+            **msal_kwargs,
         )
 
     async def validate_token(self, authorization_header: str) -> User:
@@ -65,8 +116,18 @@ class AuthService:
         if not token:
             raise ValueError("Empty bearer token")
 
-        # Decode and validate the token
-        payload = self._decode_token(token)
+        cache_key = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+        cached_user = self._token_cache.get(cache_key)
+        if cached_user is not None:
+            return cached_user
+
+        # Decode and validate the token. The JWKS lookup fetches the signing
+        # keys with blocking urllib on a cold cache or key rollover, so it
+        # runs in a worker thread to keep the event loop free.
+        payload = await asyncio.to_thread(self._decode_token, token)
+
+        # Signature, exp, aud and iss are verified by _decode_token; the checks
+        # below keep the original error messages.
 
         # Validate expiration
         exp = payload.get("exp", 0)
@@ -75,39 +136,40 @@ class AuthService:
 
         # Validate audience — accept both "client_id" and "api://client_id" formats
         aud = payload.get("aud", "")
-        valid_audiences = {self._client_id, f"api://{self._client_id}"}
-        if aud not in valid_audiences:
+        if aud not in self._audiences:
             raise ValueError(f"Invalid audience (aud): expected {self._client_id}, got {aud}")
 
         # Validate issuer
-        expected_issuer = f"https://login.microsoftonline.com/{self._tenant_id}/v2.0"
         iss = payload.get("iss", "")
-        if iss != expected_issuer:
-            logger.warning("Issuer mismatch: expected %s, got %s", expected_issuer, iss)
+        if iss not in self._issuers:
+            raise ValueError(f"Invalid issuer (iss): {iss}")
 
-        return User.from_jwt_claims(payload)
+        user = User.from_jwt_claims(payload)
+        self._token_cache.set(cache_key, user, ttl=min(exp - time.time(), self._token_cache.ttl))
+        return user
 
     def _decode_token(self, token: str) -> dict[str, Any]:
-        """Decode a JWT token without verification for claim extraction.
+        """Verify a JWT against the tenant's signing keys and return its claims.
 
-        In production, this should verify the token signature against
-        the Entra ID JWKS endpoint. For now, decode without verification
-        and rely on claim validation.
+        The RS256 signature is checked with the Entra ID JWKS key matching the
+        token's ``kid``, along with expiration, audience and issuer.
         """
         try:
-            # Decode without signature verification — production should use JWKS
-            payload = jwt.decode(
+            signing_key = self._jwks_client.get_signing_key_from_jwt(token)
+            return jwt.decode(
                 token,
-                options={
-                    "verify_signature": False,
-                    "verify_aud": False,
-                    "verify_exp": False,
-                },
+                signing_key.key,
                 algorithms=["RS256"],
+                audience=self._audiences,
+                issuer=self._issuers,
+                options={"require": ["exp", "aud", "iss"]},
             )
-            return payload
-        except jwt.exceptions.DecodeError as e:
-            raise ValueError(f"Invalid token format: {e}") from e
+        except jwt.ExpiredSignatureError as e:
+            raise ValueError(f"Token expired: {e}") from e
+        except jwt.InvalidAudienceError as e:
+            raise ValueError(f"Invalid audience (aud): {e}") from e
+        except (jwt.PyJWKClientError, jwt.InvalidTokenError) as e:
+            raise ValueError(f"Invalid token: {e}") from e
 
     async def get_graph_token(self, user_assertion: str) -> str:
         """Exchange user token for a Graph API token using OBO flow.
@@ -121,10 +183,7 @@ class AuthService:
         Raises:
             RuntimeError: If OBO token exchange fails.
         """
-        result = self._msal_app.acquire_token_on_behalf_of(
-            user_assertion=user_assertion,
-            scopes=GRAPH_SCOPES,
-        )
+        result = await self._acquire_on_behalf_of(user_assertion, GRAPH_SCOPES)
 
         if "access_token" in result:
             return result["access_token"]
@@ -148,10 +207,7 @@ class AuthService:
         Raises:
             RuntimeError: If OBO token exchange fails.
         """
-        result = self._msal_app.acquire_token_on_behalf_of(
-            user_assertion=user_assertion,
-            scopes=SEARCH_SCOPES,
-        )
+        result = await self._acquire_on_behalf_of(user_assertion, SEARCH_SCOPES)
 
         if "access_token" in result:
             return result["access_token"]
@@ -160,6 +216,45 @@ class AuthService:
         description = result.get("error_description", "OBO search token exchange failed")
         raise RuntimeError(f"Search token exchange failed via OBO: {error} — {description}")
 
+    async def _acquire_on_behalf_of(self, user_assertion: str, scopes: list[str]) -> dict[str, Any]:
+        """Run MSAL's OBO exchange in a worker thread, once per concurrent caller set.
+
+        MSAL is synchronous: a cache hit is cheap, but a miss (and, with a
+        persisted cache, the file read/lock) blocks, so keep it off the loop.
+        Concurrent requests for the same assertion and scopes share one
+        exchange instead of each calling Entra ID before the cache is filled.
+        """
+        key = (hashlib.blake2b(user_assertion.encode(), digest_size=16).digest(), tuple(scopes))
+        pending = self._obo_inflight.get(key)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The leading request was cancelled; exchange the token here
+
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._obo_inflight[key] = future
+        try:
+            result = await asyncio.to_thread(
+                self._msal_app.acquire_token_on_behalf_of,
+                user_assertion=user_assertion,
+                scopes=scopes,
+            )
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # Mark retrieved when nobody is waiting
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._obo_inflight.get(key) is future:
+                del self._obo_inflight[key]
+            if not future.done():
+                future.cancel()
+
     def extract_user(self, claims: dict[str, Any]) -> User:
         """Extract a User model from JWT claims.
 
@@ -0,0 +1,218 @@
+"""In-process TTL + LRU caches for hot-path query results.
+
+Backed by ``collections.OrderedDict`` so lookups, inserts and LRU
+eviction are all O(1). Entries are stored as ``(expires_at, value)``
+tuples and expire lazily on access.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import operator
+import re
+import time
+from collections import OrderedDict, deque
+from collections.abc import Sequence
+from typing import Any, Generic, TypeVar
+
+from autogen_agentchat.messages import TextMessage
+
+from src.models.document import SearchResult
+
+V = TypeVar("V")
+
+
+# Leading politeness fillers that do not change what is being asked
+_FILLER_RE = re.compile(r"^(?:please|can you|could you|would you)\s+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_question(question: str) -> str:
+    """Canonicalise a question for cache keys only (never sent to the model).
+
+    Lowercases, collapses whitespace, strips trailing ``?.!`` and a leading
+    filler such as "please" or "can you", so trivial variants share a key.
+    """
+    text = _WHITESPACE_RE.sub(" ", question.strip().lower()).rstrip("?.! ")
+    return _FILLER_RE.sub("", text)
+
+
+def make_cache_key(*parts: Any) -> str:
+    """Build a stable SHA-256 cache key from JSON-serialisable parts."""
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class TTLCache(Generic[V]):
+    """Bounded least-recently-used cache whose entries expire after a TTL.
+
+    Args:
+        maxsize: Maximum number of entries before the LRU entry is evicted.
+        ttl: Entry lifetime in seconds.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[str, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> V | None:
+        """Return the cached value for ``key``, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: V, ttl: float | None = None) -> None:
+        """Insert or refresh ``key``, evicting the least-recently-used entry if full.
+
+        ``ttl`` overrides the cache-wide lifetime for this entry.
+        """
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._data.clear()
+
+
+class AnswerCache(TTLCache[dict[str, Any]]):
+    """Exact-match cache of final agent answers.
+
+    Keys must include the user and group IDs so cached answers never
+    cross security-trimming boundaries.
+    """
+
+
+class SearchResultCache(TTLCache[list[SearchResult]]):
+    """Cache of search backend results keyed by normalised query.
+
+    Independent of ``AnswerCache``: retrieval is reused even when the
+    final answer differs (e.g. a different conversation history). Keys
+    must include the user and group IDs for the same reason. Call
+    ``clear()`` after a reindex.
+    """
+
+
+class HistoryMessageCache(TTLCache[list[TextMessage]]):
+    """Cache of conversation history already converted to agent messages.
+
+    Keyed by user and conversation ID. Conversations are append-only, so a
+    cached list is extended with just the new turns on the next question.
+    """
+
+
+# (expires_at, unit-length embedding, context key, answer)
+_SemanticEntry = tuple[float, tuple[float, ...], str, dict[str, Any]]
+
+
+class SemanticAnswerCache:
+    """Embedding-similarity cache that serves answers to paraphrased questions.
+
+    Entries are bucketed per security scope (user + groups + backend), so a
+    lookup only scans that scope's vectors and can never return another
+    user's answer. Vectors are L2-normalised on insert, making the cosine
+    similarity a plain dot product. The cache holds at most ``max_entries``
+    vectors in total and evicts the oldest first.
+
+    Args:
+        threshold: Minimum cosine similarity for a hit.
+        max_entries: Total entries across all scopes before FIFO eviction.
+        ttl: Entry lifetime in seconds.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        max_entries: int = 2048,
+        ttl: float = 300.0,
+    ) -> None:
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._buckets: dict[str, deque[_SemanticEntry]] = {}
+        self._order: deque[str] = deque()
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def lookup(
+        self,
+        embedding: Sequence[float],
+        scope_key: str,
+        context_key: str,
+    ) -> dict[str, Any] | None:
+        """Return the best cached answer at or above the threshold, if any.
+
+        Args:
+            embedding: Raw (unnormalised) question embedding.
+            scope_key: Security scope of the caller.
+            context_key: Hash of the preceding conversation turn.
+        """
+        bucket = self._buckets.get(scope_key)
+        if not bucket:
+            return None
+
+        query = _normalise(embedding)
+        now = time.monotonic()
+        best_score = self.threshold
+        best: dict[str, Any] | None = None
+        for expires_at, vector, entry_context, answer in bucket:
+            if expires_at <= now or entry_context != context_key:
+                continue
+            score = sum(map(operator.mul, vector, query))
+            if score >= best_score:
+                best_score = score
+                best = answer
+        return best
+
+    def insert(
+        self,
+        embedding: Sequence[float],
+        scope_key: str,
+        context_key: str,
+        answer: dict[str, Any],
+    ) -> None:
+        """Cache ``answer`` under the question embedding for ``scope_key``."""
+        entry = (time.monotonic() + self.ttl, _normalise(embedding), context_key, answer)
+        self._buckets.setdefault(scope_key, deque()).append(entry)
+        self._order.append(scope_key)
+
+        while len(self._order) > self.max_entries:
+            oldest_scope = self._order.popleft()
+            oldest_bucket = self._buckets[oldest_scope]
+            oldest_bucket.popleft()
+            if not oldest_bucket:
+                del self._buckets[oldest_scope]
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._buckets.clear()
+        self._order.clear()
+
+
+def _normalise(vector: Sequence[float]) -> tuple[float, ...]:
+    """Scale ``vector`` to unit length (zero vectors are returned unchanged)."""
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0.0:
+        return tuple(vector)
+    return tuple(x / norm for x in vector)
@@ -6,10 +6,15 @@ import logging
 from datetime import UTC, datetime
 from typing import Any
 
-from src.models.conversation import TTL_90_DAYS, Conversation, Message
+from azure.cosmos.exceptions import CosmosResourceNotFoundError
+
+from src.models.conversation import TTL_90_DAYS, Conversation, ConversationListItem, Message
 
 logger = logging.getLogger(__name__)
 
+# Cosmos DB rejects a patch with more operations than this
+MAX_PATCH_OPERATIONS = 10
+
 
 class ConversationService:
     """Manage conversation persistence in Azure Cosmos DB.
@@ -31,12 +36,14 @@ class ConversationService:
         self,
         user_id: str,
         title: str,
+        messages: list[Message] | None = None,
     ) -> Conversation:
         """Create a new conversation.
 
         Args:
             user_id: Owner's Entra object ID.
             title: Conversation title (auto-generated from first message).
+            messages: Initial messages, written with the document in one upsert.
 
         Returns:
             The created Conversation with a new UUID.
@@ -44,6 +51,7 @@ class ConversationService:
         conv = Conversation(
             user_id=user_id,
             title=title,
+            messages=messages or [],
         )
         await self._container.upsert_item(conv.to_cosmos_dict())
         logger.info("Created conversation", extra={"conversation_id": conv.id, "user_id": user_id})
@@ -76,45 +84,112 @@ class ConversationService:
             )
             return None
 
+    async def get_conversation_etag(
+        self,
+        conversation_id: str,
+        user_id: str,
+    ) -> str | None:
+        """Get only the Cosmos DB ``_etag`` of a conversation.
+
+        A single-partition projection query, so conditional GETs can be
+        answered without transferring the message history.
+
+        Args:
+            conversation_id: Conversation UUID.
+            user_id: Owner's Entra object ID (partition key).
+
+        Returns:
+            The document's ``_etag``, or None if not found.
+        """
+        try:
+            async for etag in self._container.query_items(
+                query="SELECT VALUE c._etag FROM c WHERE c.id = @id",
+                parameters=[{"name": "@id", "value": conversation_id}],
+                partition_key=user_id,
+            ):
+                return etag
+        except Exception:
+            logger.warning(
+                "Conversation ETag lookup failed",
+                extra={"conversation_id": conversation_id, "user_id": user_id},
+            )
+        return None
+
     async def add_message(
         self,
         conversation_id: str,
         user_id: str,
         message: Message,
-    ) -> Conversation:
+    ) -> None:
         """Add a message to an existing conversation.
 
-        Upserts the document, which resets the Cosmos DB TTL timer.
+        Patches the document, which resets the Cosmos DB TTL timer.
 
         Args:
             conversation_id: Target conversation UUID.
             user_id: Owner's Entra object ID.
             message: Message to append.
 
-        Returns:
-            Updated Conversation.
+        Raises:
+            ValueError: If conversation not found.
+        """
+        await self.add_messages(conversation_id, user_id, [message])
+
+    async def add_messages(
+        self,
+        conversation_id: str,
+        user_id: str,
+        messages: list[Message],
+    ) -> None:
+        """Append several messages to a conversation using patch operations.
+
+        Only the new messages, ``last_active_at`` and ``ttl`` are sent, so
+        the write cost does not grow with the conversation's length. Cosmos
+        DB caps a patch at ``MAX_PATCH_OPERATIONS``, so long lists are
+        appended in several patches; these are not atomic as a group. The
+        patched document is not returned, since callers already hold the
+        messages.
+
+        Args:
+            conversation_id: Target conversation UUID.
+            user_id: Owner's Entra object ID.
+            messages: Messages to append, in order.
 
         Raises:
             ValueError: If conversation not found.
         """
-        conv = await self.get_conversation(conversation_id, user_id)
-        if conv is None:
-            raise ValueError(f"Conversation {conversation_id} not found for user {user_id}")
+        # Every patch also sets last_active_at and ttl (resetting the TTL timer)
+        batch_size = MAX_PATCH_OPERATIONS - 2
+        for start in range(0, len(messages), batch_size):
+            patch_operations: list[dict[str, Any]] = [
+                {"op": "add", "path": "/messages/-", "value": m.to_dict()}
+                for m in messages[start : start + batch_size]
+            ]
+            patch_operations.append(
+                {"op": "set", "path": "/last_active_at", "value": datetime.now(tz=UTC).isoformat()}
+            )
+            patch_operations.append({"op": "set", "path": "/ttl", "value": TTL_90_DAYS})
 
-        conv.messages.append(message)
-        conv.last_active_at = datetime.now(tz=UTC)
-        conv.ttl = TTL_90_DAYS  # Reset TTL
+            try:
+                await self._container.patch_item(
+                    item=conversation_id,
+                    partition_key=user_id,
+                    patch_operations=patch_operations,
+                    no_response=True,
+                )
+            except CosmosResourceNotFoundError:
+                raise ValueError(
+                    f"Conversation {conversation_id} not found for user {user_id}"
+                ) from None
 
-        await self._container.upsert_item(conv.to_cosmos_dict())
         logger.info(
-            "Added message to conversation",
+            "Added messages to conversation",
             extra={
                 "conversation_id": conversation_id,
                 "user_id": user_id,
-                "message_role": message.role,
+                "message_count": len(messages),
             },
         )
-        return conv
 
     async def list_conversations(
         self,
@@ -122,9 +197,12 @@ class ConversationService:
         status: str = "active",
         limit: int = 20,
         offset: int = 0,
-    ) -> list[Conversation]:
+    ) -> list[ConversationListItem]:
         """List conversations for a user, ordered by most recent first.
 
+        Only list-view fields are projected: the message array is reduced
+        to its length and its last element (for the preview).
+
         Args:
             user_id: Owner's Entra object ID (partition key).
             status: Filter by status ('active' or 'archived').
@@ -132,10 +210,13 @@ class ConversationService:
             offset: Number of results to skip.
 
         Returns:
-            List of Conversation objects.
+            List of ConversationListItem objects.
         """
         query = (
-            "SELECT * FROM c WHERE c.user_id = @user_id AND c.status = @status "
+            "SELECT c.id, c.user_id, c.title, c.status, c.created_at, c.last_active_at, "
+            "ARRAY_LENGTH(c.messages) AS message_count, "
+            "ARRAY_SLICE(c.messages, -1) AS last_message "
+            "FROM c WHERE c.user_id = @user_id AND c.status = @status "
             "ORDER BY c.last_active_at DESC OFFSET @offset LIMIT @limit"
         )
         parameters = [
@@ -145,13 +226,13 @@ class ConversationService:
             {"name": "@limit", "value": limit},
         ]
 
-        results: list[Conversation] = []
+        results: list[ConversationListItem] = []
         async for item in self._container.query_items(
             query=query,
             parameters=parameters,
             partition_key=user_id,
         ):
-            results.append(Conversation.from_cosmos_dict(item))
+            results.append(ConversationListItem.from_cosmos_dict(item))
 
         return results
 
@@ -163,21 +244,27 @@ class ConversationService:
     ) -> None:
         """Update the title of a conversation.
 
+        Patches only the title, so it cannot overwrite messages appended
+        while the title was being generated.
+
         Args:
             conversation_id: Target conversation UUID.
             user_id: Owner's Entra object ID.
             title: New title string (max 200 chars).
         """
-        conv = await self.get_conversation(conversation_id, user_id)
-        if conv is None:
+        try:
+            await self._container.patch_item(
+                item=conversation_id,
+                partition_key=user_id,
+                patch_operations=[{"op": "set", "path": "/title", "value": title[:200]}],
+            )
+        except CosmosResourceNotFoundError:
             logger.warning(
                 "Cannot update title — conversation not found",
                 extra={"conversation_id": conversation_id},
             )
             return
 
-        conv.title = title[:200]
-        await self._container.upsert_item(conv.to_cosmos_dict())
         logger.info(
             "Updated conversation title",
             extra={"conversation_id": conversation_id, "title": title[:200]},
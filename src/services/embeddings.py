@@ -0,0 +1,138 @@
+"""Azure OpenAI embedding service for semantic caching."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# (text, future resolved with its embedding)
+_PendingEmbedding = tuple[str, asyncio.Future[list[float]]]
+
+
+class EmbeddingService:
+    """Embed text with an Azure OpenAI embedding deployment.
+
+    Args:
+        client: An ``openai.AsyncAzureOpenAI`` client.
+        deployment: Embedding deployment name (e.g. 'text-embedding-3-small').
+    """
+
+    def __init__(self, client: Any, deployment: str) -> None:
+        self._client = client
+        self._deployment = deployment
+
+    async def embed(self, text: str) -> list[float]:
+        """Return the embedding vector for ``text``."""
+        response = await self._client.embeddings.create(
+            input=text,
+            model=self._deployment,
+        )
+        return response.data[0].embedding
+
+    async def embed_many(self, texts: list[str]) -> list[list[float]]:
+        """Return one embedding vector per text, in input order, from a single request."""
+        response = await self._client.embeddings.create(
+            input=texts,
+            model=self._deployment,
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.close()
+
+
+class EmbeddingBatcher:
+    """Coalesce concurrent single-text embedding calls into batched requests.
+
+    ``submit()`` queues the text and waits for its vector. A background task
+    takes the first queued text, waits up to ``max_wait`` seconds for more
+    (at most ``max_batch`` in total) and embeds them with one ``embed_many``
+    call. A text arriving while nothing else is queued or in flight is sent
+    without waiting. Batches are sent concurrently, so a slow request does not hold up
+    the next batch. Until ``start()`` has been called (or after ``stop()``),
+    texts are embedded one at a time inline.
+
+    Args:
+        embed_many: Async callable embedding a list of texts in order,
+            e.g. ``EmbeddingService.embed_many``.
+        max_batch: Maximum texts per request.
+        max_wait: Seconds to wait for a batch to fill after its first text.
+    """
+
+    def __init__(
+        self,
+        embed_many: Callable[[list[str]], Awaitable[list[list[float]]]],
+        max_batch: int = 16,
+        max_wait: float = 0.005,
+    ) -> None:
+        self._embed_many = embed_many
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: asyncio.Queue[_PendingEmbedding] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+        self._inflight: set[asyncio.Task[None]] = set()
+
+    def start(self) -> None:
+        """Spawn the batching task on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def submit(self, text: str) -> list[float]:
+        """Return the embedding for ``text``, sharing a request with concurrent callers."""
+        if self._task is None:
+            return (await self._embed_many([text]))[0]
+        future: asyncio.Future[list[float]] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((text, future))
+        return await future
+
+    async def stop(self) -> None:
+        """Stop batching, then embed anything still queued and wait for in-flight batches."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+        remaining: list[_PendingEmbedding] = []
+        while not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        for start in range(0, len(remaining), self.max_batch):
+            self._dispatch(remaining[start : start + self.max_batch])
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            # A lone text (nothing else queued or in flight) goes out at once
+            busy = bool(self._inflight) or not self._queue.empty()
+            if busy and self._queue.qsize() < self.max_batch - 1:
+                await asyncio.sleep(self.max_wait)
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: list[_PendingEmbedding]) -> None:
+        task = asyncio.create_task(self._flush(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _flush(self, batch: list[_PendingEmbedding]) -> None:
+        try:
+            vectors = await self._embed_many([text for text, _ in batch])
+            for (_, future), vector in zip(batch, vectors, strict=True):
+                # The caller may have been cancelled while the request was in flight
+                if not future.done():
+                    future.set_result(vector)
+        except Exception as exc:
+            logger.warning("Batched embedding request failed", exc_info=True)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
@@ -8,10 +8,11 @@ from __future__ import annotations
 
 import logging
 from datetime import UTC, datetime
-from typing import Literal
+from typing import Any, Literal
 
 import httpx
 
+from src.http_client import get_http_client
 from src.models.document import SearchResult
 
 logger = logging.getLogger(__name__)
@@ -23,6 +24,10 @@ _KIND_MAP: dict[str, str] = {
 }
 
 
+# Shared read-only default for references without "sourceData"
+_EMPTY: dict[str, Any] = {}
+
+
 class KnowledgeBaseSearchService:
     """Search via the Azure AI Search Knowledge Base retrieve API.
 
@@ -45,6 +50,7 @@ class KnowledgeBaseSearchService:
         approach: Literal["foundryiq", "indexed_sharepoint"],
         api_key: str = "",
         token_provider: object | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialise the KB search service.
 
@@ -56,6 +62,8 @@ class KnowledgeBaseSearchService:
             approach: Which KB approach to use.
             api_key: Admin API key (for indexed_sharepoint).
             token_provider: Async callable returning a bearer token (for foundryiq).
+            http_client: Pooled client to send requests with; defaults to the
+                process-wide client so connections outlive this instance.
         """
         self._endpoint = endpoint.rstrip("/")
         self._api_version = api_version
@@ -64,6 +72,21 @@ class KnowledgeBaseSearchService:
         self._kind = _KIND_MAP[approach]
         self._api_key = api_key
         self._token_provider = token_provider
+        self._http = http_client if http_client is not None else get_http_client()
+
+        # Invariant per instance; only the messages change between calls
+        self._url = (
+            f"{self._endpoint}/knowledgebases('{self._kb_name}')/retrieve"
+            f"?api-version={self._api_version}"
+        )
+        self._ks_params = [
+            {
+                "knowledgeSourceName": self._ks_name,
+                "kind": self._kind,
+                "includeReferences": True,
+                "includeReferenceSourceData": True,
+            }
+        ]
 
     async def search_documents(
         self,
@@ -84,11 +107,6 @@ class KnowledgeBaseSearchService:
         Returns:
             List of SearchResult objects.
         """
-        url = (
-            f"{self._endpoint}/knowledgebases('{self._kb_name}')/retrieve"
-            f"?api-version={self._api_version}"
-        )
-
         body = {
             "messages": [
                 {
@@ -96,14 +114,7 @@ class KnowledgeBaseSearchService:
                     "content": [{"type": "text", "text": query}],
                 }
             ],
-            "knowledgeSourceParams": [
-                {
-                    "knowledgeSourceName": self._ks_name,
-                    "kind": self._kind,
-                    "includeReferences": True,
-                    "includeReferenceSourceData": True,
-                }
-            ],
+            "knowledgeSourceParams": self._ks_params,
         }
 
         headers = await self._build_headers()
@@ -118,18 +129,17 @@ class KnowledgeBaseSearchService:
             },
         )
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(url, json=body, headers=headers)
-            if response.status_code >= 400:
-                logger.error(
-                    "KB retrieve failed",
-                    extra={
-                        "status": response.status_code,
-                        "body": response.text[:500],
-                    },
-                )
-            response.raise_for_status()
-            data = response.json()
+        response = await self._http.post(self._url, json=body, headers=headers)
+        if response.status_code >= 400:
+            logger.error(
+                "KB retrieve failed",
+                extra={
+                    "status": response.status_code,
+                    "body": response.text[:500],
+                },
+            )
+        response.raise_for_status()
+        data = response.json()
 
         return self._map_results(data)
 
@@ -171,42 +181,47 @@ class KnowledgeBaseSearchService:
             },
         )
 
+        # One fallback timestamp per response rather than one per reference
+        fallback_modified = datetime.now(tz=UTC)
         for item in references:
             try:
                 # The KB retrieve API nests most fields inside "sourceData"
-                source_data = item.get("sourceData", {})
+                source_data = item.get("sourceData") or _EMPTY
 
                 content = source_data.get("snippet", source_data.get("content", ""))
                 doc_url = source_data.get("doc_url", source_data.get("webUrl", ""))
+                # Positions of the last path separator and extension dot
+                slash = doc_url.rfind("/")
+                dot = doc_url.rfind(".")
 
                 # Derive title from doc_url (last path segment, cleaned up)
                 raw_title = item.get("title", source_data.get("title", ""))
                 if not raw_title and doc_url:
                     # e.g. "/drives/.../root:/Travel_Expense_Policy.pdf" → "Travel Expense Policy"
-                    raw_title = doc_url.rsplit("/", 1)[-1].rsplit(".", 1)[0].replace("_", " ")
+                    raw_title = doc_url[slash + 1 : dot if dot > slash else None].replace("_", " ")
                 title = raw_title or "Untitled"
 
                 url = doc_url
                 chunk_id = item.get("chunkId", item.get("id", source_data.get("uid", "")))
+                if not isinstance(chunk_id, str):
+                    chunk_id = str(chunk_id)
                 score = item.get("rerankerScore", item.get("score", 0.0))
                 file_type = source_data.get("fileType", "unknown")
                 if file_type == "unknown" and doc_url:
                     # Derive from extension
-                    ext = doc_url.rsplit(".", 1)[-1].lower() if "." in doc_url else "unknown"
-                    file_type = ext
+                    file_type = doc_url[dot + 1 :].lower() if dot >= 0 else "unknown"
 
                 # Parse last_modified if present
                 last_modified_raw = item.get("lastModified")
                 if isinstance(last_modified_raw, str):
-                    last_modified = datetime.fromisoformat(
-                        last_modified_raw.replace("Z", "+00:00")
-                    )
+                    # Python 3.11+ parses the trailing "Z" natively
+                    last_modified = datetime.fromisoformat(last_modified_raw)
                 else:
-                    last_modified = datetime.now(tz=UTC)
+                    last_modified = fallback_modified
 
                 results.append(
                     SearchResult(
-                        chunk_id=str(chunk_id),
+                        chunk_id=chunk_id,
                         document_title=title,
                         content=content,
                         source_url=url,
@@ -1,15 +1,17 @@
 """Per-user sliding-window rate limiter (T042).
 
-Uses an in-memory ``asyncio.Lock`` + ``collections.deque`` per user to
-enforce a configurable request limit within a rolling time window.
+Keeps two integer counters per user — requests in the current and the
+previous fixed window — and weights the previous one by how much of it
+still overlaps the rolling window, enforcing a configurable request limit
+per time window.
 """
 
 from __future__ import annotations
 
 import logging
 import time
-from asyncio import Lock
-from collections import deque
+from collections import OrderedDict
+from collections.abc import Callable
 
 logger = logging.getLogger(__name__)
 
@@ -24,27 +26,41 @@ class RateLimitExceededError(Exception):
 
 
 class RateLimiter:
-    """Sliding-window rate limiter backed by per-user timestamp deques.
+    """Two-counter sliding-window rate limiter with one entry per user.
+
+    Time is split into fixed windows of ``window_seconds``. A user's usage is
+    estimated as ``current + previous * overlap``, where ``overlap`` is the
+    fraction of the previous window still inside the rolling window. This
+    approximates a true sliding log in O(1) time and three integers per user.
+
+    An entry is ``(window_index, previous, current)``. The check-and-count
+    step runs without awaiting, so it is atomic on the event loop and needs
+    no lock. Entries idle for a full window carry no weight and are swept
+    once per window. Entries are also kept in least-recently-used order and
+    capped at ``max_users``, so a burst of distinct users within one window
+    cannot grow memory without bound.
 
     Args:
         max_requests: Maximum number of requests allowed per window.
         window_seconds: Rolling window duration in seconds.
+        max_users: Maximum tracked users before the least recently seen
+            one is evicted.
+        clock: Monotonic time source in seconds (injectable for tests).
     """
 
     def __init__(
         self,
         max_requests: int = 20,
         window_seconds: int = 60,
+        max_users: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self._buckets: dict[str, deque[float]] = {}
-        self._locks: dict[str, Lock] = {}
-
-    def _get_lock(self, user_id: str) -> Lock:
-        if user_id not in self._locks:
-            self._locks[user_id] = Lock()
-        return self._locks[user_id]
+        self.max_users = max_users
+        self._buckets: OrderedDict[str, tuple[int, int, int]] = OrderedDict()
+        self._swept_window = 0
+        self._clock = clock
 
     async def check_rate_limit(self, user_id: str) -> int:
         """Check and record a request for the given user.
@@ -53,36 +69,56 @@ class RateLimiter:
             user_id: Entra object-id of the requesting user.
 
         Returns:
-            Number of remaining requests in the current window.
+            Number of whole requests still available to the user right now.
 
         Raises:
             RateLimitExceeded: When the limit has been reached.
         """
-        lock = self._get_lock(user_id)
-        async with lock:
-            now = time.time()
-            if user_id not in self._buckets:
-                self._buckets[user_id] = deque()
-
-            bucket = self._buckets[user_id]
-
-            # Evict timestamps outside the window
-            cutoff = now - self.window_seconds
-            while bucket and bucket[0] <= cutoff:
-                bucket.popleft()
-
-            if len(bucket) >= self.max_requests:
-                retry_after = bucket[0] + self.window_seconds - now
-                logger.warning(
-                    "Rate limit exceeded",
-                    extra={
-                        "user_id": user_id,
-                        "requests_in_window": len(bucket),
-                        "retry_after_seconds": retry_after,
-                    },
-                )
-                raise RateLimitExceededError(user_id, retry_after)
-
-            bucket.append(now)
-            remaining = self.max_requests - len(bucket)
-            return remaining
+        now = self._clock()
+        window_seconds = self.window_seconds
+        window = int(now // window_seconds)
+        if window > self._swept_window:
+            self._sweep(window)
+
+        stored_window, previous, current = self._buckets.get(user_id, (window, 0, 0))
+        if stored_window != window:
+            previous = current if stored_window == window - 1 else 0
+            current = 0
+
+        elapsed = now / window_seconds - window  # fraction of the current window
+        used = current + previous * (1 - elapsed)
+
+        if used >= self.max_requests:
+            self._buckets[user_id] = (window, previous, current)
+            retry_after = self._retry_after(previous, current, elapsed)
+            logger.warning(
+                "Rate limit exceeded",
+                extra={
+                    "user_id": user_id,
+                    "retry_after_seconds": retry_after,
+                },
+            )
+            raise RateLimitExceededError(user_id, retry_after)
+
+        self._buckets[user_id] = (window, previous, current + 1)
+        self._buckets.move_to_end(user_id)
+        if len(self._buckets) > self.max_users:
+            self._buckets.popitem(last=False)
+        return int(self.max_requests - used - 1)
+
+    def _retry_after(self, previous: int, current: int, elapsed: float) -> float:
+        """Seconds until the weighted count drops below ``max_requests``."""
+        limit = self.max_requests
+        if current < limit:
+            # The previous window's weight decays enough within this window
+            needed = 1 - (limit - current) / previous
+            return max(0.0, needed - elapsed) * self.window_seconds
+        # Wait for the next window, then for this window's weight to decay
+        return (1 - elapsed + max(0.0, 1 - limit / current)) * self.window_seconds
+
+    def _sweep(self, window: int) -> None:
+        """Drop users with no requests in the current or previous window."""
+        self._swept_window = window
+        stale = [user for user, entry in self._buckets.items() if entry[0] < window - 1]
+        for user in stale:
+            del self._buckets[user]
@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import logging
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any, Protocol, runtime_checkable
 
-from azure.search.documents import SearchClient
+from azure.search.documents.aio import SearchClient
 from azure.search.documents.models import VectorizedQuery
 
 from src.models.document import SearchResult
+from src.services.embeddings import EmbeddingBatcher
 
 logger = logging.getLogger(__name__)
 
@@ -45,13 +47,32 @@ class IndexerSearchService:
         index_name: str,
         credential: Any,
         embedding_client: Any | None = None,
+        transport: Any | None = None,
+        embedding_batcher: EmbeddingBatcher | None = None,
     ) -> None:
+        # A shared transport lets short-lived per-request services reuse one
+        # connection pool; the client only owns it when none is passed.
+        client_kwargs: dict[str, Any] = {"transport": transport} if transport is not None else {}
         self._client = SearchClient(
             endpoint=endpoint,
             index_name=index_name,
             credential=credential,
+            **client_kwargs,
         )
         self._embedding_client = embedding_client
+        # When set, query embeddings share batched requests with other callers
+        self._embedding_batcher = embedding_batcher
+        self._closed = False
+
+    async def aclose(self) -> None:
+        """Close the underlying search client (and its transport if it owns it).
+
+        Safe to call more than once; only the first call closes the client.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        await self._client.close()
 
     async def search_documents(
         self,
@@ -89,7 +110,7 @@ class IndexerSearchService:
             search_kwargs["filter"] = acl_filter
 
         # Add vector query if embedding client is available
-        if self._embedding_client is not None:
+        if self._embedding_batcher is not None or self._embedding_client is not None:
             try:
                 embedding = await self._get_embedding(query)
                 vector_query = VectorizedQuery(
@@ -107,11 +128,12 @@ class IndexerSearchService:
         )
 
         # Execute search
-        results = self._client.search(**search_kwargs)
+        results = await self._client.search(**search_kwargs)
 
-        # Map to SearchResult models
+        # Map to SearchResult models (one fallback timestamp per query)
+        fallback_modified = datetime.now(tz=UTC)
         search_results: list[SearchResult] = []
-        for result in results:
+        async for result in results:
             try:
                 last_modified_raw = result.get("last_modified")
                 if isinstance(last_modified_raw, str):
@@ -119,7 +141,7 @@ class IndexerSearchService:
                 elif isinstance(last_modified_raw, datetime):
                     last_modified = last_modified_raw
                 else:
-                    last_modified = datetime.now(tz=UTC)
+                    last_modified = fallback_modified
 
                 search_results.append(
                     SearchResult(
@@ -160,10 +182,7 @@ class IndexerSearchService:
             )
             return None
 
-        parts: list[str] = [f"UserIds/any(u: u eq '{user_id}')"]
-        for gid in group_ids:
-            parts.append(f"GroupIds/any(g: g eq '{gid}')")
-        return " or ".join(parts)
+        return _compile_filter(user_id, tuple(group_ids))
 
     async def _get_embedding(self, text: str) -> list[float]:
         """Generate embedding vector for the given text.
@@ -174,6 +193,8 @@ class IndexerSearchService:
         Returns:
             Embedding vector as list of floats.
         """
+        if self._embedding_batcher is not None:
+            return await self._embedding_batcher.submit(text)
         response = await self._embedding_client.embeddings.create(
             input=text,
             model="text-embedding-ada-002",
@@ -181,5 +202,29 @@ class IndexerSearchService:
         return response.data[0].embedding
 
 
+@lru_cache(maxsize=8192)
+def _compile_filter(user_id: str, group_ids: tuple[str, ...]) -> str:
+    """Build the ACL filter for one user and group set (memoised).
+
+    Group membership uses ``search.in``, which Azure AI Search evaluates as
+    a single set lookup instead of one ``eq`` clause per group.
+
+    Raises:
+        ValueError: If a group ID contains the ``search.in`` delimiter.
+    """
+    if any("," in g for g in group_ids):
+        raise ValueError("Group IDs must not contain ','")
+    groups = _odata_quote(",".join(group_ids))
+    return (
+        f"UserIds/any(u: u eq {_odata_quote(user_id)}) or "
+        f"GroupIds/any(g: search.in(g, {groups}, ','))"
+    )
+
+
+def _odata_quote(value: str) -> str:
+    """Return ``value`` as an OData string literal (single quotes doubled)."""
+    return "'" + value.replace("'", "''") + "'"
+
+
 # Backward-compatible alias
 SearchService = IndexerSearchService
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from openai import AsyncAzureOpenAI
 
@@ -18,11 +19,15 @@ _TITLE_PROMPT = (
     "Assistant: {assistant_message}"
 )
 
+# User messages this short are used as the title directly
+_SHORT_TITLE_MAX_WORDS = 8
+
 
 async def generate_title(
     user_message: str,
     assistant_message: str,
     settings: Settings,
+    client: Any | None = None,
 ) -> str:
     """Call Azure OpenAI to produce a short conversation title.
 
@@ -30,16 +35,27 @@ async def generate_title(
         user_message: The first user message in the conversation.
         assistant_message: The agent's first reply.
         settings: Application settings (contains OpenAI config).
+        client: Shared ``AsyncAzureOpenAI`` client. When omitted, a client is
+            created for this call and closed afterwards.
 
     Returns:
         A concise title string (≤ 200 chars).
     """
-    client = AsyncAzureOpenAI(
-        azure_endpoint=settings.azure_openai_endpoint,
-        azure_deployment=settings.azure_openai_deployment,
-        api_version=settings.azure_openai_api_version,
-        api_key=settings.azure_openai_api_key or None,
-    )
+    # Short questions already read as titles; skip the LLM round-trip
+    words = user_message.split()
+    if words and len(words) <= _SHORT_TITLE_MAX_WORDS and len(user_message) <= 60:
+        title = " ".join(w[:1].upper() + w[1:] for w in words).rstrip("?.!")
+        if title:
+            return title
+
+    owns_client = client is None
+    if client is None:
+        client = AsyncAzureOpenAI(
+            azure_endpoint=settings.azure_openai_endpoint,
+            azure_deployment=settings.azure_openai_deployment,
+            api_version=settings.azure_openai_api_version,
+            api_key=settings.azure_openai_api_key or None,
+        )
 
     try:
         response = await client.chat.completions.create(
@@ -63,4 +79,5 @@ async def generate_title(
         # Fallback: use first ~50 chars of user message
         return user_message[:50].strip() or "New conversation"
     finally:
-        await client.close()
+        if owns_client:
+            await client.close()
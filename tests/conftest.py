@@ -0,0 +1,228 @@
+"""Shared fixtures for API-level (contract and integration) tests."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+# Minimal env vars for app startup
+TEST_ENV: dict[str, str] = {
+    "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com/",
+    "AZURE_SEARCH_ENDPOINT": "https://test.search.windows.net",
+    "COSMOS_ENDPOINT": "https://test.documents.azure.com:443/",
+    "ENTRA_TENANT_ID": "tenant-123",
+    "ENTRA_CLIENT_ID": "client-456",
+    "ENTRA_CLIENT_SECRET": "secret-789",
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _test_env() -> Iterator[None]:
+    """Set the minimal env vars once for the whole session.
+
+    Tests that need a different environment patch ``os.environ`` themselves
+    (``clear=True`` to start from an empty one).
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in TEST_ENV.items():
+            mp.setenv(name, value)
+        yield
+
+
+@dataclass(frozen=True, slots=True)
+class FakeSettings:
+    """Settings stand-in with dummy values (plain attributes, unlike a MagicMock).
+
+    Use ``dataclasses.replace`` for a variant with different values.
+    """
+
+    log_level: str = "WARNING"
+    max_input_length: int = 4000
+    rate_limit_per_minute: int = 20
+    max_context_chars: int = 24000
+    azure_openai_endpoint: str = "https://fake.openai.azure.com"
+    azure_openai_deployment: str = "gpt-4o"
+    azure_openai_api_version: str = "2024-06-01"
+    azure_openai_embedding_deployment: str = "text-embedding-3-small"
+    azure_openai_api_key: str = ""
+    openai_max_connections: int = 100
+    azure_search_endpoint: str = "https://fake.search.windows.net"
+    azure_search_index_name: str = "test-index"
+    search_approach: str = "indexer"
+    azure_search_api_key: str = ""
+    azure_search_api_version: str = "2025-11-01-preview"
+    knowledge_base_name: str = ""
+    knowledge_source_name: str = ""
+    cosmos_endpoint: str = "https://fake.documents.azure.com"
+    cosmos_database: str = "test-db"
+    cosmos_container: str = "test-container"
+    entra_tenant_id: str = "fake-tenant"
+    entra_client_id: str = "fake-client"
+    entra_client_secret: str = "fake-secret"
+    token_cache_ttl: int = 60
+    token_cache_maxsize: int = 10000
+    msal_token_cache_path: str = ""
+    semantic_cache_enabled: bool = False
+    semantic_cache_threshold: float = 0.92
+
+
+@pytest.fixture(scope="session")
+def settings() -> FakeSettings:
+    """Dummy settings; frozen, so one instance serves the whole session."""
+    return FakeSettings()
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """One FastAPI app shared by every API-level test.
+
+    Tests that need to change app state must do so through ``monkeypatch``
+    (or ``dependency_overrides``, which the ``client`` fixture clears) so
+    the change is undone for the next test. Tests that depend on a fresh
+    rate limiter or caches should use ``module_app``.
+    """
+    from src.main import create_app
+
+    return create_app()
+
+
+@pytest.fixture(scope="module")
+def module_app(settings: FakeSettings) -> FastAPI:
+    """A FastAPI app with ``settings``, shared by the tests of one module only.
+
+    Its rate limiter and caches start empty for each module; tests within
+    the module share them, so each must use its own user IDs.
+    """
+    from src.main import create_app
+
+    application = create_app()
+    application.state.settings = settings
+    return application
+
+
+@pytest.fixture(scope="session")
+def transport(app: FastAPI) -> ASGITransport:
+    """ASGI transport for the shared app (holds no per-request or loop state)."""
+    return ASGITransport(app=app)
+
+
+@pytest_asyncio.fixture
+async def client(app: FastAPI, transport: ASGITransport) -> AsyncIterator[AsyncClient]:
+    """HTTP client for the shared app; clears dependency overrides afterwards."""
+    try:
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            yield c
+    finally:
+        app.dependency_overrides.clear()
+
+
+@contextlib.contextmanager
+def override_dependency(
+    app: FastAPI, dependency: Callable[..., Any], impl: Callable[..., Any]
+) -> Iterator[None]:
+    """Override ``dependency`` on ``app`` for the ``with`` block only.
+
+    Restores whatever override was in place before, so a shared app carries
+    no identity from one test into the next.
+    """
+    overrides = app.dependency_overrides
+    previous = overrides.get(dependency)
+    overrides[dependency] = impl
+    try:
+        yield
+    finally:
+        if previous is None:
+            overrides.pop(dependency, None)
+        else:
+            overrides[dependency] = previous
+
+
+class ASGIResponse(NamedTuple):
+    """Status and body collected from a direct ASGI call."""
+
+    status_code: int
+    body: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+ASGIRequest = Callable[..., Awaitable[ASGIResponse]]
+
+
+@pytest.fixture
+def asgi_request(app: FastAPI) -> Iterator[ASGIRequest]:
+    """Call the shared app's ASGI callable directly, without httpx.
+
+    For tests that only look at the status code (and perhaps a small JSON
+    body): skips building and parsing HTTP messages on both sides. Use the
+    ``client`` fixture for anything that needs response headers or streaming.
+    Clears dependency overrides afterwards, like ``client``.
+    """
+
+    async def _request(
+        method: str,
+        path: str,
+        *,
+        headers: dict[str, str] | None = None,
+        json_body: Any = None,
+    ) -> ASGIResponse:
+        body = b"" if json_body is None else json.dumps(json_body).encode()
+        raw_headers = [(b"host", b"test")]
+        raw_headers += [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+        if json_body is not None:
+            raw_headers.append((b"content-type", b"application/json"))
+            raw_headers.append((b"content-length", str(len(body)).encode()))
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": raw_headers,
+            "client": ("127.0.0.1", 123),
+            "server": ("test", 80),
+        }
+
+        request_sent = False
+        response_done = asyncio.Event()
+        status_code = 0
+        chunks: list[bytes] = []
+
+        async def receive() -> dict[str, Any]:
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await response_done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: dict[str, Any]) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    response_done.set()
+
+        await app(scope, receive, send)
+        return ASGIResponse(status_code, b"".join(chunks))
+
+    try:
+        yield _request
+    finally:
+        app.dependency_overrides.clear()
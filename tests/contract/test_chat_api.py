@@ -2,45 +2,22 @@
 
 from __future__ import annotations
 
-import os
-from unittest.mock import patch
-
 import pytest
-from httpx import ASGITransport, AsyncClient
-
-
-@pytest.fixture
-def env_vars() -> dict[str, str]:
-    """Provide minimal env vars for app startup."""
-    return {
-        "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com/",
-        "AZURE_SEARCH_ENDPOINT": "https://test.search.windows.net",
-        "COSMOS_ENDPOINT": "https://test.documents.azure.com:443/",
-        "ENTRA_TENANT_ID": "tenant-123",
-        "ENTRA_CLIENT_ID": "client-456",
-        "ENTRA_CLIENT_SECRET": "secret-789",
-    }
-
+from httpx import AsyncClient
 
-@pytest.fixture
-async def client(env_vars: dict[str, str]) -> AsyncClient:
-    """Create test client with mocked environment."""
-    with patch.dict(os.environ, env_vars, clear=False):
-        from src.main import create_app
+from tests.conftest import ASGIRequest
 
-        app = create_app()
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as c:
-            yield c  # type: ignore[misc]
+_FAKE_AUTH = {"Authorization": "Bearer fake-token"}
+_LONG_PAYLOAD = {"message": "x" * 5000}
 
 
 class TestChatEndpointContract:
     """Verify POST /chat request/response shapes match openapi.yaml."""
 
     @pytest.mark.asyncio
-    async def test_health_endpoint_returns_200(self, client: AsyncClient) -> None:
+    async def test_health_endpoint_returns_200(self, asgi_request: ASGIRequest) -> None:
         """Health endpoint should always be accessible."""
-        resp = await client.get("/health")
+        resp = await asgi_request("GET", "/health")
         assert resp.status_code == 200
         data = resp.json()
         assert "status" in data
@@ -67,7 +44,7 @@ class TestChatEndpointContract:
         resp = await client.post(
             "/chat",
             json={},
-            headers={"Authorization": "Bearer fake-token"},
+            headers=_FAKE_AUTH,
         )
         # Will be 401 (auth check first) or 422 (validation) depending on order
         assert resp.status_code in (401, 422)
@@ -75,11 +52,6 @@ class TestChatEndpointContract:
     @pytest.mark.asyncio
     async def test_chat_input_too_long_returns_400(self, client: AsyncClient) -> None:
         """POST /chat with message exceeding max length should return 400."""
-        long_message = "x" * 5000
-        resp = await client.post(
-            "/chat",
-            json={"message": long_message},
-            headers={"Authorization": "Bearer fake-token"},
-        )
+        resp = await client.post("/chat", json=_LONG_PAYLOAD, headers=_FAKE_AUTH)
         # Will be 401 (auth first) or 400 (input_too_long)
         assert resp.status_code in (400, 401)
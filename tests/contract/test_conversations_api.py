@@ -2,48 +2,80 @@
 
 from __future__ import annotations
 
-import os
-from unittest.mock import patch
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from httpx import ASGITransport, AsyncClient
+from fastapi import FastAPI
+from httpx import AsyncClient
 
-
-@pytest.fixture
-def env_vars() -> dict[str, str]:
-    return {
-        "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com/",
-        "AZURE_SEARCH_ENDPOINT": "https://test.search.windows.net",
-        "COSMOS_ENDPOINT": "https://test.documents.azure.com:443/",
-        "ENTRA_TENANT_ID": "tenant-123",
-        "ENTRA_CLIENT_ID": "client-456",
-        "ENTRA_CLIENT_SECRET": "secret-789",
-    }
+from src.main import get_current_user
+from src.models.conversation import Conversation, Message
+from src.models.user import User
+from tests.conftest import ASGIRequest, override_dependency
 
 
 class TestConversationsApiContract:
     """Verify conversations endpoint response shapes match openapi.yaml."""
 
     @pytest.mark.asyncio
-    async def test_list_conversations_requires_auth(self, env_vars: dict[str, str]) -> None:
+    async def test_list_conversations_requires_auth(self, asgi_request: ASGIRequest) -> None:
         """GET /conversations without auth should return 401."""
-        with patch.dict(os.environ, env_vars, clear=False):
-            from src.main import create_app
-
-            app = create_app()
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.get("/conversations")
-                assert resp.status_code == 401
+        resp = await asgi_request("GET", "/conversations")
+        assert resp.status_code == 401
 
     @pytest.mark.asyncio
-    async def test_get_conversation_requires_auth(self, env_vars: dict[str, str]) -> None:
+    async def test_get_conversation_requires_auth(self, asgi_request: ASGIRequest) -> None:
         """GET /conversations/{id} without auth should return 401."""
-        with patch.dict(os.environ, env_vars, clear=False):
-            from src.main import create_app
-
-            app = create_app()
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.get("/conversations/some-uuid")
-                assert resp.status_code == 401
+        resp = await asgi_request("GET", "/conversations/some-uuid")
+        assert resp.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_get_conversation_not_modified(
+        self, app: FastAPI, client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """GET /conversations/{id} with a matching If-None-Match should return 304."""
+        user = User(
+            user_id="user-1",
+            display_name="Test",
+            email="user-1@test.com",
+            tenant_id="tenant-1",
+        )
+        service = MagicMock()
+        service.get_conversation_etag = AsyncMock(return_value='"etag-1"')
+        service.get_conversation = AsyncMock()
+        monkeypatch.setattr(app.state, "conversation_service", service, raising=False)
+
+        with override_dependency(app, get_current_user, lambda: user):
+            resp = await client.get("/conversations/conv-1", headers={"If-None-Match": '"etag-1"'})
+        assert resp.status_code == 304
+        assert resp.headers["etag"] == '"etag-1"'
+        assert resp.content == b""
+        service.get_conversation.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_conversation_timestamps_use_isoformat(
+        self, app: FastAPI, client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """GET /conversations/{id} should render timestamps like the other endpoints."""
+        when = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+        conv = Conversation(
+            user_id="user-1",
+            title="Leave",
+            messages=[Message(role="user", content="Leave policy?", timestamp=when)],
+            created_at=when,
+            last_active_at=when,
+        )
+        service = MagicMock()
+        service.get_conversation = AsyncMock(return_value=conv)
+        monkeypatch.setattr(app.state, "conversation_service", service, raising=False)
+        user = User(user_id="user-1", display_name="Test", email="u@test.com", tenant_id="t")
+
+        with override_dependency(app, get_current_user, lambda: user):
+            resp = await client.get(f"/conversations/{conv.id}")
+
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["created_at"] == body["last_active_at"] == "2026-01-02T03:04:05+00:00"
+        assert body["messages"][0]["timestamp"] == "2026-01-02T03:04:05+00:00"
+        assert "ttl" not in body
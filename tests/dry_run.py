@@ -1,77 +1,68 @@
 """Dry-run smoke test: imports, config, and server startup."""
 
+import importlib
 import sys
 
-print(f"Python: {sys.version}")
-print()
+# Output is collected and written once at the end
+lines: list[str] = []
 
-# ── Test imports ──────────────────────────────────────────────────────────
-print("Testing imports...")
-errors = []
 
-try:
-    from src.config import get_settings
-    print("  config OK")
-except Exception as e:
-    print(f"  config FAIL: {e}")
-    errors.append(("config", e))
+def emit(text: str = "") -> None:
+    lines.append(text + "\n")
 
-try:
-    from src.services.search import SearchBackend, IndexerSearchService
-    print("  search OK")
-except Exception as e:
-    print(f"  search FAIL: {e}")
-    errors.append(("search", e))
 
-try:
-    from src.services.kb_search import KnowledgeBaseSearchService
-    print("  kb_search OK")
-except Exception as e:
-    print(f"  kb_search FAIL: {e}")
-    errors.append(("kb_search", e))
+emit(f"Python: {sys.version}")
+emit()
 
-try:
-    from src.services.auth import AuthService
-    print("  auth OK")
-except Exception as e:
-    print(f"  auth FAIL: {e}")
-    errors.append(("auth", e))
+# (label, module, attributes that must exist)
+MODULES = [
+    ("config", "src.config", ["get_settings"]),
+    ("search", "src.services.search", ["SearchBackend", "IndexerSearchService"]),
+    ("kb_search", "src.services.kb_search", ["KnowledgeBaseSearchService"]),
+    ("auth", "src.services.auth", ["AuthService"]),
+    ("agent", "src.agents.sharepoint_qa", ["SharePointQAAgent"]),
+    ("main", "src.main", ["app"]),
+]
 
-try:
-    from src.agents.sharepoint_qa import SharePointQAAgent
-    print("  agent OK")
-except Exception as e:
-    print(f"  agent FAIL: {e}")
-    errors.append(("agent", e))
+# ── Test imports ──────────────────────────────────────────────────────────
+emit("Testing imports...")
+errors = []
+loaded = {}
 
-try:
-    from src.main import app
-    print("  main OK")
-except Exception as e:
-    print(f"  main FAIL: {e}")
-    errors.append(("main", e))
+for label, module_name, attrs in MODULES:
+    try:
+        module = importlib.import_module(module_name)
+        for attr in attrs:
+            loaded[attr] = getattr(module, attr)
+        emit(f"  {label} OK")
+    except Exception as e:
+        emit(f"  {label} FAIL: {e}")
+        errors.append((label, e))
+
+get_settings = loaded.get("get_settings")
+KnowledgeBaseSearchService = loaded.get("KnowledgeBaseSearchService")
 
 # ── Test config ───────────────────────────────────────────────────────────
-print()
-print("Settings:")
+emit()
+emit("Settings:")
 try:
     s = get_settings()
-    print(f"  search_approach:      {s.search_approach}")
-    print(f"  knowledge_base_name:  {s.knowledge_base_name}")
-    print(f"  knowledge_source_name:{s.knowledge_source_name}")
-    print(f"  azure_search_endpoint:{s.azure_search_endpoint}")
-    print(f"  azure_search_api_key: {s.azure_search_api_key[:8]}...")
+    emit(f"  search_approach:      {s.search_approach}")
+    emit(f"  knowledge_base_name:  {s.knowledge_base_name}")
+    emit(f"  knowledge_source_name:{s.knowledge_source_name}")
+    emit(f"  azure_search_endpoint:{s.azure_search_endpoint}")
+    emit(f"  azure_search_api_key: {s.azure_search_api_key[:8]}...")
 except Exception as e:
-    print(f"  Settings FAIL: {e}")
+    emit(f"  Settings FAIL: {e}")
     errors.append(("settings", e))
 
 # ── Test KB search service instantiation ──────────────────────────────────
-print()
-print("Backend instantiation:")
+emit()
+emit("Backend instantiation:")
 try:
     s = get_settings()
     if s.search_approach == "indexer":
-        print("  Approach 1 (indexer) — skipping (needs Azure credential)")
+        emit("  Approach 1 (indexer) — skipping (needs Azure credential)")
     else:
         svc = KnowledgeBaseSearchService(
             endpoint=s.azure_search_endpoint,
@@ -81,18 +72,20 @@ try:
             approach=s.search_approach,
             api_key=s.azure_search_api_key,
         )
-        print(f"  KnowledgeBaseSearchService OK (kind={svc._kind})")
+        emit(f"  KnowledgeBaseSearchService OK (kind={svc._kind})")
 except Exception as e:
-    print(f"  Backend FAIL: {e}")
+    emit(f"  Backend FAIL: {e}")
     errors.append(("backend", e))
 
 # ── Summary ───────────────────────────────────────────────────────────────
-print()
+emit()
 if errors:
-    print(f"FAILED: {len(errors)} error(s)")
+    emit(f"FAILED: {len(errors)} error(s)")
     for name, err in errors:
-        print(f"  {name}: {err}")
-    sys.exit(1)
+        emit(f"  {name}: {err}")
 else:
-    print("All checks passed!")
-    sys.exit(0)
+    emit("All checks passed!")
+
+sys.stdout.writelines(lines)
+sys.stdout.flush()
+sys.exit(1 if errors else 0)
@@ -0,0 +1,260 @@
+"""Integration tests for the Server-Sent Events variant of POST /chat."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from dataclasses import replace
+from typing import Any, ClassVar
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from src.main import get_current_user
+from src.models.conversation import Conversation, Message
+from src.models.document import SourceReference
+from src.models.user import User
+from tests.conftest import FakeSettings, override_dependency
+
+_SSE_HEADERS = {"Accept": "text/event-stream"}
+
+_ANSWER = {
+    "content": "Leave is 25 days.",
+    "source_references": [
+        SourceReference(
+            document_title="Leave Policy",
+            document_url="https://contoso.sharepoint.com/leave.docx",
+            excerpt="Annual leave is 25 days.",
+            relevance_score=0.9,
+        )
+    ],
+    "was_refused": False,
+}
+
+
+class _FakeConversationService:
+    """Records the messages POST /chat persists."""
+
+    def __init__(self) -> None:
+        self.messages: list[Message] = []
+
+    async def create_conversation(
+        self, user_id: str, title: str, messages: list[Message] | None = None
+    ) -> Conversation:
+        self.messages.extend(messages or [])
+        return Conversation(user_id=user_id, title=title, messages=list(messages or []))
+
+    async def add_message(self, conversation_id: str, user_id: str, message: Message) -> None:
+        self.messages.append(message)
+
+    async def update_title(self, conversation_id: str, user_id: str, title: str) -> None:
+        pass
+
+
+class _FakeAgent:
+    """Stands in for SharePointQAAgent; streams two deltas and the answer."""
+
+    fail = False
+
+    def __init__(self, **kwargs: Any) -> None:
+        pass
+
+    async def stream_answer(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
+        yield {"type": "delta", "content": "Leave is "}
+        if self.fail:
+            raise RuntimeError("model unavailable")
+        yield {"type": "delta", "content": "25 days."}
+        yield {"type": "answer", "answer": _ANSWER}
+
+    async def answer_question(self, **kwargs: Any) -> dict[str, Any]:
+        return _ANSWER
+
+
+class _FailingAgent(_FakeAgent):
+    fail = True
+
+
+class _FakeIndexerSearchService:
+    """Stands in for IndexerSearchService; records whether it was closed."""
+
+    instances: ClassVar[list[_FakeIndexerSearchService]] = []
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.closed = False
+        self.instances.append(self)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def _frames(body: str) -> list[dict[str, Any]]:
+    """Decode the ``data:`` payloads of an SSE body."""
+    return [
+        json.loads(frame.removeprefix("data: "))
+        for frame in body.split("\n\n")
+        if frame.startswith("data: ")
+    ]
+
+
+@pytest.fixture
+def conversations(
+    app: FastAPI, settings: FakeSettings, monkeypatch: pytest.MonkeyPatch
+) -> _FakeConversationService:
+    """Give the shared app the state POST /chat needs, with a fake conversation store."""
+    service = _FakeConversationService()
+    for name, value in {
+        "settings": replace(settings, search_approach="foundryiq"),
+        "conversation_service": service,
+        "auth_service": MagicMock(),
+        "model_client": MagicMock(),
+        "embedding_batcher": None,
+        "semantic_cache": None,
+    }.items():
+        monkeypatch.setattr(app.state, name, value, raising=False)
+    return service
+
+
+class TestChatStreaming:
+    """POST /chat with ``Accept: text/event-stream``."""
+
+    @pytest.mark.asyncio
+    async def test_streams_deltas_then_final_response(
+        self,
+        app: FastAPI,
+        client: AsyncClient,
+        conversations: _FakeConversationService,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr("src.main.SharePointQAAgent", _FakeAgent)
+        user = User(user_id="sse-user", display_name="SSE", email="sse@test.com", tenant_id="t")
+
+        with override_dependency(app, get_current_user, lambda: user):
+            resp = await client.post(
+                "/chat", json={"message": "What is the leave policy?"}, headers=_SSE_HEADERS
+            )
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        frames = _frames(resp.text)
+        assert frames[:2] == [{"delta": "Leave is "}, {"delta": "25 days."}]
+
+        final = frames[2]
+        assert final["conversation_id"]
+        assert final["message"]["role"] == "assistant"
+        assert final["message"]["content"] == "Leave is 25 days."
+        assert final["message"]["source_references"][0]["document_title"] == "Leave Policy"
+        assert len(frames) == 3
+
+        # Both sides of the exchange are persisted
+        assert [(m.role, m.content) for m in conversations.messages] == [
+            ("user", "What is the leave policy?"),
+            ("assistant", "Leave is 25 days."),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_agent_failure_ends_stream_with_error_frame(
+        self,
+        app: FastAPI,
+        client: AsyncClient,
+        conversations: _FakeConversationService,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr("src.main.SharePointQAAgent", _FailingAgent)
+        user = User(user_id="sse-user-2", display_name="SSE", email="sse@test.com", tenant_id="t")
+
+        with override_dependency(app, get_current_user, lambda: user):
+            resp = await client.post(
+                "/chat", json={"message": "What is the leave policy?"}, headers=_SSE_HEADERS
+            )
+
+        frames = _frames(resp.text)
+        assert frames[0] == {"delta": "Leave is "}
+        assert frames[-1]["error"] == "service_unavailable"
+        assert [m.role for m in conversations.messages] == ["user"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("headers", [_SSE_HEADERS, {}], ids=["sse", "json"])
+    async def test_indexer_search_service_is_closed(
+        self,
+        app: FastAPI,
+        client: AsyncClient,
+        conversations: _FakeConversationService,
+        monkeypatch: pytest.MonkeyPatch,
+        headers: dict[str, str],
+    ) -> None:
+        auth_service = MagicMock()
+        auth_service.get_search_token = AsyncMock(return_value="obo-token")
+        monkeypatch.setattr(app.state, "auth_service", auth_service)
+        monkeypatch.setattr("src.main.SharePointQAAgent", _FakeAgent)
+        monkeypatch.setattr("src.main.IndexerSearchService", _FakeIndexerSearchService)
+        monkeypatch.setattr("src.main.get_search_transport", lambda: None)
+        monkeypatch.setattr(_FakeIndexerSearchService, "instances", [])
+        user = User(user_id="sse-user-3", display_name="SSE", email="sse@test.com", tenant_id="t")
+
+        with override_dependency(app, get_current_user, lambda: user):
+            resp = await client.post(
+                "/chat",
+                json={"message": "What is the leave policy?", "search_approach": "indexer"},
+                headers=headers,
+            )
+
+        assert resp.status_code == 200
+        [service] = _FakeIndexerSearchService.instances
+        assert service.closed
+
+    @pytest.mark.asyncio
+    async def test_search_service_closed_when_client_leaves_before_body(
+        self,
+        app: FastAPI,
+        conversations: _FakeConversationService,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        auth_service = MagicMock()
+        auth_service.get_search_token = AsyncMock(return_value="obo-token")
+        monkeypatch.setattr(app.state, "auth_service", auth_service)
+        monkeypatch.setattr("src.main.SharePointQAAgent", _FakeAgent)
+        monkeypatch.setattr("src.main.IndexerSearchService", _FakeIndexerSearchService)
+        monkeypatch.setattr("src.main.get_search_transport", lambda: None)
+        monkeypatch.setattr(_FakeIndexerSearchService, "instances", [])
+        user = User(user_id="sse-user-4", display_name="SSE", email="sse@test.com", tenant_id="t")
+        body = json.dumps({"message": "Leave policy?", "search_approach": "indexer"}).encode()
+        messages = iter([{"type": "http.request", "body": body, "more_body": False}])
+        sent: list[dict[str, Any]] = []
+
+        async def receive() -> dict[str, Any]:
+            # The client is gone as soon as the request has been read
+            return next(messages, {"type": "http.disconnect"})
+
+        async def send(message: dict[str, Any]) -> None:
+            await asyncio.sleep(0)  # a real server yields to the loop on every write
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": "/chat",
+            "raw_path": b"/chat",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [
+                (b"host", b"test"),
+                (b"accept", b"text/event-stream"),
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+            "client": ("127.0.0.1", 123),
+            "server": ("test", 80),
+        }
+
+        with override_dependency(app, get_current_user, lambda: user):
+            await app(scope, receive, send)
+
+        assert not any(m.get("body") for m in sent)  # no event was streamed
+        [service] = _FakeIndexerSearchService.instances
+        assert service.closed
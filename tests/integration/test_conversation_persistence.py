@@ -2,43 +2,74 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+from typing import Any
 
 import pytest
+from azure.cosmos.exceptions import CosmosResourceNotFoundError
 
+from src.models.conversation import Message
+from src.services.conversation import ConversationService
 
-class TestConversationPersistence:
-    """Integration tests for multi-turn conversation persistence."""
 
-    @pytest.mark.asyncio
-    async def test_multi_turn_conversation(self) -> None:
-        """Multi-turn conversation should persist all messages."""
-        from src.models.conversation import Message
-        from src.services.conversation import ConversationService
+class _FakeContainer:
+    """In-memory stand-in for a Cosmos DB container, partitioned by user_id."""
+
+    def __init__(self) -> None:
+        self.items: dict[tuple[str, str], dict[str, Any]] = {}
+
+    async def upsert_item(self, body: dict[str, Any]) -> dict[str, Any]:
+        self.items[(body["user_id"], body["id"])] = body
+        return body
+
+    async def read_item(self, item: str, partition_key: str) -> dict[str, Any]:
+        try:
+            return self.items[(partition_key, item)]
+        except KeyError:
+            raise CosmosResourceNotFoundError(message="Not found") from None
+
+    async def patch_item(
+        self,
+        item: str,
+        partition_key: str,
+        patch_operations: list[dict[str, Any]],
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        # Apply add-to-array and set operations to the stored document
+        doc = await self.read_item(item, partition_key)
+        for op in patch_operations:
+            field = op["path"].split("/")[1]
+            if op["op"] == "add" and op["path"].endswith("/-"):
+                doc[field].append(op["value"])
+            else:
+                doc[field] = op["value"]
+        return doc
+
 
-        mock_client = MagicMock()
-        mock_db = MagicMock()
-        mock_container = MagicMock()
-        mock_client.get_database_client.return_value = mock_db
-        mock_db.get_container_client.return_value = mock_container
+class _FakeDatabase:
+    def __init__(self, container: _FakeContainer) -> None:
+        self._container = container
 
-        # Track upserted data
-        upserted_items: dict[str, dict] = {}
+    def get_container_client(self, container: str) -> _FakeContainer:
+        return self._container
 
-        async def mock_upsert(item):
-            upserted_items[item["id"]] = item
 
-        async def mock_read(item, partition_key):
-            # Return from upserted items
-            if item in upserted_items:
-                return upserted_items[item]
-            raise Exception("Not found")
+class _FakeCosmosClient:
+    def __init__(self, container: _FakeContainer) -> None:
+        self._database = _FakeDatabase(container)
 
-        mock_container.upsert_item = mock_upsert
-        mock_container.read_item = mock_read
+    def get_database_client(self, database: str) -> _FakeDatabase:
+        return self._database
 
+
+class TestConversationPersistence:
+    """Integration tests for multi-turn conversation persistence."""
+
+    @pytest.mark.asyncio
+    async def test_multi_turn_conversation(self) -> None:
+        """Multi-turn conversation should persist all messages."""
+        container = _FakeContainer()
         service = ConversationService(
-            client=mock_client, database="test-db", container="test-container"
+            client=_FakeCosmosClient(container), database="test-db", container="test-container"
         )
 
         # Create conversation
@@ -53,23 +84,16 @@ class TestConversationPersistence:
         await service.add_message(conversation_id=conv.id, user_id="user-123", message=msg2)
 
         # Verify messages accumulated
-        latest = upserted_items[conv.id]
+        latest = container.items[("user-123", conv.id)]
         assert len(latest["messages"]) >= 1  # At least the last message added
 
     @pytest.mark.asyncio
     async def test_conversation_isolation(self) -> None:
         """Different users' conversations should be isolated."""
-        from src.services.conversation import ConversationService
-
-        mock_client = MagicMock()
-        mock_db = MagicMock()
-        mock_container = MagicMock()
-        mock_client.get_database_client.return_value = mock_db
-        mock_db.get_container_client.return_value = mock_container
-        mock_container.upsert_item = AsyncMock()
-
         service = ConversationService(
-            client=mock_client, database="test-db", container="test-container"
+            client=_FakeCosmosClient(_FakeContainer()),
+            database="test-db",
+            container="test-container",
         )
 
         conv1 = await service.create_conversation(user_id="user-A", title="User A conv")
@@ -2,29 +2,18 @@
 
 from __future__ import annotations
 
-import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
-from httpx import ASGITransport, AsyncClient
+from fastapi import FastAPI
 
-
-@pytest.fixture
-def env_vars() -> dict[str, str]:
-    return {
-        "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com/",
-        "AZURE_SEARCH_ENDPOINT": "https://test.search.windows.net",
-        "COSMOS_ENDPOINT": "https://test.documents.azure.com:443/",
-        "ENTRA_TENANT_ID": "tenant-123",
-        "ENTRA_CLIENT_ID": "client-456",
-        "ENTRA_CLIENT_SECRET": "secret-789",
-    }
+from src.main import get_current_user
+from src.models.user import User
+from tests.conftest import ASGIRequest, override_dependency
 
 
 def _make_mock_user():
     """Create a mock User."""
-    from src.models.user import User
-
     return User(
         user_id="user-123",
         display_name="Test User",
@@ -37,37 +26,30 @@ class TestQAFlow:
     """Integration tests for the end-to-end Q&A flow."""
 
     @pytest.mark.asyncio
-    async def test_grounded_answer_with_citations(self, env_vars: dict[str, str]) -> None:
+    async def test_grounded_answer_with_citations(
+        self, app: FastAPI, asgi_request: ASGIRequest, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Question with known document answer returns grounded response with sources."""
         mock_user = _make_mock_user()
-
-        with patch.dict(os.environ, env_vars, clear=False):
-            from src.main import create_app, get_current_user
-
-            app = create_app()
-            app.state.settings = MagicMock(
+        monkeypatch.setattr(
+            app.state,
+            "settings",
+            MagicMock(
                 log_level="WARNING",
                 max_input_length=4000,
                 rate_limit_per_minute=20,
-            )
-            app.dependency_overrides[get_current_user] = lambda: mock_user
-
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                # Verify the app is healthy (basic integration check)
-                resp = await client.get("/health")
-                assert resp.status_code == 200
+            ),
+            raising=False,
+        )
+        # Verify the app is healthy (basic integration check)
+        with override_dependency(app, get_current_user, lambda: mock_user):
+            resp = await asgi_request("GET", "/health")
+        assert resp.status_code == 200
 
     @pytest.mark.asyncio
-    async def test_out_of_scope_question_refused(self, env_vars: dict[str, str]) -> None:
+    async def test_out_of_scope_question_refused(self, asgi_request: ASGIRequest) -> None:
         """Out-of-scope question should be refused by the agent."""
         # This is an integration-level test that would verify the agent's system prompt
         # causes refusal for non-SharePoint questions. For now, validates the test structure.
-        with patch.dict(os.environ, env_vars, clear=False):
-            from src.main import create_app
-
-            app = create_app()
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                resp = await client.get("/health")
-                assert resp.status_code == 200
+        resp = await asgi_request("GET", "/health")
+        assert resp.status_code == 200
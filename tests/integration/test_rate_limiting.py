@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
+from fastapi import FastAPI, Request
 from httpx import ASGITransport, AsyncClient
 
+from src.main import get_current_user
 from src.models.user import User
+from tests.conftest import override_dependency
+
+# Both tests share one app (and rate limiter); keep them on one xdist worker
+pytestmark = pytest.mark.xdist_group("rate_limit")
 
 
 def _make_user(user_id: str = "user-rate-test") -> User:
@@ -17,101 +25,59 @@ def _make_user(user_id: str = "user-rate-test") -> User:
     )
 
 
-def _mock_settings():
-    """Return a Settings-like object with dummy values for testing."""
-    from unittest.mock import MagicMock
-
-    s = MagicMock()
-    s.log_level = "WARNING"
-    s.max_input_length = 4000
-    s.rate_limit_per_minute = 20
-    s.azure_openai_endpoint = "https://fake.openai.azure.com"
-    s.azure_openai_deployment = "gpt-4o"
-    s.azure_openai_api_version = "2024-06-01"
-    s.azure_openai_embedding_deployment = "text-embedding-3-small"
-    s.azure_search_endpoint = "https://fake.search.windows.net"
-    s.azure_search_index_name = "test-index"
-    s.cosmos_endpoint = "https://fake.documents.azure.com"
-    s.cosmos_database = "test-db"
-    s.cosmos_container = "test-container"
-    s.entra_tenant_id = "fake-tenant"
-    s.entra_client_id = "fake-client"
-    s.entra_client_secret = "fake-secret"
-    return s
-
-
-def _create_test_app():
-    """Create a test app with mock settings."""
-    from src.main import create_app
-
-    app = create_app()
-    app.state.settings = _mock_settings()
-    return app
-
-
 class TestRateLimiting:
     """Rate-limiting integration tests against the FastAPI app."""
 
     @pytest.mark.asyncio
-    async def test_rate_limit_returns_429(self) -> None:
+    async def test_rate_limit_returns_429(self, module_app: FastAPI) -> None:
         """Exceeding rate limit returns 429 with rate_limit_exceeded error."""
-        from src.main import get_current_user
+        app = module_app
 
-        app = _create_test_app()
-        app.dependency_overrides[get_current_user] = lambda: _make_user("user-rate-test")
+        # Use up the user's budget directly; the limiter itself is unit-tested
+        for _ in range(20):
+            await app.state.rate_limiter.check_rate_limit("user-rate-test")
 
+        user = _make_user("user-rate-test")
         transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            # Fire 21 requests (limit=20)
-            responses = []
-            for _ in range(21):
-                resp = await client.post(
-                    "/chat",
-                    json={"message": "test question?"},
-                )
-                responses.append(resp)
+        with override_dependency(app, get_current_user, lambda: user):
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                resp = await client.post("/chat", json={"message": "test question?"})
 
-            status_codes = [r.status_code for r in responses]
-            assert 429 in status_codes, f"Expected at least one 429; got {set(status_codes)}"
+        assert resp.status_code == 429
 
-            # Verify 429 body has correct error code
-            rate_limited = [r for r in responses if r.status_code == 429]
-            body = rate_limited[0].json()
-            error_data = body.get("detail", body)
-            assert error_data.get("error") == "rate_limit_exceeded"
+        # Verify 429 body has correct error code
+        body = resp.json()
+        error_data = body.get("detail", body)
+        assert error_data.get("error") == "rate_limit_exceeded"
 
     @pytest.mark.asyncio
-    async def test_different_users_independent_limits(self) -> None:
+    async def test_different_users_independent_limits(self, module_app: FastAPI) -> None:
         """Different users should have independent rate limits."""
-        from src.main import get_current_user
-
-        app = _create_test_app()
-
-        call_count = 0
-        user_pool = [_make_user(f"user-{i}") for i in range(2)]
-
-        def rotating_user() -> User:
-            nonlocal call_count
-            user = user_pool[call_count % 2]
-            call_count += 1
-            return user
+        app = module_app
+        users = {f"user-{i}": _make_user(f"user-{i}") for i in range(2)}
 
-        app.dependency_overrides[get_current_user] = rotating_user
+        def user_from_header(request: Request) -> User:
+            # Overrides are app-wide, so the identity travels with each request
+            return users[request.headers["x-test-user"]]
 
         transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            # Each user sends 20 requests (within limit)
-            # Total 40 requests alternating between 2 users
-            responses = []
-            for _ in range(40):
-                resp = await client.post(
-                    "/chat",
-                    json={"message": "test question?"},
+        with override_dependency(app, get_current_user, user_from_header):
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                # Each user sends 20 concurrent requests (within limit)
+                responses = await asyncio.gather(
+                    *(
+                        client.post(
+                            "/chat",
+                            json={"message": "test question?"},
+                            headers={"X-Test-User": user_id},
+                        )
+                        for user_id in users
+                        for _ in range(20)
+                    )
                 )
-                responses.append(resp)
 
-            # None should be rate-limited; both users are at exactly 20
-            status_codes = [r.status_code for r in responses]
-            assert 429 not in status_codes, (
-                f"No user should be rate-limited; got {status_codes.count(429)} 429s"
-            )
+        # None should be rate-limited; both users are at exactly 20
+        status_codes = [r.status_code for r in responses]
+        assert 429 not in status_codes, (
+            f"No user should be rate-limited; got {status_codes.count(429)} 429s"
+        )
@@ -2,51 +2,87 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 import time
+from collections.abc import Callable, Iterator
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import jwt
 import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
 
 from src.models.user import User
 from src.services.auth import AuthService
 
+# Valid claims except "exp", which must be relative to the current time
+_VALID_CLAIMS_BASE: dict[str, Any] = {
+    "oid": "user-abc-123",
+    "name": "Jane Doe",
+    "preferred_username": "jane@contoso.com",
+    "tid": "tenant-123",
+    "aud": "client-456",
+    "iss": "https://login.microsoftonline.com/tenant-123/v2.0",
+}
+
+
+def _valid_token_payload() -> dict:
+    """Create a valid JWT payload (a fresh dict each call)."""
+    return {**_VALID_CLAIMS_BASE, "exp": int(time.time()) + 3600}
+
+
+@pytest.fixture(scope="class")
+def mock_settings() -> MagicMock:
+    settings = MagicMock()
+    settings.entra_tenant_id = "tenant-123"
+    settings.entra_client_id = "client-456"
+    settings.entra_client_secret = "secret-789"
+    return settings
+
+
+@pytest.fixture(scope="class")
+def auth_service(mock_settings: MagicMock) -> AuthService:
+    """One AuthService per test class; ``TestAuthService._reset`` cleans up after each test."""
+    with patch("src.services.auth.msal.ConfidentialClientApplication"):
+        service = AuthService(mock_settings)
+    return service
+
 
 class TestAuthService:
     """Tests for AuthService class."""
 
-    @pytest.fixture
-    def mock_settings(self) -> MagicMock:
-        settings = MagicMock()
-        settings.entra_tenant_id = "tenant-123"
-        settings.entra_client_id = "client-456"
-        settings.entra_client_secret = "secret-789"
-        return settings
-
-    def _make_valid_token_payload(self) -> dict:
-        """Create a valid JWT payload."""
-        return {
-            "oid": "user-abc-123",
-            "name": "Jane Doe",
-            "preferred_username": "jane@contoso.com",
-            "tid": "tenant-123",
-            "aud": "client-456",
-            "iss": "https://login.microsoftonline.com/tenant-123/v2.0",
-            "exp": int(time.time()) + 3600,
-        }
-
-    @pytest.fixture
-    def auth_service(self, mock_settings: MagicMock) -> AuthService:
-        with patch("src.services.auth.msal.ConfidentialClientApplication"):
-            service = AuthService(mock_settings)
-        return service
+    @pytest.fixture(autouse=True)
+    def _reset(self, auth_service: Any) -> Iterator[None]:
+        """Undo per-test state on the shared service."""
+        jwks_client = auth_service._jwks_client
+        yield
+        auth_service._jwks_client = jwks_client
+        auth_service._token_cache.clear()
+        auth_service._obo_inflight.clear()
+        auth_service._msal_app.reset_mock(return_value=True)
 
     @pytest.mark.asyncio
-    async def test_validate_token_returns_user(self, auth_service: Any) -> None:
-        """Valid token should return a User object."""
-        payload = self._make_valid_token_payload()
+    @pytest.mark.parametrize(
+        ("mutate", "match"),
+        [
+            (lambda p: p, None),
+            (lambda p: {**p, "exp": int(time.time()) - 100}, "expired|token"),
+            (lambda p: {**p, "aud": "wrong-audience"}, "audience|aud"),
+        ],
+        ids=["valid", "expired", "wrong-audience"],
+    )
+    async def test_validate_token_claims(
+        self, auth_service: Any, mutate: Callable[[dict], dict], match: str | None
+    ) -> None:
+        """Valid claims should return a User; expired or wrong-audience ones should raise."""
+        payload = mutate(_valid_token_payload())
 
         with patch.object(auth_service, "_decode_token", return_value=payload):
+            if match is not None:
+                with pytest.raises(ValueError, match=match):
+                    await auth_service.validate_token("Bearer fake.jwt.token")
+                return
             user = await auth_service.validate_token("Bearer fake.jwt.token")
 
         assert isinstance(user, User)
@@ -56,28 +92,68 @@ class TestAuthService:
         assert user.tenant_id == "tenant-123"
 
     @pytest.mark.asyncio
-    async def test_validate_token_expired_raises(self, auth_service: Any) -> None:
-        """Expired token should raise an error."""
-        payload = self._make_valid_token_payload()
-        payload["exp"] = int(time.time()) - 100  # expired
+    async def test_validate_token_verifies_signature(self, auth_service: Any) -> None:
+        """A token signed with the tenant key should validate end to end."""
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        token = jwt.encode(_valid_token_payload(), key, algorithm="RS256")
+        auth_service._jwks_client = MagicMock()
+        auth_service._jwks_client.get_signing_key_from_jwt.return_value.key = key.public_key()
+
+        user = await auth_service.validate_token(f"Bearer {token}")
+
+        assert user.user_id == "user-abc-123"
+
+    @pytest.mark.asyncio
+    async def test_validate_token_bad_signature_raises(self, auth_service: Any) -> None:
+        """A token signed with a different key should be rejected."""
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        other_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        token = jwt.encode(_valid_token_payload(), other_key, algorithm="RS256")
+        auth_service._jwks_client = MagicMock()
+        auth_service._jwks_client.get_signing_key_from_jwt.return_value.key = key.public_key()
+
+        with pytest.raises(ValueError, match="Invalid token"):
+            await auth_service.validate_token(f"Bearer {token}")
+
+    @pytest.mark.asyncio
+    async def test_token_is_decoded_off_the_event_loop(self, auth_service: Any) -> None:
+        """The JWKS lookup can block on network I/O, so decoding runs in a worker thread."""
+        loop_thread = threading.get_ident()
+        decode_threads: list[int] = []
+
+        def decode(token: str) -> dict:
+            decode_threads.append(threading.get_ident())
+            return _valid_token_payload()
+
+        with patch.object(auth_service, "_decode_token", side_effect=decode):
+            await auth_service.validate_token("Bearer fake.jwt.token")
+
+        assert decode_threads and decode_threads[0] != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_validated_token_is_cached(self, auth_service: Any) -> None:
+        """A repeat of a validated token should skip decoding."""
+        payload = _valid_token_payload()
 
-        with (
-            patch.object(auth_service, "_decode_token", return_value=payload),
-            pytest.raises(Exception, match="expired|token"),
-        ):
-            await auth_service.validate_token("Bearer expired.jwt.token")
+        with patch.object(auth_service, "_decode_token", return_value=payload) as decode:
+            first = await auth_service.validate_token("Bearer fake.jwt.token")
+            second = await auth_service.validate_token("Bearer fake.jwt.token")
+
+        assert second is first
+        decode.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_validate_token_wrong_audience_raises(self, auth_service: Any) -> None:
-        """Token with wrong audience should raise an error."""
-        payload = self._make_valid_token_payload()
+    async def test_rejected_token_is_not_cached(self, auth_service: Any) -> None:
+        """A token that failed validation should be re-checked every time."""
+        payload = _valid_token_payload()
         payload["aud"] = "wrong-audience"
 
-        with (
-            patch.object(auth_service, "_decode_token", return_value=payload),
-            pytest.raises(Exception, match="audience|aud"),
-        ):
-            await auth_service.validate_token("Bearer wrong-aud.jwt.token")
+        with patch.object(auth_service, "_decode_token", return_value=payload) as decode:
+            for _ in range(2):
+                with pytest.raises(ValueError):
+                    await auth_service.validate_token("Bearer wrong-aud.jwt.token")
+
+        assert decode.call_count == 2
 
     @pytest.mark.asyncio
     async def test_get_graph_token_obo_flow(self, auth_service: Any) -> None:
@@ -97,12 +173,37 @@ class TestAuthService:
         }
         auth_service._msal_app.acquire_token_on_behalf_of.return_value = mock_result
 
-        with pytest.raises(Exception, match="Token exchange|OBO|failed"):
+        with pytest.raises(RuntimeError, match="Token exchange failed"):
             await auth_service.get_graph_token("bad-user-assertion")
 
+    @pytest.mark.asyncio
+    async def test_concurrent_obo_requests_share_one_exchange(self, auth_service: Any) -> None:
+        """Concurrent OBO calls for the same assertion should hit MSAL once."""
+        auth_service._msal_app.acquire_token_on_behalf_of.return_value = {
+            "access_token": "graph-token-xyz"
+        }
+
+        tokens = await asyncio.gather(
+            *(auth_service.get_graph_token("user-assertion-token") for _ in range(3))
+        )
+
+        assert tokens == ["graph-token-xyz"] * 3
+        assert auth_service._msal_app.acquire_token_on_behalf_of.call_count == 1
+
+    def test_msal_cache_path_enables_persisted_token_cache(
+        self, mock_settings: MagicMock, tmp_path: Any
+    ) -> None:
+        """A cache path should back MSAL with a file-persisted token cache."""
+        from msal_extensions import PersistedTokenCache
+
+        with patch("src.services.auth.msal.ConfidentialClientApplication") as app_cls:
+            AuthService(mock_settings, msal_cache_path=str(tmp_path / "msal.json"))
+
+        assert isinstance(app_cls.call_args.kwargs["token_cache"], PersistedTokenCache)
+
     def test_extract_user_from_claims(self, auth_service: Any) -> None:
         """Extract User from JWT claims."""
-        claims = self._make_valid_token_payload()
+        claims = _valid_token_payload()
         user = auth_service.extract_user(claims)
 
         assert user.user_id == "user-abc-123"
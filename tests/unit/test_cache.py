@@ -0,0 +1,159 @@
+"""Unit tests for the in-process TTL/LRU caches."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from autogen_agentchat.messages import TextMessage
+
+from src.models.document import SearchResult
+from src.services.cache import (
+    AnswerCache,
+    HistoryMessageCache,
+    SearchResultCache,
+    SemanticAnswerCache,
+    TTLCache,
+    make_cache_key,
+    normalize_question,
+)
+
+
+class TestMakeCacheKey:
+    """Tests for make_cache_key."""
+
+    def test_key_is_stable(self) -> None:
+        assert make_cache_key("q", "user-1", ["g1"]) == make_cache_key("q", "user-1", ["g1"])
+
+    def test_key_differs_per_user(self) -> None:
+        assert make_cache_key("q", "user-1", []) != make_cache_key("q", "user-2", [])
+
+
+class TestNormalizeQuestion:
+    """Tests for normalize_question."""
+
+    def test_case_whitespace_and_punctuation_are_ignored(self) -> None:
+        assert normalize_question("  What is   the PTO policy? ") == "what is the pto policy"
+
+    def test_leading_filler_is_stripped(self) -> None:
+        assert normalize_question("Please list the holidays.") == "list the holidays"
+        assert normalize_question("Can you list the holidays") == "list the holidays"
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_missing_returns_none(self) -> None:
+        cache: TTLCache[str] = TTLCache()
+        assert cache.get("missing") is None
+        assert cache.misses == 1
+
+    def test_set_then_get(self) -> None:
+        cache: TTLCache[str] = TTLCache()
+        cache.set("k", "v")
+        assert cache.get("k") == "v"
+        assert cache.hits == 1
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache: TTLCache[int] = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_entries_expire_after_ttl(self) -> None:
+        cache: TTLCache[str] = TTLCache(ttl=10)
+        with patch("src.services.cache.time.monotonic", return_value=1000.0):
+            cache.set("k", "v")
+        with patch("src.services.cache.time.monotonic", return_value=1011.0):
+            assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_per_entry_ttl_overrides_default(self) -> None:
+        cache: TTLCache[str] = TTLCache(ttl=60)
+        with patch("src.services.cache.time.monotonic", return_value=1000.0):
+            cache.set("k", "v", ttl=5)
+        with patch("src.services.cache.time.monotonic", return_value=1006.0):
+            assert cache.get("k") is None
+
+
+class TestAnswerCache:
+    """Tests for AnswerCache."""
+
+    def test_stores_answer_dicts(self) -> None:
+        cache = AnswerCache()
+        answer = {"content": "25 days", "source_references": [], "was_refused": False}
+        cache.set("key", answer)
+        assert cache.get("key") == answer
+
+
+class TestSearchResultCache:
+    """Tests for SearchResultCache."""
+
+    def test_stores_search_results(self) -> None:
+        cache = SearchResultCache()
+        results = [
+            SearchResult(
+                chunk_id="chunk-1",
+                document_title="Policy",
+                content="Employees receive 25 days.",
+                source_url="https://contoso.sharepoint.com/policy.docx",
+                file_type="docx",
+                last_modified=datetime(2024, 1, 1, tzinfo=UTC),
+                relevance_score=0.9,
+            )
+        ]
+        cache.set("key", results)
+        assert cache.get("key") == results
+
+
+class TestHistoryMessageCache:
+    """Tests for HistoryMessageCache."""
+
+    def test_stores_message_lists(self) -> None:
+        cache = HistoryMessageCache()
+        messages = [TextMessage(content="Hi", source="user")]
+        cache.set("key", messages)
+        assert cache.get("key") is messages
+
+
+class TestSemanticAnswerCache:
+    """Tests for SemanticAnswerCache."""
+
+    def test_similar_question_hits(self) -> None:
+        cache = SemanticAnswerCache(threshold=0.9)
+        cache.insert([1.0, 0.0, 0.0], "scope", "ctx", {"content": "cached"})
+
+        assert cache.lookup([0.99, 0.05, 0.0], "scope", "ctx") == {"content": "cached"}
+
+    def test_dissimilar_question_misses(self) -> None:
+        cache = SemanticAnswerCache(threshold=0.9)
+        cache.insert([1.0, 0.0, 0.0], "scope", "ctx", {"content": "cached"})
+
+        assert cache.lookup([0.0, 1.0, 0.0], "scope", "ctx") is None
+
+    def test_lookup_is_scoped(self) -> None:
+        cache = SemanticAnswerCache()
+        cache.insert([1.0, 0.0], "user-a", "ctx", {"content": "for A"})
+
+        assert cache.lookup([1.0, 0.0], "user-b", "ctx") is None
+
+    def test_conversation_context_must_match(self) -> None:
+        cache = SemanticAnswerCache()
+        cache.insert([1.0, 0.0], "scope", "turn-1", {"content": "cached"})
+
+        assert cache.lookup([1.0, 0.0], "scope", "turn-2") is None
+
+    def test_evicts_oldest_entries(self) -> None:
+        cache = SemanticAnswerCache(max_entries=2)
+        cache.insert([1.0, 0.0], "scope-a", "", {"content": "a"})
+        cache.insert([1.0, 0.0], "scope-b", "", {"content": "b"})
+        cache.insert([1.0, 0.0], "scope-c", "", {"content": "c"})
+
+        assert len(cache) == 2
+        assert cache.lookup([1.0, 0.0], "scope-a", "") is None
+        assert cache.lookup([1.0, 0.0], "scope-c", "") == {"content": "c"}
@@ -10,34 +10,55 @@ from pydantic import ValidationError
 
 from src.config import Settings, get_settings
 
+# A complete set of required (and some optional) environment variables
+_ENV_VARS: dict[str, str] = {
+    "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com/",
+    "AZURE_OPENAI_DEPLOYMENT": "gpt-4o",
+    "AZURE_OPENAI_EMBEDDING_DEPLOYMENT": "text-embedding-3-small",
+    "AZURE_OPENAI_API_VERSION": "2024-06-01",
+    "AZURE_SEARCH_ENDPOINT": "https://test.search.windows.net",
+    "AZURE_SEARCH_INDEX_NAME": "test-index",
+    "COSMOS_ENDPOINT": "https://test.documents.azure.com:443/",
+    "COSMOS_DATABASE": "test-db",
+    "COSMOS_CONTAINER": "test-container",
+    "ENTRA_TENANT_ID": "tenant-123",
+    "ENTRA_CLIENT_ID": "client-456",
+    "ENTRA_CLIENT_SECRET": "secret-789",
+    "LOG_LEVEL": "DEBUG",
+    "MAX_INPUT_LENGTH": "5000",
+    "RATE_LIMIT_PER_MINUTE": "30",
+}
+
+# Only the required variables, so everything else takes its default
+_MINIMAL_ENV_VARS: dict[str, str] = {
+    "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com/",
+    "AZURE_SEARCH_ENDPOINT": "https://test.search.windows.net",
+    "COSMOS_ENDPOINT": "https://test.documents.azure.com:443/",
+    "ENTRA_TENANT_ID": "t",
+    "ENTRA_CLIENT_ID": "c",
+    "ENTRA_CLIENT_SECRET": "s",
+}
+
+
+@pytest.fixture(scope="module")
+def full_settings() -> Settings:
+    """Settings built once from ``_ENV_VARS``; tests only read it."""
+    with patch.dict(os.environ, _ENV_VARS, clear=False):
+        return Settings()  # type: ignore[call-arg]
+
+
+@pytest.fixture(scope="module")
+def minimal_settings() -> Settings:
+    """Settings built once from ``_MINIMAL_ENV_VARS``; tests only read it."""
+    with patch.dict(os.environ, _MINIMAL_ENV_VARS, clear=False):
+        return Settings()  # type: ignore[call-arg]
+
 
 class TestSettings:
     """Tests for the Settings configuration model."""
 
-    def _env_vars(self) -> dict[str, str]:
-        """Return a complete set of required environment variables."""
-        return {
-            "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com/",
-            "AZURE_OPENAI_DEPLOYMENT": "gpt-4o",
-            "AZURE_OPENAI_EMBEDDING_DEPLOYMENT": "text-embedding-3-small",
-            "AZURE_OPENAI_API_VERSION": "2024-06-01",
-            "AZURE_SEARCH_ENDPOINT": "https://test.search.windows.net",
-            "AZURE_SEARCH_INDEX_NAME": "test-index",
-            "COSMOS_ENDPOINT": "https://test.documents.azure.com:443/",
-            "COSMOS_DATABASE": "test-db",
-            "COSMOS_CONTAINER": "test-container",
-            "ENTRA_TENANT_ID": "tenant-123",
-            "ENTRA_CLIENT_ID": "client-456",
-            "ENTRA_CLIENT_SECRET": "secret-789",
-            "LOG_LEVEL": "DEBUG",
-            "MAX_INPUT_LENGTH": "5000",
-            "RATE_LIMIT_PER_MINUTE": "30",
-        }
-
-    def test_settings_loads_all_env_vars(self) -> None:
-        env = self._env_vars()
-        with patch.dict(os.environ, env, clear=False):
-            settings = Settings()  # type: ignore[call-arg]
+    def test_settings_loads_all_env_vars(self, full_settings: Settings) -> None:
+        settings = full_settings
 
         assert settings.azure_openai_endpoint == "https://test.openai.azure.com/"
         assert settings.azure_search_endpoint == "https://test.search.windows.net"
@@ -49,17 +70,8 @@ class TestSettings:
         assert settings.max_input_length == 5000
         assert settings.rate_limit_per_minute == 30
 
-    def test_settings_uses_defaults(self) -> None:
-        minimal = {
-            "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com/",
-            "AZURE_SEARCH_ENDPOINT": "https://test.search.windows.net",
-            "COSMOS_ENDPOINT": "https://test.documents.azure.com:443/",
-            "ENTRA_TENANT_ID": "t",
-            "ENTRA_CLIENT_ID": "c",
-            "ENTRA_CLIENT_SECRET": "s",
-        }
-        with patch.dict(os.environ, minimal, clear=False):
-            settings = Settings()  # type: ignore[call-arg]
+    def test_settings_uses_defaults(self, minimal_settings: Settings) -> None:
+        settings = minimal_settings
 
         assert settings.azure_openai_deployment == "gpt-4o"
         assert settings.azure_search_index_name == "sharepoint-docs-index"
@@ -73,8 +85,14 @@ class TestSettings:
             Settings()  # type: ignore[call-arg]
 
     def test_get_settings_returns_instance(self) -> None:
-        env = self._env_vars()
-        with patch.dict(os.environ, env, clear=False):
+        get_settings.cache_clear()
+        with patch.dict(os.environ, _ENV_VARS, clear=False):
             settings = get_settings()
 
         assert isinstance(settings, Settings)
+
+    def test_get_settings_is_cached(self) -> None:
+        get_settings.cache_clear()
+        with patch.dict(os.environ, _ENV_VARS, clear=False):
+            assert get_settings() is get_settings()
+        get_settings.cache_clear()
@@ -2,36 +2,100 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Callable
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, call
 
 import pytest
 
+from src.models.conversation import Conversation, Message
+from src.services.conversation import MAX_PATCH_OPERATIONS, ConversationService
+
+
+class _AsyncReturn:
+    """Minimal async callable returning a fixed value and recording its calls.
+
+    Cheaper than ``AsyncMock`` where a test only needs a return value and
+    ``call_count`` / ``call_args``.
+    """
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+        self.calls: list[Any] = []
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append(call(*args, **kwargs))
+        return self.value
+
+    @property
+    def call_count(self) -> int:
+        return len(self.calls)
+
+    @property
+    def call_args(self) -> Any:
+        return self.calls[-1] if self.calls else None
+
+
+def _async_query(
+    items: list[Any], calls: list[dict[str, Any]]
+) -> Callable[..., AsyncIterator[Any]]:
+    """Build a ``query_items`` stand-in that yields ``items`` and records call kwargs."""
+
+    async def _query(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        calls.append(kwargs)
+        for item in items:
+            yield item
+
+    return _query
 
-class TestConversationService:
-    """Tests for ConversationService class."""
 
-    @pytest.fixture
-    def mock_cosmos_client(self) -> MagicMock:
-        """Create a mock Cosmos DB client."""
-        mock_client = MagicMock()
-        mock_db = MagicMock()
-        mock_container = MagicMock()
-        mock_client.get_database_client.return_value = mock_db
-        mock_db.get_container_client.return_value = mock_container
-        return mock_client
+_NOW_ISO = datetime.now(tz=UTC).isoformat()
 
-    @pytest.fixture
-    def mock_container(self, mock_cosmos_client: MagicMock) -> MagicMock:
-        return mock_cosmos_client.get_database_client().get_container_client()
+# Canonical stored conversation; tests copy it with {**_CONV_DATA, ...}
+_CONV_DATA: dict[str, Any] = {
+    "id": "conv-456",
+    "user_id": "user-123",
+    "title": "Test",
+    "messages": [],
+    "status": "active",
+    "created_at": _NOW_ISO,
+    "last_active_at": _NOW_ISO,
+    "ttl": 7776000,
+}
+
+# Container methods tests replace; reset to fresh mocks between tests
+_CONTAINER_METHODS = ("read_item", "upsert_item", "patch_item", "query_items")
+
+
+@pytest.fixture(scope="class")
+def mock_cosmos_client() -> MagicMock:
+    """Create a mock Cosmos DB client once per test class."""
+    mock_client = MagicMock()
+    mock_db = MagicMock()
+    mock_container = MagicMock()
+    mock_client.get_database_client.return_value = mock_db
+    mock_db.get_container_client.return_value = mock_container
+    return mock_client
+
+
+@pytest.fixture
+def mock_container(mock_cosmos_client: MagicMock) -> MagicMock:
+    """The shared container mock, with per-test methods reset."""
+    container = mock_cosmos_client.get_database_client().get_container_client()
+    for name in _CONTAINER_METHODS:
+        setattr(container, name, MagicMock())
+    return container
+
+
+class TestConversationService:
+    """Tests for ConversationService class."""
 
     @pytest.mark.asyncio
     async def test_create_conversation(
         self, mock_cosmos_client: MagicMock, mock_container: MagicMock
     ) -> None:
         """Creating a conversation should write to Cosmos DB."""
-        from src.services.conversation import ConversationService
-
         mock_container.upsert_item = AsyncMock()
 
         service = ConversationService(
@@ -50,19 +114,7 @@ class TestConversationService:
         self, mock_cosmos_client: MagicMock, mock_container: MagicMock
     ) -> None:
         """Getting a conversation should read from Cosmos DB."""
-        from src.services.conversation import ConversationService
-
-        conv_data = {
-            "id": "conv-456",
-            "user_id": "user-123",
-            "title": "Test",
-            "messages": [],
-            "status": "active",
-            "created_at": datetime.now(tz=UTC).isoformat(),
-            "last_active_at": datetime.now(tz=UTC).isoformat(),
-            "ttl": 7776000,
-        }
-        mock_container.read_item = AsyncMock(return_value=conv_data)
+        mock_container.read_item = _AsyncReturn(_CONV_DATA)
 
         service = ConversationService(
             client=mock_cosmos_client, database="test-db", container="test-container"
@@ -72,77 +124,120 @@ class TestConversationService:
         assert conv is not None
         assert conv.id == "conv-456"
         assert conv.user_id == "user-123"
-        mock_container.read_item.assert_called_once()
+        assert mock_container.read_item.call_count == 1
 
     @pytest.mark.asyncio
     async def test_add_message_resets_ttl(
         self, mock_cosmos_client: MagicMock, mock_container: MagicMock
     ) -> None:
-        """Adding a message should upsert (resetting TTL)."""
-        from src.models.conversation import Message
-        from src.services.conversation import ConversationService
-
-        conv_data = {
-            "id": "conv-456",
-            "user_id": "user-123",
-            "title": "Test",
-            "messages": [],
-            "status": "active",
-            "created_at": datetime.now(tz=UTC).isoformat(),
-            "last_active_at": datetime.now(tz=UTC).isoformat(),
-            "ttl": 7776000,
-        }
-        mock_container.read_item = AsyncMock(return_value=conv_data)
-        mock_container.upsert_item = AsyncMock()
+        """Adding a message should patch the document (resetting TTL)."""
+        message = Message(
+            role="user",
+            content="What is the leave policy?",
+        )
+        mock_container.patch_item = _AsyncReturn(None)
 
         service = ConversationService(
             client=mock_cosmos_client, database="test-db", container="test-container"
         )
 
-        message = Message(
-            role="user",
-            content="What is the leave policy?",
-        )
         await service.add_message(conversation_id="conv-456", user_id="user-123", message=message)
 
-        # Verify upsert was called (which resets TTL)
+        # Verify a single patch appended the message and reset the TTL
+        assert mock_container.patch_item.call_count == 1
+        kwargs = mock_container.patch_item.call_args.kwargs
+        operations = kwargs["patch_operations"]
+        assert {"op": "set", "path": "/ttl", "value": 7776000} in operations
+        assert [op["path"] for op in operations].count("/messages/-") == 1
+        assert kwargs["no_response"] is True
+
+    @pytest.mark.asyncio
+    async def test_add_messages_splits_patches_at_operation_limit(
+        self, mock_cosmos_client: MagicMock, mock_container: MagicMock
+    ) -> None:
+        """Long message lists should be appended in order across several patches."""
+        messages = [Message(role="user", content=f"Message {n}") for n in range(20)]
+        mock_container.patch_item = _AsyncReturn(None)
+
+        service = ConversationService(
+            client=mock_cosmos_client, database="test-db", container="test-container"
+        )
+
+        await service.add_messages(
+            conversation_id="conv-456", user_id="user-123", messages=messages
+        )
+
+        batches = [c.kwargs["patch_operations"] for c in mock_container.patch_item.calls]
+        assert len(batches) == 3
+        assert all(len(ops) <= MAX_PATCH_OPERATIONS for ops in batches)
+        assert all({"op": "set", "path": "/ttl", "value": 7776000} in ops for ops in batches)
+        appended = [op["value"]["content"] for ops in batches for op in ops if op["op"] == "add"]
+        assert appended == [m.content for m in messages]
+
+    @pytest.mark.asyncio
+    async def test_update_title_patches_only_title(
+        self, mock_cosmos_client: MagicMock, mock_container: MagicMock
+    ) -> None:
+        """Updating the title should patch the title without reading the document."""
+        mock_container.patch_item = AsyncMock(return_value={})
+        service = ConversationService(
+            client=mock_cosmos_client, database="test-db", container="test-container"
+        )
+
+        await service.update_title(conversation_id="conv-456", user_id="user-123", title="Leave")
+
+        mock_container.read_item.assert_not_called()
+        mock_container.upsert_item.assert_not_called()
+        assert mock_container.patch_item.call_args.kwargs["patch_operations"] == [
+            {"op": "set", "path": "/title", "value": "Leave"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_create_conversation_with_first_message(
+        self, mock_cosmos_client: MagicMock, mock_container: MagicMock
+    ) -> None:
+        """Initial messages should be written with the new document."""
+        mock_container.upsert_item = AsyncMock()
+
+        service = ConversationService(
+            client=mock_cosmos_client, database="test-db", container="test-container"
+        )
+        await service.create_conversation(
+            user_id="user-123",
+            title="New conversation",
+            messages=[Message(role="user", content="Hi")],
+        )
+
         mock_container.upsert_item.assert_called_once()
-        upserted_data = mock_container.upsert_item.call_args[0][0]
-        assert len(upserted_data["messages"]) == 1
+        assert len(mock_container.upsert_item.call_args[0][0]["messages"]) == 1
 
     @pytest.mark.asyncio
     async def test_list_conversations_scoped_by_user(
         self, mock_cosmos_client: MagicMock, mock_container: MagicMock
     ) -> None:
         """Listing conversations should be partition-scoped by user_id."""
-        from src.services.conversation import ConversationService
-
+        # Rows as returned by the list-view projection query
         mock_items = [
             {
                 "id": "conv-1",
                 "user_id": "user-123",
                 "title": "Conv 1",
-                "messages": [
+                "status": "active",
+                "created_at": _NOW_ISO,
+                "last_active_at": _NOW_ISO,
+                "message_count": 1,
+                "last_message": [
                     {
                         "id": "m1",
                         "role": "user",
                         "content": "Hi",
-                        "timestamp": datetime.now(tz=UTC).isoformat(),
+                        "timestamp": _NOW_ISO,
                     }
                 ],
-                "status": "active",
-                "created_at": datetime.now(tz=UTC).isoformat(),
-                "last_active_at": datetime.now(tz=UTC).isoformat(),
-                "ttl": 7776000,
             },
         ]
-
-        # Mock query_items as an async iterator
-        async def mock_query(*args, **kwargs):
-            for item in mock_items:
-                yield item
-
-        mock_container.query_items = mock_query
+        calls: list[dict] = []
+        mock_container.query_items = _async_query(mock_items, calls)
 
         service = ConversationService(
             client=mock_cosmos_client, database="test-db", container="test-container"
@@ -151,3 +246,85 @@ class TestConversationService:
 
         assert len(convs) == 1
         assert convs[0].user_id == "user-123"
+        assert convs[0].message_count == 1
+        assert convs[0].preview == "Hi"
+        assert calls[0]["partition_key"] == "user-123"
+        assert "SELECT *" not in calls[0]["query"]
+
+    @pytest.mark.asyncio
+    async def test_get_conversation_etag(
+        self, mock_cosmos_client: MagicMock, mock_container: MagicMock
+    ) -> None:
+        """The ETag lookup should be a partition-scoped projection query."""
+        calls: list[dict] = []
+        mock_container.query_items = _async_query(['"etag-1"'], calls)
+
+        service = ConversationService(
+            client=mock_cosmos_client, database="test-db", container="test-container"
+        )
+        etag = await service.get_conversation_etag(conversation_id="conv-1", user_id="user-123")
+
+        assert etag == '"etag-1"'
+        assert calls[0]["partition_key"] == "user-123"
+
+
+class TestConversationModel:
+    """Tests for Conversation/Message Cosmos DB round-tripping."""
+
+    def test_from_cosmos_dict_parses_timestamps(self) -> None:
+        conv = Conversation.from_cosmos_dict(
+            {
+                "id": "conv-1",
+                "user_id": "user-123",
+                "title": "Test",
+                "messages": [
+                    {
+                        "id": "m1",
+                        "role": "user",
+                        "content": "Hi",
+                        "timestamp": "2024-01-01T00:00:00Z",
+                    }
+                ],
+                "created_at": "2024-01-01T00:00:00+00:00",
+                "last_active_at": "2024-01-02T00:00:00+00:00",
+            }
+        )
+
+        assert conv.created_at == datetime(2024, 1, 1, tzinfo=UTC)
+        assert conv.last_active_at == datetime(2024, 1, 2, tzinfo=UTC)
+        assert conv.messages[0].timestamp == datetime(2024, 1, 1, tzinfo=UTC)
+
+    def test_message_from_dict_ignores_unknown_keys(self) -> None:
+        message = Message.from_dict(
+            {
+                "id": "m1",
+                "role": "assistant",
+                "content": "Leave is 25 days.",
+                "source_references": [
+                    {
+                        "document_title": "Leave Policy",
+                        "document_url": "https://contoso.sharepoint.com/leave.docx",
+                        "_stale": True,
+                    }
+                ],
+                "timestamp": "2024-01-01T00:00:00+00:00",
+                "_rid": "abc==",
+                "_etag": '"etag-1"',
+                "legacy_field": "x",
+            }
+        )
+
+        assert message.model_dump(exclude={"timestamp"}) == {
+            "id": "m1",
+            "role": "assistant",
+            "content": "Leave is 25 days.",
+            "source_references": [
+                {
+                    "document_title": "Leave Policy",
+                    "document_url": "https://contoso.sharepoint.com/leave.docx",
+                    "excerpt": None,
+                    "relevance_score": None,
+                }
+            ],
+        }
+        assert not hasattr(message, "_rid")
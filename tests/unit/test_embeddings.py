@@ -0,0 +1,108 @@
+"""Unit tests for the embedding service and request batcher."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.services.embeddings import EmbeddingBatcher, EmbeddingService
+
+
+class TestEmbeddingService:
+    """Tests for EmbeddingService."""
+
+    @pytest.mark.asyncio
+    async def test_embed_many_returns_vectors_in_input_order(self) -> None:
+        client = MagicMock()
+        client.embeddings.create = AsyncMock(
+            return_value=MagicMock(
+                data=[
+                    MagicMock(index=1, embedding=[0.0, 1.0]),
+                    MagicMock(index=0, embedding=[1.0, 0.0]),
+                ]
+            )
+        )
+        service = EmbeddingService(client=client, deployment="embed")
+
+        vectors = await service.embed_many(["first", "second"])
+
+        assert vectors == [[1.0, 0.0], [0.0, 1.0]]
+        client.embeddings.create.assert_awaited_once_with(input=["first", "second"], model="embed")
+
+
+class TestEmbeddingBatcher:
+    """Tests for EmbeddingBatcher."""
+
+    @staticmethod
+    def _fake_embed_many() -> AsyncMock:
+        return AsyncMock(side_effect=lambda texts: [[float(len(t))] for t in texts])
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submits_share_one_request(self) -> None:
+        embed_many = self._fake_embed_many()
+        batcher = EmbeddingBatcher(embed_many)
+        batcher.start()
+
+        vectors = await asyncio.gather(batcher.submit("a"), batcher.submit("bb"))
+        await batcher.stop()
+
+        assert vectors == [[1.0], [2.0]]
+        embed_many.assert_awaited_once_with(["a", "bb"])
+
+    @pytest.mark.asyncio
+    async def test_batches_are_capped_at_max_batch(self) -> None:
+        embed_many = self._fake_embed_many()
+        batcher = EmbeddingBatcher(embed_many, max_batch=2)
+        batcher.start()
+
+        await asyncio.gather(*(batcher.submit(t) for t in ("a", "b", "c")))
+        await batcher.stop()
+
+        assert [call.args[0] for call in embed_many.await_args_list] == [["a", "b"], ["c"]]
+
+    @pytest.mark.asyncio
+    async def test_failure_is_raised_to_every_caller(self) -> None:
+        batcher = EmbeddingBatcher(AsyncMock(side_effect=RuntimeError("boom")))
+        batcher.start()
+
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+        await batcher.stop()
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_embeds_inline_when_not_started(self) -> None:
+        embed_many = self._fake_embed_many()
+        batcher = EmbeddingBatcher(embed_many)
+
+        assert await batcher.submit("abc") == [3.0]
+        embed_many.assert_awaited_once_with(["abc"])
+
+    @pytest.mark.asyncio
+    async def test_short_response_fails_waiting_callers(self) -> None:
+        batcher = EmbeddingBatcher(AsyncMock(return_value=[[1.0]]))
+        batcher.start()
+
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True),
+            timeout=1,
+        )
+        await batcher.stop()
+
+        assert results[0] == [1.0]
+        assert isinstance(results[1], ValueError)
+
+    @pytest.mark.asyncio
+    async def test_lone_submit_skips_the_batch_window(self) -> None:
+        embed_many = self._fake_embed_many()
+        batcher = EmbeddingBatcher(embed_many, max_wait=60)
+        batcher.start()
+
+        vector = await asyncio.wait_for(batcher.submit("abc"), timeout=1)
+        await batcher.stop()
+
+        assert vector == [3.0]
@@ -3,47 +3,55 @@
 from __future__ import annotations
 
 import asyncio
-from unittest.mock import patch
 
 import pytest
 
-from src.services.rate_limiter import RateLimiter
+from src.services.rate_limiter import RateLimiter, RateLimitExceededError
+
+
+@pytest.fixture
+def user_id(request: pytest.FixtureRequest) -> str:
+    """A user ID unique to the running test.
+
+    Each test builds its own limiter, so this is belt and braces: no two
+    tests (or xdist workers) ever count requests against the same user.
+    """
+    return f"user-{request.node.name}"
 
 
 class TestRateLimiter:
     """Rate limiter unit tests."""
 
     @pytest.mark.asyncio
-    async def test_allows_requests_under_limit(self) -> None:
+    async def test_allows_requests_under_limit(self, user_id: str) -> None:
         """Requests within the limit should succeed."""
         limiter = RateLimiter(max_requests=5, window_seconds=60)
         for _ in range(5):
-            remaining = await limiter.check_rate_limit("user-1")
+            remaining = await limiter.check_rate_limit(user_id)
             assert remaining >= 0
 
     @pytest.mark.asyncio
-    async def test_blocks_requests_over_limit(self) -> None:
+    async def test_blocks_requests_over_limit(self, user_id: str) -> None:
         """21st request within the window should raise."""
         limiter = RateLimiter(max_requests=20, window_seconds=60)
         for _ in range(20):
-            await limiter.check_rate_limit("user-1")
+            await limiter.check_rate_limit(user_id)
 
-        with pytest.raises(Exception, match="rate.limit"):
-            await limiter.check_rate_limit("user-1")
+        with pytest.raises(RateLimitExceededError):
+            await limiter.check_rate_limit(user_id)
 
     @pytest.mark.asyncio
-    async def test_sliding_window_reset(self) -> None:
+    async def test_sliding_window_reset(self, user_id: str) -> None:
         """Requests outside the time window should be discarded."""
-        limiter = RateLimiter(max_requests=2, window_seconds=1)
-        await limiter.check_rate_limit("user-1")
-        await limiter.check_rate_limit("user-1")
+        now = [1000.0]
+        limiter = RateLimiter(max_requests=2, window_seconds=1, clock=lambda: now[0])
+        await limiter.check_rate_limit(user_id)
+        await limiter.check_rate_limit(user_id)
 
         # Simulate window expiry
-        import time
-
-        with patch("time.time", return_value=time.time() + 2):
-            remaining = await limiter.check_rate_limit("user-1")
-            assert remaining >= 0
+        now[0] += 2
+        remaining = await limiter.check_rate_limit(user_id)
+        assert remaining >= 0
 
     @pytest.mark.asyncio
     async def test_per_user_isolation(self) -> None:
@@ -52,7 +60,7 @@ class TestRateLimiter:
         await limiter.check_rate_limit("user-a")
 
         # user-a is exhausted
-        with pytest.raises(Exception, match="rate.limit"):
+        with pytest.raises(RateLimitExceededError):
             await limiter.check_rate_limit("user-a")
 
         # user-b is fine
@@ -60,21 +68,44 @@ class TestRateLimiter:
         assert remaining >= 0
 
     @pytest.mark.asyncio
-    async def test_concurrent_access_safety(self) -> None:
+    async def test_concurrent_access_safety(self, user_id: str) -> None:
         """Concurrent calls should not exceed the limit."""
         limiter = RateLimiter(max_requests=10, window_seconds=60)
+        results = [False] * 12
 
-        results: list[bool] = []
-
-        async def try_request() -> None:
+        async def try_request(i: int) -> None:
             try:
-                await limiter.check_rate_limit("user-concurrent")
-                results.append(True)
-            except Exception:
-                results.append(False)
+                await limiter.check_rate_limit(user_id)
+                results[i] = True
+            except RateLimitExceededError:
+                results[i] = False
 
-        # Launch 15 concurrent requests (limit is 10)
-        await asyncio.gather(*[try_request() for _ in range(15)])
+        # Launch 12 concurrent requests (limit is 10)
+        async with asyncio.TaskGroup() as tg:
+            for i in range(12):
+                tg.create_task(try_request(i))
 
         assert results.count(True) == 10
-        assert results.count(False) == 5
+        assert results.count(False) == 2
+
+    @pytest.mark.asyncio
+    async def test_idle_users_are_swept(self) -> None:
+        """Users idle for a full window should not be retained."""
+        now = [100.0]
+        limiter = RateLimiter(max_requests=5, window_seconds=10, clock=lambda: now[0])
+        await limiter.check_rate_limit("idle-user")
+        now[0] = 125.0
+        await limiter.check_rate_limit("active-user")
+
+        assert set(limiter._buckets) == {"active-user"}
+
+    @pytest.mark.asyncio
+    async def test_tracked_users_are_capped(self) -> None:
+        """The least recently seen user is evicted once max_users is exceeded."""
+        limiter = RateLimiter(max_requests=5, window_seconds=60, max_users=2)
+        await limiter.check_rate_limit("user-1")
+        await limiter.check_rate_limit("user-2")
+        await limiter.check_rate_limit("user-1")
+        await limiter.check_rate_limit("user-3")
+
+        assert list(limiter._buckets) == ["user-1", "user-3"]
@@ -2,11 +2,51 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.models.document import SearchResult
+from src.services.search import SearchService
+
+_ENDPOINT = "https://test.search.windows.net"
+
+
+class _AsyncResults:
+    """Async-iterable stand-in for the aio SearchClient's result pager."""
+
+    def __init__(self, items: list) -> None:
+        self._items = iter(items)
+
+    def __aiter__(self) -> _AsyncResults:
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+@pytest.fixture(scope="class")
+def mock_client() -> Iterator[MagicMock]:
+    """Patch SearchClient for a test class and yield the instance services will get."""
+    with patch("src.services.search.SearchClient") as mock_client_cls:
+        yield mock_client_cls.return_value
+
+
+@pytest.fixture(autouse=True)
+def _fresh_client_methods(mock_client: MagicMock) -> None:
+    """Give each test its own search/close mocks (no results by default)."""
+    mock_client.search = AsyncMock(return_value=_AsyncResults([]))
+    mock_client.close = AsyncMock()
+
+
+@pytest.fixture(scope="class")
+def service(mock_client: MagicMock) -> SearchService:
+    """One SearchService per test class over the patched client, without embeddings."""
+    return SearchService(endpoint=_ENDPOINT, index_name="test-index", credential=MagicMock())
 
 
 class TestSearchService:
@@ -39,33 +79,20 @@ class TestSearchService:
         ]
 
     @pytest.mark.asyncio
-    async def test_search_returns_search_results(self, mock_search_results: list[dict]) -> None:
+    async def test_search_returns_search_results(
+        self,
+        mock_client: MagicMock,
+        service: SearchService,
+        mock_search_results: list[dict],
+    ) -> None:
         """Verify search service maps raw results to SearchResult models."""
-        from src.services.search import SearchService
-
-        with patch("src.services.search.SearchClient") as mock_client_cls:
-            mock_client = MagicMock()
-            # Create mock result objects with attribute access
-            mock_results = []
-            for r in mock_search_results:
-                mock_result = MagicMock()
-                mock_result.__getitem__ = lambda self, key, _r=r: _r[key]
-                mock_result.get = lambda key, default=None, _r=r: _r.get(key, default)
-                mock_results.append(mock_result)
-
-            mock_client.search = MagicMock(return_value=mock_results)
-            mock_client_cls.return_value = mock_client
-
-            service = SearchService(
-                endpoint="https://test.search.windows.net",
-                index_name="test-index",
-                credential=MagicMock(),
-            )
-            results = await service.search_documents(
-                query="leave policy",
-                user_id="user-123",
-                group_ids=["group-456"],
-            )
+        mock_client.search.return_value = _AsyncResults(mock_search_results)
+
+        results = await service.search_documents(
+            query="leave policy",
+            user_id="user-123",
+            group_ids=["group-456"],
+        )
 
         assert len(results) == 2
         assert all(isinstance(r, SearchResult) for r in results)
@@ -74,52 +101,85 @@ class TestSearchService:
         assert results[1].site_name == "HR Portal"
 
     @pytest.mark.asyncio
-    async def test_search_applies_security_filter(self, mock_search_results: list[dict]) -> None:
+    async def test_search_applies_security_filter(
+        self, mock_client: MagicMock, service: SearchService
+    ) -> None:
         """Verify security trimming filter is applied with user_id and group_ids."""
-        from src.services.search import SearchService
-
-        with patch("src.services.search.SearchClient") as mock_client_cls:
-            mock_client = MagicMock()
-            mock_client.search = MagicMock(return_value=[])
-            mock_client_cls.return_value = mock_client
-
-            service = SearchService(
-                endpoint="https://test.search.windows.net",
-                index_name="test-index",
-                credential=MagicMock(),
-            )
-            await service.search_documents(
-                query="test query",
-                user_id="user-123",
-                group_ids=["group-A", "group-B"],
-            )
-
-            call_kwargs = mock_client.search.call_args
-            filter_text = call_kwargs.kwargs.get("filter", "") or call_kwargs[1].get("filter", "")
-            assert "user-123" in filter_text
-            assert "group-A" in filter_text
+        await service.search_documents(
+            query="test query",
+            user_id="user-123",
+            group_ids=["group-A", "group-B"],
+        )
+
+        call_kwargs = mock_client.search.call_args
+        filter_text = call_kwargs.kwargs.get("filter", "") or call_kwargs[1].get("filter", "")
+        assert "user-123" in filter_text
+        assert "group-A" in filter_text
 
     @pytest.mark.asyncio
-    async def test_search_uses_hybrid_query(self) -> None:
+    async def test_search_uses_hybrid_query(
+        self, mock_client: MagicMock, service: SearchService
+    ) -> None:
         """Verify that search uses both keyword and vector queries."""
-        from src.services.search import SearchService
-
-        with patch("src.services.search.SearchClient") as mock_client_cls:
-            mock_client = MagicMock()
-            mock_client.search = MagicMock(return_value=[])
-            mock_client_cls.return_value = mock_client
-
-            service = SearchService(
-                endpoint="https://test.search.windows.net",
-                index_name="test-index",
-                credential=MagicMock(),
-            )
-            await service.search_documents(
-                query="test query",
-                user_id="user-123",
-                group_ids=[],
-            )
-
-            call_kwargs = mock_client.search.call_args
-            # Verify search_text is passed (keyword search)
-            assert call_kwargs.kwargs.get("search_text") or call_kwargs[1].get("search_text")
+        await service.search_documents(
+            query="test query",
+            user_id="user-123",
+            group_ids=[],
+        )
+
+        call_kwargs = mock_client.search.call_args
+        # Verify search_text is passed (keyword search)
+        assert call_kwargs.kwargs.get("search_text") or call_kwargs[1].get("search_text")
+
+    @pytest.mark.asyncio
+    async def test_search_adds_vector_query_from_embedding(self, mock_client: MagicMock) -> None:
+        """Verify the embedding result is attached as a vector query."""
+        embedding_client = MagicMock()
+        embedding_client.embeddings.create = AsyncMock(
+            return_value=MagicMock(data=[MagicMock(embedding=[0.1, 0.2])])
+        )
+        service = SearchService(
+            endpoint=_ENDPOINT,
+            index_name="test-index",
+            credential=MagicMock(),
+            embedding_client=embedding_client,
+        )
+
+        await service.search_documents(
+            query="test query",
+            user_id="user-123",
+            group_ids=[],
+        )
+
+        vector_queries = mock_client.search.call_args.kwargs["vector_queries"]
+        assert vector_queries[0].vector == [0.1, 0.2]
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_client_once(self, mock_client: MagicMock) -> None:
+        """Verify aclose releases the underlying async search client, only once."""
+        service = SearchService(endpoint=_ENDPOINT, index_name="test-index", credential=MagicMock())
+
+        await service.aclose()
+        await service.aclose()
+
+        mock_client.close.assert_awaited_once()
+
+    def test_security_filter_uses_search_in_for_groups(self, service: SearchService) -> None:
+        """Verify group membership is a single search.in clause."""
+        assert service._build_security_filter("user-123", ["group-A", "group-B"]) == (
+            "UserIds/any(u: u eq 'user-123') or "
+            "GroupIds/any(g: search.in(g, 'group-A,group-B', ','))"
+        )
+        assert service._build_security_filter("user-123", []) is None
+
+    def test_security_filter_escapes_quotes(self, service: SearchService) -> None:
+        """Verify a quote inside an ID cannot end the OData string literal."""
+        assert service._build_security_filter("o'brien') or true or ('", ["group'A"]) == (
+            "UserIds/any(u: u eq 'o''brien'') or true or (''') or "
+            "GroupIds/any(g: search.in(g, 'group''A', ','))"
+        )
+
+    def test_security_filter_rejects_delimiter_in_group_id(self, service: SearchService) -> None:
+        """Verify a group ID cannot smuggle extra groups into search.in."""
+        with pytest.raises(ValueError):
+            service._build_security_filter("user-123", ["group-A,group-admins"])
@@ -0,0 +1,293 @@
+"""Unit tests for the SharePoint Q&A agent's caching, coalescing and grounding."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Callable, Iterator
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from autogen_core.models import CreateResult
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+from src.agents import sharepoint_qa
+from src.agents.sharepoint_qa import NO_RESULTS_MESSAGE, SharePointQAAgent
+from src.models.document import SearchResult
+from src.services.cache import (
+    AnswerCache,
+    HistoryMessageCache,
+    SearchResultCache,
+    SemanticAnswerCache,
+)
+
+_MODIFIED = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _result(
+    n: int, *, url: str | None = None, score: float = 0.5, content: str = "Body"
+) -> SearchResult:
+    return SearchResult(
+        chunk_id=f"chunk-{n}",
+        document_title=f"Doc {n}",
+        content=content,
+        source_url=url or f"https://contoso.sharepoint.com/doc-{n}.docx",
+        file_type="docx",
+        last_modified=_MODIFIED,
+        relevance_score=score,
+    )
+
+
+class _FakeSearch:
+    """SearchBackend returning fixed results and counting calls."""
+
+    def __init__(self, results: list[SearchResult]) -> None:
+        self.results = results
+        self.calls = 0
+
+    async def search_documents(
+        self, query: str, user_id: str, group_ids: list[str], top: int = 5
+    ) -> list[SearchResult]:
+        self.calls += 1
+        return list(self.results)
+
+
+class _FakeModelClient(ReplayChatCompletionClient):
+    """Replay client that counts streamed calls and can hold them at a gate."""
+
+    def __init__(self, responses: list[str], gate: asyncio.Event | None = None) -> None:
+        super().__init__(responses)
+        self.gate = gate
+        self.calls = 0
+
+    async def create_stream(
+        self, *args: Any, **kwargs: Any
+    ) -> AsyncGenerator[str | CreateResult, None]:
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        async for item in super().create_stream(*args, **kwargs):
+            yield item
+
+
+async def _until(condition: Callable[[], bool]) -> None:
+    """Yield to the event loop until ``condition`` holds."""
+    for _ in range(1000):
+        if condition():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition not reached")
+
+
+@pytest.fixture(autouse=True)
+def _no_leftover_inflight() -> Iterator[None]:
+    """Every test must leave the shared in-flight map empty."""
+    yield
+    assert not sharepoint_qa._inflight
+    sharepoint_qa._inflight.clear()
+
+
+class TestSharePointQAAgent:
+    """Tests for SharePointQAAgent.answer_question / stream_answer."""
+
+    @pytest.mark.asyncio
+    async def test_answer_cache_hit_skips_search_and_model(self) -> None:
+        search = _FakeSearch([_result(1)])
+        model = _FakeModelClient(["Leave is 25 days."])
+        agent = SharePointQAAgent(search, model, answer_cache=AnswerCache())
+
+        first = await agent.answer_question("What is the leave policy?", "user-1", [])
+        second = await agent.answer_question("what is the leave policy", "user-1", [])
+
+        assert second == first
+        assert first["content"] == "Leave is 25 days."
+        assert (search.calls, model.calls) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_semantic_cache_serves_paraphrase(self) -> None:
+        async def embed(text: str) -> list[float]:
+            return [1.0, 0.0]
+
+        model = _FakeModelClient(["Leave is 25 days."])
+        agent = SharePointQAAgent(
+            _FakeSearch([_result(1)]),
+            model,
+            semantic_cache=SemanticAnswerCache(),
+            embed=embed,
+        )
+
+        first = await agent.answer_question("What is the leave policy?", "user-1", [])
+        second = await agent.answer_question("How much annual leave do I get?", "user-1", [])
+
+        assert second["content"] == first["content"]
+        assert model.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_semantic_cache_is_scoped_to_the_whole_history(self) -> None:
+        async def embed(text: str) -> list[float]:
+            return [1.0, 0.0]
+
+        model = _FakeModelClient(["Leave is 25 days.", "Leave is 30 days."])
+        agent = SharePointQAAgent(
+            _FakeSearch([_result(1)]),
+            model,
+            semantic_cache=SemanticAnswerCache(),
+            embed=embed,
+        )
+        last_turn = {"role": "assistant", "content": "Which policy?"}
+        uk = [{"role": "user", "content": "I work in the UK office."}, last_turn]
+        us = [{"role": "user", "content": "I work in the US office."}, last_turn]
+
+        first = await agent.answer_question("The leave policy.", "user-1", [], uk)
+        second = await agent.answer_question("The leave policy.", "user-1", [], us)
+
+        assert (first["content"], second["content"]) == ("Leave is 25 days.", "Leave is 30 days.")
+        assert model.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_speculative_search_is_cancelled_with_the_request(self) -> None:
+        search_started = asyncio.Event()
+        search_cancelled = asyncio.Event()
+
+        class _SlowSearch(_FakeSearch):
+            async def search_documents(self, *args: Any, **kwargs: Any) -> list[SearchResult]:
+                search_started.set()
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    search_cancelled.set()
+                    raise
+                return []
+
+        async def embed(text: str) -> list[float]:
+            await asyncio.Event().wait()
+            return []
+
+        agent = SharePointQAAgent(
+            _SlowSearch([]),
+            _FakeModelClient([]),
+            semantic_cache=SemanticAnswerCache(),
+            embed=embed,
+        )
+
+        request = asyncio.create_task(agent.answer_question("Leave policy?", "user-1", []))
+        await search_started.wait()
+        request.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await request
+
+        await asyncio.wait_for(search_cancelled.wait(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_search_cache_reuses_results(self) -> None:
+        search = _FakeSearch([_result(1)])
+        model = _FakeModelClient(["One.", "Two."])
+        agent = SharePointQAAgent(search, model, search_cache=SearchResultCache())
+
+        await agent.answer_question("What is the leave policy?", "user-1", [])
+        await agent.answer_question("What is the leave policy?", "user-1", [])
+
+        assert (search.calls, model.calls) == (1, 2)
+
+    def test_history_cache_converts_only_new_turns(self) -> None:
+        agent = SharePointQAAgent(
+            _FakeSearch([]), _FakeModelClient([]), history_cache=HistoryMessageCache()
+        )
+        history = [
+            {"role": "user", "content": "Hi"},
+            {"role": "assistant", "content": "Hello"},
+        ]
+
+        first = agent._history_messages(history, "user-1", "conv-1")
+        history.append({"role": "user", "content": "And the leave policy?"})
+        second = agent._history_messages(history, "user-1", "conv-1")
+
+        assert [m.content for m in second] == ["Hi", "Hello", "And the leave policy?"]
+        assert second[0] is first[0] and second[1] is first[1]
+
+    @pytest.mark.asyncio
+    async def test_empty_search_results_never_reach_the_model(self) -> None:
+        model = _FakeModelClient([])
+        agent = SharePointQAAgent(_FakeSearch([]), model)
+
+        answer = await agent.answer_question("What is the leave policy?", "user-1", [])
+
+        assert answer == {
+            "content": NO_RESULTS_MESSAGE,
+            "source_references": [],
+            "was_refused": True,
+        }
+        assert model.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_citations_match_the_documents_in_context(self) -> None:
+        shared_url = "https://contoso.sharepoint.com/policy.docx"
+        results = [
+            _result(0, url=shared_url, score=0.9),
+            _result(1, url=shared_url, score=0.8),  # lower-scoring duplicate chunk
+            *(_result(n, score=0.5 - n / 100) for n in range(2, 14)),
+        ]
+        agent = SharePointQAAgent(_FakeSearch(results), _FakeModelClient(["Answer."]))
+
+        answer = await agent.answer_question("What is the leave policy?", "user-1", [])
+
+        urls = [ref.document_url for ref in answer["source_references"]]
+        assert len(urls) == sharepoint_qa.MAX_CONTEXT_DOCUMENTS
+        assert len(set(urls)) == len(urls)
+        assert urls[0] == shared_url
+        assert answer["source_references"][0].document_title == "Doc 0"
+
+    def test_context_is_split_across_the_character_budget(self) -> None:
+        agent = SharePointQAAgent(_FakeSearch([]), _FakeModelClient([]), max_context_chars=100)
+        results = [_result(1, content="a" * 1000), _result(2, content="b" * 1000)]
+
+        context, documents = agent._format_search_context(results)
+
+        assert "a" * 50 + "\n" in context and "a" * 51 not in context
+        assert "b" * 50 + "\n" in context and "b" * 51 not in context
+        assert [d.chunk_id for d in documents] == ["chunk-1", "chunk-2"]
+
+    @pytest.mark.asyncio
+    async def test_identical_inflight_question_joins_the_leader(self) -> None:
+        gate = asyncio.Event()
+        search = _FakeSearch([_result(1)])
+        model = _FakeModelClient(["Leave is 25 days."], gate=gate)
+        agent = SharePointQAAgent(search, model)
+
+        async def collect() -> list[dict[str, Any]]:
+            return [e async for e in agent.stream_answer("Leave policy?", "user-1", [])]
+
+        leader = asyncio.create_task(collect())
+        await _until(lambda: model.calls == 1)
+        follower = asyncio.create_task(collect())
+        await asyncio.sleep(0)
+        gate.set()
+        leader_events, follower_events = await asyncio.gather(leader, follower)
+
+        answer = leader_events[-1]["answer"]
+        assert follower_events == [
+            {"type": "delta", "content": "Leave is 25 days."},
+            {"type": "answer", "answer": answer},
+        ]
+        assert (search.calls, model.calls) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_follower_recomputes_when_leader_is_cancelled(self) -> None:
+        gate = asyncio.Event()
+        model = _FakeModelClient(["Leave is 25 days."], gate=gate)
+        agent = SharePointQAAgent(_FakeSearch([_result(1)]), model)
+
+        leader = asyncio.create_task(agent.answer_question("Leave policy?", "user-1", []))
+        await _until(lambda: model.calls == 1)
+        follower = asyncio.create_task(agent.answer_question("Leave policy?", "user-1", []))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        await _until(lambda: model.calls == 2)
+        gate.set()
+        answer = await follower
+
+        assert answer["content"] == "Leave is 25 days."
+        assert not follower.cancelled()
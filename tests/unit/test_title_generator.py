@@ -0,0 +1,47 @@
+"""Unit tests for conversation title generation."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.services.title_generator import generate_title
+
+
+class TestGenerateTitle:
+    """Tests for generate_title."""
+
+    @pytest.mark.asyncio
+    async def test_short_message_is_used_without_llm_call(self) -> None:
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock()
+
+        title = await generate_title(
+            user_message="summarize Q3 earnings?",
+            assistant_message="Q3 revenue grew 12%...",
+            settings=MagicMock(),
+            client=client,
+        )
+
+        assert title == "Summarize Q3 Earnings"
+        client.chat.completions.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_long_message_asks_the_model(self) -> None:
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(
+            return_value=MagicMock(
+                choices=[MagicMock(message=MagicMock(content='"Parental Leave Eligibility"'))]
+            )
+        )
+
+        title = await generate_title(
+            user_message="How many weeks of parental leave can I take if I joined last year?",
+            assistant_message="You are eligible for 16 weeks...",
+            settings=MagicMock(),
+            client=client,
+        )
+
+        assert title == "Parental Leave Eligibility"
+        client.chat.completions.create.assert_awaited_once()
@@ -0,0 +1,60 @@
+"""Unit tests for shared hot-path helpers."""
+
+from __future__ import annotations
+
+import os
+import uuid
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.utils import new_uuid, now_iso
+
+
+class TestNewUuid:
+    """Tests for new_uuid."""
+
+    def test_returns_canonical_uuid4(self) -> None:
+        value = new_uuid()
+        parsed = uuid.UUID(value)
+        assert parsed.version == 4
+        assert str(parsed) == value
+
+    def test_values_are_unique_across_pool_refills(self) -> None:
+        values = {new_uuid() for _ in range(1000)}
+        assert len(values) == 1000
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_does_not_reuse_the_parent_pool(self) -> None:
+        new_uuid()  # leave unused bytes in the pool for the child to inherit
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # child: report its next IDs and exit without running pytest teardown
+            os.close(read_fd)
+            os.write(write_fd, ",".join(new_uuid() for _ in range(4)).encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            child_ids = pipe.read().split(",")
+        os.waitpid(pid, 0)
+        parent_ids = [new_uuid() for _ in range(4)]
+
+        assert len(child_ids) == 4
+        assert not set(child_ids) & set(parent_ids)
+
+
+class TestNowIso:
+    """Tests for now_iso."""
+
+    def test_formats_whole_seconds_in_utc(self) -> None:
+        with patch("src.utils.time.time", return_value=1_700_000_000.75):
+            assert now_iso() == "2023-11-14T22:13:20+00:00"
+
+    def test_reuses_string_within_the_same_second(self) -> None:
+        with patch("src.utils.time.time", return_value=1_700_000_001.1):
+            first = now_iso()
+        with patch("src.utils.time.time", return_value=1_700_000_001.9):
+            assert now_iso() is first
+        assert datetime.fromisoformat(first).tzinfo is not None